@@ -27,7 +27,7 @@ from beeai_framework.agents.requirement.types import (
     RequirementAgentTemplates,
     RequirementAgentTemplatesKeys,
 )
-from beeai_framework.agents.requirement.utils._llm import RequirementsReasoner, _create_system_message
+from beeai_framework.agents.requirement.utils._llm import RequirementsReasoner, _SystemMessageFactory
 from beeai_framework.agents.requirement.utils._tool import FinalAnswerTool, _run_tools
 from beeai_framework.agents.tool_calling.utils import ToolCallChecker, ToolCallCheckerConfig
 from beeai_framework.backend import AnyMessage
@@ -234,6 +234,7 @@ class RequirementAgent(BaseAgent[RequirementAgentOutput]):
             context=run_context,
         )
         await reasoner.update(self._requirements)
+        system_message_factory = _SystemMessageFactory(self._templates.system)
 
         tool_call_cycle_checker = self._create_tool_call_checker()
         tool_call_retry_counter = RetryCounter(error_type=AgentError, max_retries=run_config.total_max_retries or 1)
@@ -259,10 +260,7 @@ class RequirementAgent(BaseAgent[RequirementAgentOutput]):
             stream_middleware = self._stream_final_answer(request, run_context, state)
             response = await self._llm.run(
                 [
-                    _create_system_message(
-                        template=self._templates.system,
-                        request=request,
-                    ),
+                    system_message_factory.create(request),
                     *state.memory.messages,
                 ],
                 max_retries=run_config.max_retries_per_step,
@@ -3,6 +3,7 @@
 
 from datetime import UTC, datetime
 from typing import Self
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 
@@ -11,6 +12,17 @@ from beeai_framework.template import PromptTemplate
 from beeai_framework.tools import AnyTool
 from beeai_framework.utils.strings import to_json
 
+# Serialized input schemas of the tools, the same schema class is dumped only once.
+_input_schemas: WeakKeyDictionary[type[BaseModel], str] = WeakKeyDictionary()
+
+
+def _dump_input_schema(schema: type[BaseModel]) -> str:
+    value = _input_schemas.get(schema)
+    if value is None:
+        value = to_json(schema.model_json_schema(mode="validation"), indent=2, sort_keys=False)
+        _input_schemas[schema] = value
+    return value
+
 
 class RequirementAgentToolTemplateDefinition(BaseModel):
     name: str
@@ -23,7 +35,7 @@ class RequirementAgentToolTemplateDefinition(BaseModel):
         return cls(
             name=tool.name,
             description=tool.description,
-            input_schema=to_json(tool.input_schema.model_json_schema(mode="validation"), indent=2, sort_keys=False),
+            input_schema=_dump_input_schema(tool.input_schema),
             allowed=str(allowed),
         )
 
@@ -3,11 +3,14 @@
 
 import contextlib
 from collections.abc import Sequence
-from typing import Literal
+from typing import Any, Literal
+
+from pydantic import BaseModel
 
 from beeai_framework.agents.requirement.prompts import (
     RequirementAgentSystemPromptInput,
     RequirementAgentToolTemplateDefinition,
+    _dump_input_schema,
 )
 from beeai_framework.agents.requirement.requirements.events import RequirementInitEvent, requirement_event_types
 from beeai_framework.agents.requirement.requirements.requirement import Requirement, Rule
@@ -20,7 +23,7 @@ from beeai_framework.template import PromptTemplate
 from beeai_framework.tools import AnyTool
 from beeai_framework.tools.tool import Tool
 from beeai_framework.utils.lists import _append_if_not_exists, remove_by_reference
-from beeai_framework.utils.strings import to_json, to_safe_word
+from beeai_framework.utils.strings import to_safe_word
 
 
 class RequirementsReasoner:
@@ -150,22 +153,45 @@ class RequirementsReasoner:
         )
 
 
-def _create_system_message(
-    *, template: PromptTemplate[RequirementAgentSystemPromptInput], request: RequirementAgentRequest
-) -> SystemMessage:
-    return SystemMessage(
-        template.render(
-            tools=[
+class _SystemMessageFactory:
+    """Creates the system message for every iteration.
+
+    The rendered prompt is reused until the data it is rendered from (tools, their schemas, the final answer, ...)
+    changes, which is typically only when the set of allowed or hidden tools changes.
+    """
+
+    def __init__(self, template: PromptTemplate[RequirementAgentSystemPromptInput]) -> None:
+        self._template = template
+        self._key: Any = None
+        self._text: str | None = None
+
+    def create(self, request: RequirementAgentRequest) -> SystemMessage:
+        inputs: dict[str, Any] = {
+            "tools": [
                 RequirementAgentToolTemplateDefinition.from_tool(tool, allowed=tool in request.allowed_tools)
                 for tool in request.tools
                 if tool not in request.hidden_tools
             ],
-            final_answer_name=request.final_answer.name,
-            final_answer_schema=to_json(
-                request.final_answer.input_schema.model_json_schema(mode="validation"), indent=2, sort_keys=False
-            )
+            "final_answer_name": request.final_answer.name,
+            "final_answer_schema": _dump_input_schema(request.final_answer.input_schema)
             if request.final_answer.custom_schema
             else None,
-            final_answer_instructions=request.final_answer.instructions,
-        )
-    )
+            "final_answer_instructions": request.final_answer.instructions,
+        }
+
+        key = (self._template.compiled, _freeze(self._template.resolve(**inputs)))
+        if self._text is None or key != self._key:
+            self._text = self._template.render(**inputs)
+            self._key = key
+        return SystemMessage(self._text)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return type(value), _freeze(value.__dict__)
+    elif isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    elif isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    else:
+        return value
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import functools
 import json
 from asyncio import create_task
 from typing import TYPE_CHECKING, Any
@@ -57,6 +58,15 @@ class FinalAnswerToolSchema(BaseModel):
     response: str = Field(description="The final answer to the user")
 
 
+@functools.lru_cache(maxsize=128)
+def _create_custom_final_answer_schema(description: str) -> type[FinalAnswerToolSchema]:
+    # Agents with the same expected output share the schema (and everything cached for it) across runs.
+    class CustomFinalAnswerToolSchema(FinalAnswerToolSchema):
+        response: str = Field(description=description)
+
+    return CustomFinalAnswerToolSchema
+
+
 class FinalAnswerTool(Tool[BaseModel, ToolRunOptions, StringToolOutput]):
     name = "final_answer"
     description = "Sends the final answer to the user"
@@ -67,24 +77,23 @@ class FinalAnswerTool(Tool[BaseModel, ToolRunOptions, StringToolOutput]):
         self._state = state
         self.instructions = expected_output if isinstance(expected_output, str) else None
         self.custom_schema = isinstance(expected_output, type)
+        self._input_schema = self._create_input_schema(expected_output)
 
     def _create_emitter(self) -> Emitter:
         return Emitter.root().child(namespace=["tool", "final_answer"], creator=self)
 
     @property
     def input_schema(self) -> type[BaseModel]:
-        expected_output = self._expected_output
+        return self._input_schema
 
+    @staticmethod
+    def _create_input_schema(expected_output: str | type[BaseModel] | None) -> type[BaseModel]:
         if expected_output is None:
             return FinalAnswerToolSchema
         elif isinstance(expected_output, type) and issubclass(expected_output, BaseModel):
             return expected_output
         elif isinstance(expected_output, str):
-
-            class CustomFinalAnswerToolSchema(FinalAnswerToolSchema):
-                response: str = Field(description=expected_output)  # type: ignore
-
-            return CustomFinalAnswerToolSchema
+            return _create_custom_final_answer_schema(expected_output)
         else:
             return FinalAnswerToolSchema
 
@@ -6,6 +6,7 @@ from beeai_framework.backend.chat import ChatModel
 from beeai_framework.backend.embedding import EmbeddingModel
 from beeai_framework.backend.errors import BackendError, ChatModelError, EmbeddingModelError, MessageError
 from beeai_framework.backend.events import (
+    ChatModelCacheEvent,
     ChatModelErrorEvent,
     ChatModelNewTokenEvent,
     ChatModelStartEvent,
@@ -34,6 +35,7 @@ from beeai_framework.backend.message import (
 )
 from beeai_framework.backend.types import (
     ChatModelOutput,
+    ChatModelOutputAccumulator,
     ChatModelParameters,
     EmbeddingModelOutput,
 )
@@ -45,10 +47,12 @@ __all__ = [
     "Backend",
     "BackendError",
     "ChatModel",
+    "ChatModelCacheEvent",
     "ChatModelError",
     "ChatModelErrorEvent",
     "ChatModelNewTokenEvent",
     "ChatModelOutput",
+    "ChatModelOutputAccumulator",
     "ChatModelParameters",
     "ChatModelStartEvent",
     "ChatModelSuccessEvent",
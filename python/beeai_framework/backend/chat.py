@@ -1,6 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 from abc import abstractmethod
 from collections.abc import AsyncGenerator, Callable
 from functools import cached_property
@@ -12,6 +13,7 @@ from typing_extensions import TypedDict, TypeVar, Unpack, override
 from beeai_framework.backend.constants import ProviderName
 from beeai_framework.backend.errors import ChatModelError
 from beeai_framework.backend.events import (
+    ChatModelCacheEvent,
     ChatModelErrorEvent,
     ChatModelNewTokenEvent,
     ChatModelStartEvent,
@@ -160,6 +162,14 @@ class ChatModelOptions(RunnableOptions, total=False):
 _ChatModelKwargsAdapter = TypeAdapter(ChatModelKwargs)
 
 
+class _StreamAbortedError(asyncio.CancelledError):
+    """Cancels a shared streaming call whose consumer has aborted it (see BaseCache.single_flight)."""
+
+    def __init__(self, chunks: list[ChatModelOutput]) -> None:
+        super().__init__()
+        self.chunks = chunks
+
+
 class ChatModel(Runnable[ChatModelOutput]):
     tool_choice_support: ClassVar[set[ToolChoiceType]] = {"required", "none", "single", "auto"}
     tool_call_fallback_via_response_format: bool
@@ -234,7 +244,7 @@ class ChatModel(Runnable[ChatModelOutput]):
         raise NotImplementedError
 
     @override
-    @runnable_entry
+    @runnable_entry(lightweight=True)
     async def run(self, input: list[AnyMessage], /, **kwargs: Unpack[ChatModelOptions]) -> ChatModelOutput:
         """Execute the chat model.
 
@@ -300,40 +310,83 @@ class ChatModel(Runnable[ChatModelOutput]):
         )
 
         context = RunContext.get()
-        cache_key = self.cache.generate_key(model_input, {"messages": [m.to_plain() for m in model_input.messages]})
-        cache_hit = await self.cache.get(cache_key)
+        cache_key = (
+            self.cache.generate_key(
+                model_input.model_dump(exclude_none=True, exclude={"messages"}),
+                {"messages": [m.to_plain() for m in model_input.messages]},
+            )
+            if self.cache.enabled
+            else ""
+        )
+        cache_hit = False
+
+        async def emit_cache_event(hit: bool) -> None:
+            if self.cache.enabled:
+                await context.emitter.emit("cache", ChatModelCacheEvent(hit=hit, key=cache_key, stats=self.cache.stats))
 
         async def run() -> ChatModelOutput:
+            # Concurrent identical requests share one call (see BaseCache.single_flight), the rest replay its output.
+            nonlocal cache_hit
+            produced = False
+
             if model_input.stream:
-                chunks: list[ChatModelOutput] = []
                 abort_controller = AbortController()
-                generator = to_async_generator(cache_hit) if cache_hit else self._create_stream(model_input, context)
-                async for value in generator:
-                    chunks.append(value)
-                    await context.emitter.emit(
-                        "new_token", ChatModelNewTokenEvent(value=value, abort=lambda: abort_controller.abort())
-                    )
+
+                async def consume(generator: AsyncGenerator[ChatModelOutput]) -> list[ChatModelOutput]:
+                    chunks: list[ChatModelOutput] = []
+                    async for value in generator:
+                        chunks.append(value)
+                        await context.emitter.emit(
+                            "new_token", ChatModelNewTokenEvent(value=value, abort=lambda: abort_controller.abort())
+                        )
+                        if abort_controller.signal.aborted:
+                            break
+                    return chunks
+
+                async def produce_stream() -> list[ChatModelOutput]:
+                    nonlocal produced
+                    produced = True
+                    await emit_cache_event(hit=False)
+                    chunks = await consume(self._create_stream(model_input, context))
                     if abort_controller.signal.aborted:
-                        break
+                        # The partial output must be neither cached nor shared, the waiting callers retry on their own.
+                        raise _StreamAbortedError(chunks)
+                    return chunks
+
+                try:
+                    chunks = await self.cache.single_flight(cache_key, produce_stream)
+                except _StreamAbortedError as e:
+                    return ChatModelOutput.from_chunks(e.chunks)
 
-                await self.cache.set(cache_key, chunks)
+                cache_hit = not produced
+                if cache_hit:
+                    await emit_cache_event(hit=True)
+                    chunks = await consume(to_async_generator(chunks))
                 return ChatModelOutput.from_chunks(chunks)
             else:
+
+                async def produce() -> list[ChatModelOutput]:
+                    nonlocal produced
+                    produced = True
+                    await emit_cache_event(hit=False)
+                    max_retries = model_input.max_retries if model_input and model_input.max_retries is not None else 0
+                    result = await Retryable(
+                        RetryableInput(
+                            executor=lambda _: self._create(model_input, context),
+                            config=RetryableConfig(
+                                max_retries=max_retries,
+                                signal=context.signal,
+                            ),
+                        )
+                    ).get()
+                    return [result]
+
+                results = await self.cache.single_flight(cache_key, produce)
+                cache_hit = not produced
                 if cache_hit:
-                    return cache_hit[0].model_copy()
-
-                max_retries = model_input.max_retries if model_input and model_input.max_retries is not None else 0
-                result = await Retryable(
-                    RetryableInput(
-                        executor=lambda _: self._create(model_input, context),
-                        config=RetryableConfig(
-                            max_retries=max_retries,
-                            signal=context.signal,
-                        ),
-                    )
-                ).get()
-                await self.cache.set(cache_key, [result])
-                return result
+                    await emit_cache_event(hit=True)
+                    return results[0].model_copy()
+                return results[0]
 
         try:
             await context.emitter.emit("start", ChatModelStartEvent(input=model_input))
@@ -342,7 +395,7 @@ class ChatModel(Runnable[ChatModelOutput]):
             if self.retry_on_empty_response and result.is_empty():
                 old_messages = model_input.messages
                 model_input.messages = [*old_messages, AssistantMessage(content="")]
-                cache_hit = None
+                await self.cache.delete(cache_key)
                 result = await run()
                 model_input.messages = old_messages
 
@@ -97,9 +97,9 @@ class EmbeddingModel(ABC):
             finally:
                 await context.emitter.emit("finish", None)
 
-        return RunContext.enter(self, handler, signal=signal, run_params=model_input.model_dump()).middleware(
-            *self.middlewares
-        )
+        return RunContext.enter(
+            self, handler, signal=signal, run_params=model_input.model_dump(), lightweight=True
+        ).middleware(*self.middlewares)
 
     @staticmethod
     def from_name(name: str | ProviderName, **kwargs: Any) -> "EmbeddingModel":
@@ -7,6 +7,7 @@ from types import NoneType
 from pydantic import BaseModel, InstanceOf
 
 from beeai_framework.backend.types import ChatModelInput, ChatModelOutput, EmbeddingModelInput, EmbeddingModelOutput
+from beeai_framework.cache.types import CacheStats
 from beeai_framework.errors import FrameworkError
 
 
@@ -28,11 +29,18 @@ class ChatModelErrorEvent(BaseModel):
     error: InstanceOf[FrameworkError]
 
 
+class ChatModelCacheEvent(BaseModel):
+    hit: bool
+    key: str
+    stats: CacheStats
+
+
 chat_model_event_types: dict[str, type] = {
     "new_token": ChatModelNewTokenEvent,
     "success": ChatModelSuccessEvent,
     "start": ChatModelStartEvent,
     "error": ChatModelErrorEvent,
+    "cache": ChatModelCacheEvent,
     "finish": NoneType,
 }
 
@@ -9,6 +9,7 @@ from beeai_framework.backend.message import (
     AnyMessage,
     AssistantMessage,
     AssistantMessageContent,
+    MessageMeta,
     MessageToolCallContent,
     dedupe_tool_calls,
 )
@@ -162,10 +163,15 @@ class ChatModelOutput(RunnableOutput):
 
     @classmethod
     def from_chunks(cls, chunks: list[Self]) -> Self:
-        final = cls(output=[])
+        accumulator = cls.accumulator()
         for cur in chunks:
-            final.merge(cur)
-        return final
+            accumulator.add(cur)
+        return accumulator.build()
+
+    @classmethod
+    def accumulator(cls) -> "ChatModelOutputAccumulator[Self]":
+        """Creates an accumulator which merges streamed chunks in linear time (see `ChatModelOutputAccumulator`)."""
+        return ChatModelOutputAccumulator(cls(output=[]))
 
     def merge(self, other: Self) -> None:
         if other.output:
@@ -173,6 +179,9 @@ class ChatModelOutput(RunnableOutput):
             self.output.extend(cloned_output)
             self.dedupe()
 
+        self._merge_metadata(other)
+
+    def _merge_metadata(self, other: "ChatModelOutput") -> None:
         if other.output_structured is not None:
             self.output_structured = other.output_structured
 
@@ -212,6 +221,83 @@ class ChatModelOutput(RunnableOutput):
         return "".join([x.text for x in list(filter(lambda x: isinstance(x, AssistantMessage), self.output))])
 
 
+TChatModelOutput = TypeVar("TChatModelOutput", bound=ChatModelOutput)
+
+
+class _ToolCallBuffer:
+    __slots__ = ("args", "id", "tool_name")
+
+    def __init__(self, tool_call: MessageToolCallContent, id: str) -> None:
+        self.id = id
+        self.tool_name = tool_call.tool_name
+        self.args = [tool_call.args]
+
+    def build(self) -> MessageToolCallContent:
+        return MessageToolCallContent(id=self.id, tool_name=self.tool_name, args="".join(self.args))
+
+
+class ChatModelOutputAccumulator(Generic[TChatModelOutput]):
+    """Merges streamed chunks into a single output.
+
+    The result is the same as folding the chunks via `ChatModelOutput.merge`, but each chunk is processed
+    only once. Content parts are collected as they arrive, and the argument deltas of partial tool calls are
+    buffered per tool call id. The final output is materialized once, when `build` is called.
+    """
+
+    def __init__(self, output: TChatModelOutput) -> None:
+        """
+        Args:
+            output: An empty output instance which receives the merged result.
+        """
+        self._output = output
+        self._message_type: type[AnyMessage] | None = None
+        self._meta: MessageMeta = {}
+        self._parts: list[Any] = []
+        self._tool_calls: dict[str, _ToolCallBuffer] = {}
+        self._last_tool_call_id = ""
+
+    def add(self, chunk: ChatModelOutput) -> None:
+        for message in chunk.output:
+            parts: list[Any] = []
+            has_tool_calls = False
+            for part in message.content:
+                if not isinstance(part, MessageToolCallContent):
+                    parts.append(part.model_copy())
+                    continue
+
+                # Tool call deltas without an id belong to the most recent tool call
+                has_tool_calls = True
+                tool_call_id = part.id or self._last_tool_call_id
+                self._last_tool_call_id = tool_call_id
+                buffer = self._tool_calls.get(tool_call_id)
+                if buffer is None:
+                    buffer = self._tool_calls[tool_call_id] = _ToolCallBuffer(part, tool_call_id)
+                    parts.append(buffer)
+                else:
+                    buffer.args.append(part.args)
+                    if not buffer.tool_name:
+                        buffer.tool_name = part.tool_name
+
+            if has_tool_calls and not parts:
+                # nothing to be processed
+                continue
+
+            if self._message_type is None:
+                self._message_type = type(message)
+            self._meta.update(message.meta)
+            self._parts.extend(parts)
+
+        self._output._merge_metadata(chunk)
+
+    def build(self) -> TChatModelOutput:
+        self._output.output.clear()
+        if self._message_type is not None:
+            message = self._message_type([], self._meta.copy())
+            message.content.extend(part.build() if isinstance(part, _ToolCallBuffer) else part for part in self._parts)
+            self._output.output.append(message)
+        return self._output
+
+
 ChatModelCache = BaseCache[list[ChatModelOutput]]
 
 
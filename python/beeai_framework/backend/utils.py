@@ -1,5 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
+import copy
+import functools
 from importlib import import_module
 from typing import Any, Literal, TypeVar, Union
 
@@ -130,17 +132,35 @@ def generate_tool_union_schema(
     if not tools:
         raise ValueError("No tools provided!")
 
+    # The tool's input schema is a part of the key, so changing it (a new schema class) invalidates the entry.
+    response_format, schema = _create_tool_union_schema(
+        tuple((tool.name, tool.input_schema) for tool in tools),
+        strict=strict,
+        allow_parallel_tool_calls=allow_parallel_tool_calls,
+        allow_top_level_union=allow_top_level_union,
+    )
+    return copy.deepcopy(response_format), schema
+
+
+@functools.lru_cache(maxsize=128)
+def _create_tool_union_schema(
+    tools: tuple[tuple[str, type[BaseModel]], ...],
+    *,
+    strict: bool,
+    allow_parallel_tool_calls: bool,
+    allow_top_level_union: bool,
+) -> tuple[dict[str, Any], type[BaseModel]]:
     tool_schemas = [
         create_model(  # type: ignore
-            tool.name,
+            name,
             __module__="fn",
-            __config__=ConfigDict(extra="forbid", populate_by_name=True, title=tool.name),
+            __config__=ConfigDict(extra="forbid", populate_by_name=True, title=name),
             **{
-                "name": (Literal[tool.name], Field(description="Tool Name")),
-                "parameters": (tool.input_schema, Field(description="Tool Parameters")),
+                "name": (Literal[name], Field(description="Tool Name")),
+                "parameters": (input_schema, Field(description="Tool Parameters")),
             },
         )
-        for tool in tools
+        for name, input_schema in tools
     ]
 
     if len(tool_schemas) == 1:
@@ -3,13 +3,17 @@
 
 from beeai_framework.cache.base import BaseCache
 from beeai_framework.cache.decorator_cache import CacheFn, cached
+from beeai_framework.cache.file_cache import FileCache
 from beeai_framework.cache.null_cache import NullCache
 from beeai_framework.cache.sliding_cache import SlidingCache
+from beeai_framework.cache.types import CacheStats
 from beeai_framework.cache.unconstrained_cache import UnconstrainedCache
 
 __all__ = [
     "BaseCache",
     "CacheFn",
+    "CacheStats",
+    "FileCache",
     "NullCache",
     "SlidingCache",
     "UnconstrainedCache",
@@ -1,13 +1,17 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from collections import OrderedDict
-from hashlib import sha512
+from collections.abc import Awaitable, Callable
 from typing import Any, Generic, Self, TypeVar
 
 from pydantic import BaseModel
 
+from beeai_framework.cache.types import CacheStats
+from beeai_framework.cache.utils import hash_key
+
 T = TypeVar("T")
 
 
@@ -17,11 +21,52 @@ class BaseCache(ABC, Generic[T]):
     def __init__(self) -> None:
         super().__init__()
         self._enabled: bool = True
+        self._flights: dict[str, asyncio.Future[T]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._lookup_time = 0.0
 
     @property
     def enabled(self) -> bool:
         return self._enabled
 
+    @property
+    def stats(self) -> CacheStats:
+        """Returns the statistics collected since the cache was created (or since the last `reset_stats` call)."""
+        lookups = self._hits + self._misses
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._coalesced,
+            evictions=self._evictions,
+            bytes=self._bytes(),
+            average_lookup_latency=self._lookup_time / lookups if lookups else 0,
+        )
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._lookup_time = 0.0
+
+    def _record_lookup(self, hit: bool, started_at: float) -> None:
+        """Records a lookup that started at the given `time.perf_counter()` value."""
+        self._lookup_time += time.perf_counter() - started_at
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+    def _record_evictions(self, count: int) -> None:
+        self._evictions += max(count, 0)
+
+    def _bytes(self) -> int | None:
+        """Returns the total size of the stored values if the implementation tracks it."""
+        return None
+
     @abstractmethod
     async def size(self) -> int:
         pass
@@ -46,17 +91,56 @@ class BaseCache(ABC, Generic[T]):
     async def clear(self) -> None:
         pass
 
+    async def single_flight(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Returns the cached value for the given key or computes it via `fn` and stores it.
+
+        Concurrent calls with the same key share a single computation. The first caller runs `fn`
+        and the others wait for its result. If the computation fails, the error is propagated to every waiting caller.
+        If it gets cancelled (or aborted), the waiting callers try again. `None` is treated as a missing value.
+        """
+        if not self.enabled:
+            return await fn()
+
+        while (flight := self._flights.get(key)) is not None:
+            try:
+                shared = await asyncio.shield(flight)
+                self._coalesced += 1
+                return shared
+            except BaseException:
+                if not flight.done() or not flight.cancelled():
+                    raise
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        try:
+            value = await self.get(key)
+            if value is None:
+                value = await fn()
+                await self.set(key, value)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # marks the exception as retrieved when nobody waits for it
+            raise
+        else:
+            flight.set_result(value)
+            return value
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
     @staticmethod
     def generate_key(*args: dict[str, Any] | BaseModel) -> str:
+        """Generates a stable key from the given arguments (later arguments override keys of the former ones)."""
         cache_key_dict: dict[str, Any] = {}
         for arg in args:
             arg = arg or {}
             arg_dict = arg if isinstance(arg, dict) else arg.model_dump(exclude_none=True)
             cache_key_dict |= arg_dict
 
-        cache_key_dict = OrderedDict(sorted(cache_key_dict.items()))
-        cache_key_str = str(cache_key_dict).encode("utf-8", errors="ignore")
-        return str(int.from_bytes(sha512(cache_key_str).digest()))
+        return hash_key(cache_key_dict)
 
     async def clone(self) -> Self:
         cloned = type(self)()
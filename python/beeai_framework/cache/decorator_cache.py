@@ -1,11 +1,14 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import time
 from collections.abc import Awaitable, Callable
 from typing import Any, Generic, ParamSpec, TypeVar
 
 from beeai_framework.cache.base import BaseCache
+from beeai_framework.cache.types import CacheStats
+from beeai_framework.cache.unconstrained_cache import UnconstrainedCache
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -19,7 +22,10 @@ def cached(
     enabled: bool = True,
     key_fn: CacheKeyFn | None = None,
 ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
-    """Async caching decorator built on top of BeeAI cache providers."""
+    """Async caching decorator built on top of BeeAI cache providers.
+
+    The number of stored results is bounded only by the given cache, use `SlidingCache` for long-running processes.
+    """
 
     def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
@@ -29,13 +35,10 @@ def cached(
             key_builder = key_fn or (lambda a, kw: BaseCache.generate_key({"args": a, "kwargs": kw}))
             cache_key = key_builder(args, kwargs)
 
-            cached_value = await cache.get(cache_key)
-            if cached_value is not None or await cache.has(cache_key):
-                return cached_value  # type: ignore[return-value]
+            if await cache.has(cache_key):
+                return await cache.get(cache_key)  # type: ignore[return-value]
 
-            result = await fn(*args, **kwargs)
-            await cache.set(cache_key, result)
-            return result
+            return await cache.single_flight(cache_key, lambda: fn(*args, **kwargs))
 
         return wrapper
 
@@ -43,7 +46,11 @@ def cached(
 
 
 class CacheFn(Generic[P, R]):
-    """Callable wrapper that memoizes async functions with adjustable TTL."""
+    """Callable wrapper that memoizes async functions with adjustable TTL.
+
+    Results are kept in the given cache (an `UnconstrainedCache` by default). Use a bounded cache
+    such as `SlidingCache` to limit the number of stored results in long-running processes.
+    """
 
     def __init__(
         self,
@@ -51,12 +58,14 @@ class CacheFn(Generic[P, R]):
         *,
         default_ttl: float | None = None,
         key_fn: CacheKeyFn | None = None,
+        cache: BaseCache[tuple[R, float | None]] | None = None,
     ) -> None:
         self._fn = fn
-        self._entries: dict[str, tuple[R, float | None]] = {}
+        self._cache: BaseCache[tuple[R, float | None]] = cache if cache is not None else UnconstrainedCache()
         self._default_ttl = default_ttl
         self._pending_ttl: float | None = None
         self._key_fn = key_fn
+        self._clearing: asyncio.Task[None] | None = None
 
     @classmethod
     def create(
@@ -65,35 +74,67 @@ class CacheFn(Generic[P, R]):
         *,
         default_ttl: float | None = None,
         key_fn: CacheKeyFn | None = None,
+        cache: BaseCache[tuple[R, float | None]] | None = None,
     ) -> "CacheFn[P, R]":
-        return cls(fn, default_ttl=default_ttl, key_fn=key_fn)
+        return cls(fn, default_ttl=default_ttl, key_fn=key_fn, cache=cache)
 
     @property
     def default_ttl(self) -> float | None:
         return self._default_ttl
 
+    @property
+    def cache(self) -> BaseCache[tuple[R, float | None]]:
+        """The underlying storage. Values are stored together with their expiration time."""
+        return self._cache
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    async def size(self) -> int:
+        await self._wait_for_clear()
+        return await self._cache.size()
+
     def update_ttl(self, ttl: float | None) -> None:
         """Adjust TTL for the next cached value."""
         self._pending_ttl = ttl
 
     def clear(self) -> None:
-        """Clear all cached entries."""
-        self._entries.clear()
+        """Clear all cached entries.
+
+        Within a running event loop, the underlying cache is cleared in the background (use `aclear` to wait for it),
+        but the cleared entries are never returned again.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._cache.clear())
+        else:
+            self._clearing = loop.create_task(self._cache.clear())
+
+    async def aclear(self) -> None:
+        """Clear all cached entries and wait until the underlying cache is cleared."""
+        await self._wait_for_clear()
+        await self._cache.clear()
+
+    async def _wait_for_clear(self) -> None:
+        if self._clearing is not None:
+            await asyncio.shield(self._clearing)
+            self._clearing = None
 
     async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        await self._wait_for_clear()
         key_builder = self._key_fn or (lambda a, kw: BaseCache.generate_key({"args": a, "kwargs": kw}))
         cache_key = key_builder(args, kwargs)
 
-        entry = self._entries.get(cache_key)
-        now = time.time()
-        if entry:
-            value, expires_at = entry
-            if expires_at is None or expires_at > now:
-                return value
-
-        result = await self._fn(*args, **kwargs)
-        ttl = self._pending_ttl if self._pending_ttl is not None else self._default_ttl
-        self._pending_ttl = None
-        expires_at = now + ttl if ttl is not None else None
-        self._entries[cache_key] = (result, expires_at)
-        return result
+        async def compute() -> tuple[R, float | None]:
+            result = await self._fn(*args, **kwargs)
+            ttl = self._pending_ttl if self._pending_ttl is not None else self._default_ttl
+            self._pending_ttl = None
+            return result, time.time() + ttl if ttl is not None else None
+
+        value, expires_at = await self._cache.single_flight(cache_key, compute)
+        if expires_at is not None and expires_at <= time.time():
+            await self._cache.delete(cache_key)
+            value, _ = await self._cache.single_flight(cache_key, compute)
+        return value
@@ -0,0 +1,277 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import contextlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, Self, TypeVar
+
+from beeai_framework.cache.base import BaseCache
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (namespace, accessed_at);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (namespace, expires_at);
+"""
+
+
+class FileCache(BaseCache[T]):
+    """Persistent cache backed by a local SQLite database (in WAL mode).
+
+    Entries survive process restarts and can be shared by multiple processes that point to the same file.
+    All I/O runs in a worker thread, so the event loop is never blocked.
+
+    Values are serialized with `pickle` by default. Only load cache files that you trust.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        size: int | None = None,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        namespace: str = "default",
+        serialize: Callable[[T], bytes] = pickle.dumps,
+        deserialize: Callable[[bytes], T] = pickle.loads,
+        timeout: float = 30,
+    ) -> None:
+        """
+        Args:
+            path: The path to the database file. Missing parent directories are created.
+            size: The maximum number of entries. The least recently used entries are evicted first.
+            max_bytes: The maximum total size of the serialized values.
+            ttl: The number of seconds after which an entry expires.
+            namespace: Separates independent caches stored in the same file.
+            serialize: Converts a value to bytes.
+            deserialize: Converts bytes back to a value.
+            timeout: How long (in seconds) to wait for a lock held by another connection or process.
+        """
+        super().__init__()
+        if size is not None and size <= 0:
+            raise ValueError("The 'size' parameter must be a positive integer.")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("The 'max_bytes' parameter must be a positive integer.")
+
+        self._path = Path(path)
+        self._size = size
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._namespace = namespace
+        self._serialize = serialize
+        self._deserialize = deserialize
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._total_bytes: int | None = None
+
+    @property
+    def source(self) -> Path:
+        return self._path
+
+    async def size(self) -> int:
+        return await asyncio.to_thread(self._execute, self._size_sync)
+
+    async def set(self, key: str, value: T) -> None:
+        await asyncio.to_thread(self._execute, self._set_sync, key, value)
+
+    async def get(self, key: str) -> T | None:
+        started_at = time.perf_counter()
+        data: bytes | None = await asyncio.to_thread(self._execute, self._get_sync, key)
+        value = await asyncio.to_thread(self._deserialize, data) if data is not None else None
+        self._record_lookup(data is not None, started_at)
+        return value
+
+    async def has(self, key: str) -> bool:
+        return await asyncio.to_thread(self._execute, self._has_sync, key)
+
+    async def delete(self, key: str) -> bool:
+        return await asyncio.to_thread(self._execute, self._delete_sync, key)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._execute, self._clear_sync)
+
+    async def close(self) -> None:
+        """Closes the underlying database connection. It is reopened on the next operation."""
+        await asyncio.to_thread(self._close_sync)
+
+    async def clone(self) -> Self:
+        """Creates a new instance which shares the same persistent storage."""
+        return type(self)(
+            self._path,
+            size=self._size,
+            max_bytes=self._max_bytes,
+            ttl=self._ttl,
+            namespace=self._namespace,
+            serialize=self._serialize,
+            deserialize=self._deserialize,
+            timeout=self._timeout,
+        )
+
+    def _execute(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._connect()
+                self._total_bytes = self._bytes_sync(self._connection)
+            return fn(self._connection, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _close_sync(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _bytes(self) -> int | None:
+        return self._total_bytes
+
+    def _bytes_sync(self, db: sqlite3.Connection) -> int:
+        row = db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries WHERE namespace = ?", (self._namespace,)
+        ).fetchone()
+        return int(row[0])
+
+    def _size_sync(self, db: sqlite3.Connection) -> int:
+        row = db.execute(
+            "SELECT COUNT(*) FROM entries WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (self._namespace, time.time()),
+        ).fetchone()
+        return int(row[0])
+
+    def _get_sync(self, db: sqlite3.Connection, key: str) -> bytes | None:
+        now = time.time()
+        row = db.execute(
+            "SELECT value FROM entries WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (self._namespace, key, now),
+        ).fetchone()
+        if row is None:
+            return None
+
+        db.execute("UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?", (now, self._namespace, key))
+        return bytes(row[0])
+
+    def _has_sync(self, db: sqlite3.Connection, key: str) -> bool:
+        row = db.execute(
+            "SELECT 1 FROM entries WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (self._namespace, key, time.time()),
+        ).fetchone()
+        return row is not None
+
+    def _entry_size_sync(self, db: sqlite3.Connection, key: str) -> int:
+        row = db.execute("SELECT size FROM entries WHERE namespace = ? AND key = ?", (self._namespace, key)).fetchone()
+        return 0 if row is None else int(row[0])
+
+    def _set_sync(self, db: sqlite3.Connection, key: str, value: T) -> None:
+        data = self._serialize(value)
+        now = time.time()
+        with _transaction(db):
+            replaced_bytes = self._entry_size_sync(db, key)
+            db.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, size, accessed_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (self._namespace, key, data, len(data), now, now + self._ttl if self._ttl is not None else None),
+            )
+            total_bytes = self._evict(db, now)
+            if total_bytes is not None:
+                self._total_bytes = total_bytes
+            elif self._total_bytes is not None:
+                self._total_bytes += len(data) - replaced_bytes
+
+    def _delete_sync(self, db: sqlite3.Connection, key: str) -> bool:
+        with _transaction(db):
+            deleted_bytes = self._entry_size_sync(db, key)
+            cursor = db.execute(
+                "DELETE FROM entries WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (self._namespace, key, time.time()),
+            )
+        if cursor.rowcount > 0 and self._total_bytes is not None:
+            self._total_bytes -= deleted_bytes
+        return cursor.rowcount > 0
+
+    def _clear_sync(self, db: sqlite3.Connection) -> None:
+        db.execute("DELETE FROM entries WHERE namespace = ?", (self._namespace,))
+        self._total_bytes = 0
+
+    def _evict(self, db: sqlite3.Connection, now: float) -> int | None:
+        """Removes the expired and the least recently used entries.
+
+        Returns the total size of the remaining values when it had to be computed (when limits are set).
+        """
+        expired, expired_bytes = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE namespace = ? AND expires_at <= ?",
+            (self._namespace, now),
+        ).fetchone()
+        if expired:
+            db.execute("DELETE FROM entries WHERE namespace = ? AND expires_at <= ?", (self._namespace, now))
+            self._record_evictions(expired)
+            if self._total_bytes is not None:
+                self._total_bytes -= expired_bytes
+        if self._size is None and self._max_bytes is None:
+            return None
+
+        count, total_bytes = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE namespace = ?", (self._namespace,)
+        ).fetchone()
+
+        if self._size is not None and count > self._size:
+            lru_keys = "SELECT key, size FROM entries WHERE namespace = ? ORDER BY accessed_at ASC LIMIT ?"
+            args = (self._namespace, count - self._size)
+            (evicted_bytes,) = db.execute(f"SELECT COALESCE(SUM(size), 0) FROM ({lru_keys})", args).fetchone()
+            cursor = db.execute(
+                f"DELETE FROM entries WHERE namespace = ? AND key IN (SELECT key FROM ({lru_keys}))",
+                (self._namespace, *args),
+            )
+            self._record_evictions(cursor.rowcount)
+            total_bytes -= evicted_bytes
+
+        if self._max_bytes is not None and total_bytes > self._max_bytes:
+            # Drop the least recently used entries until the remaining ones fit into the budget.
+            over_budget = (
+                "SELECT key, size FROM (SELECT key, size, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS total "
+                "FROM entries WHERE namespace = ?) WHERE total > ?"
+            )
+            args = (self._namespace, self._max_bytes)
+            (evicted_bytes,) = db.execute(f"SELECT COALESCE(SUM(size), 0) FROM ({over_budget})", args).fetchone()
+            cursor = db.execute(
+                f"DELETE FROM entries WHERE namespace = ? AND key IN (SELECT key FROM ({over_budget}))",
+                (self._namespace, *args),
+            )
+            self._record_evictions(cursor.rowcount)
+            total_bytes -= evicted_bytes
+
+        return int(total_bytes)
+
+
+@contextlib.contextmanager
+def _transaction(db: sqlite3.Connection) -> Iterator[None]:
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    else:
+        db.execute("COMMIT")
@@ -1,6 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import time
 from typing import TypeVar
 
 from beeai_framework.cache.base import BaseCache
@@ -20,6 +21,7 @@ class NullCache(BaseCache[T]):
         pass
 
     async def get(self, key: str) -> T | None:
+        self._record_lookup(False, time.perf_counter())
         return None
 
     async def has(self, key: str) -> bool:
@@ -1,6 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import time
 from copy import copy
 from typing import Self, TypeVar
 
@@ -20,10 +21,15 @@ class SlidingCache(BaseCache[T]):
         self._items: Cache[str, T] = TTLCache(maxsize=size, ttl=ttl) if ttl else LRUCache(maxsize=size)
 
     async def set(self, key: str, value: T) -> None:
+        expected_size = len(self._items) + (key not in self._items)
         self._items[key] = value
+        self._record_evictions(expected_size - len(self._items))
 
     async def get(self, key: str) -> T | None:
-        return self._items.get(key, default=None)
+        started_at = time.perf_counter()
+        value: T | None = self._items.get(key, default=None)
+        self._record_lookup(value is not None, started_at)
+        return value
 
     async def has(self, key: str) -> bool:
         return key in self._items
@@ -0,0 +1,31 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from pydantic import BaseModel
+
+__all__ = ["CacheStats"]
+
+
+class CacheStats(BaseModel):
+    """Snapshot of the cache statistics."""
+
+    hits: int = 0
+    """The number of lookups that found a value."""
+    misses: int = 0
+    """The number of lookups that did not find a value."""
+    coalesced: int = 0
+    """The number of calls that received the result of an identical in-flight computation."""
+    evictions: int = 0
+    """The number of entries removed because of the size limit or expiration."""
+    bytes: int | None = None
+    """The total size of the stored values (None if the implementation does not track it)."""
+    average_lookup_latency: float = 0
+    """The average duration of a lookup (in seconds)."""
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0
@@ -1,6 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import time
 from typing import Self, TypeVar
 
 from beeai_framework.cache.base import BaseCache
@@ -22,7 +23,10 @@ class UnconstrainedCache(BaseCache[T]):
         self._provider[key] = value
 
     async def get(self, key: str) -> T | None:
-        return self._provider.get(key)
+        started_at = time.perf_counter()
+        value = self._provider.get(key)
+        self._record_lookup(value is not None, started_at)
+        return value
 
     async def has(self, key: str) -> bool:
         return key in self._provider
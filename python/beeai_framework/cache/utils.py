@@ -0,0 +1,63 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import dataclasses
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from hashlib import blake2b
+from operator import itemgetter
+from typing import Any
+
+from pydantic import BaseModel
+
+__all__ = ["canonical_json", "hash_key"]
+
+
+def _to_canonical(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(exclude_none=True)
+    elif isinstance(value, set | frozenset):
+        return sorted(value, key=canonical_json)
+    elif isinstance(value, Enum):
+        return value.value
+    elif isinstance(value, datetime | date | time):
+        return value.isoformat()
+    elif isinstance(value, bytes | bytearray):
+        return value.hex()
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    else:
+        return str(value)
+
+
+def _canonicalize(value: Any) -> Any:
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: _canonicalize(item) for key, item in value.items()}
+        return sorted(([canonical_json(key), _canonicalize(item)] for key, item in value.items()), key=itemgetter(0))
+    elif isinstance(value, list | tuple):
+        return [_canonicalize(item) for item in value]
+    elif value is None or isinstance(value, str | int | float):
+        return value
+    else:
+        return _canonicalize(_to_canonical(value))
+
+
+def canonical_json(value: Any) -> str:
+    """Serializes the value into a deterministic JSON string.
+
+    Dictionaries (including nested ones) are ordered by their keys, sets are sorted,
+    and values that are not natively JSON serializable are converted to a stable representation.
+    Dictionaries whose keys cannot be sorted or are not supported by JSON (tuples, mixed types, ...)
+    are represented as lists of `[key, value]` pairs sorted by the serialized keys.
+    """
+    try:
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), default=_to_canonical)
+    except TypeError:
+        return json.dumps(_canonicalize(value), sort_keys=True, separators=(",", ":"))
+
+
+def hash_key(value: Any) -> str:
+    """Creates a compact cache key (hex-encoded BLAKE2b digest) of the canonical JSON representation of the value."""
+    return blake2b(canonical_json(value).encode(), digest_size=32).hexdigest()
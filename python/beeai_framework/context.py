@@ -7,7 +7,7 @@ from asyncio import Queue
 from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
 from contextvars import ContextVar
 from datetime import UTC, datetime
-from typing import Any, Generic, Protocol, Self, TypeAlias, TypeVar, runtime_checkable
+from typing import Any, Generic, Literal, Protocol, Self, TypeAlias, TypeVar, runtime_checkable
 
 from pydantic import BaseModel, InstanceOf
 
@@ -42,6 +42,15 @@ RunMiddlewareFn = Callable[["RunContext"], None]
 
 RunMiddlewareType: TypeAlias = RunMiddlewareFn | RunMiddlewareProtocol
 
+RunQueueOverflow: TypeAlias = Literal["block", "drop_oldest", "drop_newest"]
+
+
+class RunQueueStats(BaseModel):
+    max_size: int
+    overflow: RunQueueOverflow
+    high_water_mark: int
+    dropped: int
+
 
 class Run(Generic[R], Awaitable[R]):
     def __init__(
@@ -53,14 +62,11 @@ class Run(Generic[R], Awaitable[R]):
         self.handler = ensure_async(handler)
         self._tasks: list[tuple[Callable[..., Any], list[Any]]] = []
         self._run_context = context
-        self._events = Queue[tuple[Any, EventMeta] | None]()
-
-        async def add_to_queue(data: Any, event: EventMeta) -> None:
-            await self._events.put((data, event))
-
-        self._run_context.emitter.on(
-            "*", add_to_queue, EmitterOptions(persistent=True, is_blocking=True, match_nested=False)
-        )
+        self._events: Queue[tuple[Any, EventMeta] | None] | None = None
+        self._events_max_size = 0
+        self._events_overflow: RunQueueOverflow = "block"
+        self._events_high_water_mark = 0
+        self._events_dropped = 0
 
     def __await__(self) -> Generator[Any, None, R]:
         return self._run_tasks().__await__()
@@ -69,20 +75,56 @@ class Run(Generic[R], Awaitable[R]):
         async def run() -> None:
             await self
 
+        # Dropping policies reserve one extra slot for the terminating item.
+        reserved = 1 if self._events_max_size and self._events_overflow != "block" else 0
+        events = self._events = Queue[tuple[Any, EventMeta] | None](maxsize=self._events_max_size + reserved)
+        cleanup = self._run_context.emitter.on(
+            "*", self._add_to_queue, EmitterOptions(persistent=True, is_blocking=True, match_nested=False)
+        )
         task = asyncio.create_task(run())
 
-        while True:
-            try:
-                item = await self._events.get()
-                if item is not None:
-                    yield item
-                self._events.task_done()
-                if item is None:
-                    break
-            except asyncio.CancelledError:
-                task.cancel()
+        try:
+            while True:
+                try:
+                    item = await events.get()
+                    if item is not None:
+                        yield item
+                    events.task_done()
+                    if item is None:
+                        break
+                except asyncio.CancelledError:
+                    task.cancel()
+
+            await task
+        finally:
+            cleanup()
+            self._events = None
+
+    def buffer(self, max_size: int = 0, *, overflow: RunQueueOverflow = "block") -> Self:
+        """Configures the queue that buffers events when the run is iterated (`async for data, event in run`).
 
-        await task
+        The queue is only created when the run is iterated. Awaiting the run directly does not buffer any events.
+
+        Args:
+            max_size: The maximum number of buffered events. Zero means unbounded.
+            overflow: What happens when the queue is full. `block` pauses the run until the consumer catches up,
+                `drop_oldest` and `drop_newest` discard events instead.
+        """
+        if max_size < 0:
+            raise ValueError("The 'max_size' parameter must be a non-negative integer.")
+
+        self._events_max_size = max_size
+        self._events_overflow = overflow
+        return self
+
+    @property
+    def queue_stats(self) -> RunQueueStats:
+        return RunQueueStats(
+            max_size=self._events_max_size,
+            overflow=self._events_overflow,
+            high_water_mark=self._events_high_water_mark,
+            dropped=self._events_dropped,
+        )
 
     def observe(self, fn: Callable[[Emitter], Any]) -> Self:
         self._tasks.append((fn, [self._run_context.emitter]))
@@ -116,7 +158,30 @@ class Run(Generic[R], Awaitable[R]):
         try:
             return await self.handler()
         finally:
-            await self._events.put(None)
+            await self._put_to_queue(None)
+
+    async def _add_to_queue(self, data: Any, event: EventMeta) -> None:
+        await self._put_to_queue((data, event))
+
+    async def _put_to_queue(self, item: tuple[Any, EventMeta] | None) -> None:
+        events = self._events
+        if events is None:
+            return
+
+        if item is None:
+            await events.put(item)
+            return
+
+        if self._events_overflow != "block" and 0 < self._events_max_size <= events.qsize():
+            self._events_dropped += 1
+            if self._events_overflow == "drop_newest":
+                return
+
+            events.get_nowait()
+            events.task_done()
+
+        await events.put(item)
+        self._events_high_water_mark = max(self._events_high_water_mark, events.qsize())
 
     def _set_context(self, context: dict[str, Any]) -> None:
         self._run_context.context.update(context)
@@ -131,6 +196,7 @@ class RunContext:
         parent: Self | None = None,
         signal: AbortSignal | None,
         run_params: dict[str, Any] | None = None,
+        lightweight: bool = False,
     ) -> None:
         self.instance = instance
         self.created_at = datetime.now(tz=UTC)
@@ -139,26 +205,28 @@ class RunContext:
         self.parent_id = parent.run_id if parent else None
         self.group_id: str = parent.group_id if parent else str(uuid.uuid4())
         self.context: dict[str, Any] = exclude_keys(parent.context, {"id", "parent_id"}) if parent is not None else {}
-
-        self.emitter = self.instance.emitter.child(
-            context=self.context,
-            trace=EventTrace(
-                id=self.group_id,
-                run_id=self.run_id,
-                parent_run_id=parent.run_id if parent else None,
-            ),
-        )
-
-        if parent:
-            self.emitter.pipe(parent.emitter)
-
-        self._controller = AbortController()
-        extra_signals = []
-        if parent:
-            extra_signals.append(parent.signal)
-        if signal:
-            extra_signals.append(signal)
-        register_signals(self._controller, extra_signals)
+        self.lightweight = lightweight
+
+        self._parent = parent
+        self._emitter: Emitter | None = None
+        self._runner: asyncio.Task[Any] | None = None
+        self._abort_reason: str | None = None
+        if not lightweight:
+            _ = self.emitter
+
+        self._controller: AbortController
+        self._shared_controller = lightweight and parent is not None and signal is None
+        if self._shared_controller:
+            assert parent is not None
+            self._controller = parent._controller
+        else:
+            self._controller = AbortController()
+            extra_signals = []
+            if parent:
+                extra_signals.append(parent.signal)
+            if signal:
+                extra_signals.append(signal)
+            register_signals(self._controller, extra_signals)
 
     @classmethod
     def get(cls) -> "RunContext":
@@ -172,16 +240,51 @@ class RunContext:
             raise RuntimeError("Called from non-context.")
         return context
 
+    @property
+    def emitter(self) -> Emitter:
+        if self._emitter is None:
+            self._emitter = self.instance.emitter.child(
+                context=self.context,
+                trace=EventTrace(
+                    id=self.group_id,
+                    run_id=self.run_id,
+                    parent_run_id=self.parent_id,
+                ),
+            )
+            if self._parent:
+                self._emitter.pipe(self._parent.emitter)
+        return self._emitter
+
+    @emitter.setter
+    def emitter(self, emitter: Emitter) -> None:
+        self._emitter = emitter
+
     @property
     def signal(self) -> AbortSignal:
         return self._controller.signal
 
+    def has_listeners(self) -> bool:
+        """Whether events emitted within this context can reach any listener."""
+        if self._emitter is not None:
+            return self._emitter.has_listeners()
+        return self.instance.emitter.has_listeners() or (self._parent is not None and self._parent.has_listeners())
+
     def destroy(self) -> None:
-        self.emitter.destroy()
-        self._controller.abort("Context has been destroyed.")
+        if self._emitter is not None:
+            self._emitter.destroy()
+        if not self._shared_controller:
+            self._controller.abort("Context has been destroyed.")
 
     def abort(self, reason: str | None = None) -> None:
-        self._controller.abort(reason)
+        if self._shared_controller:
+            self._cancel_runner(reason or self.signal.reason)
+        else:
+            self._controller.abort(reason)
+
+    def _cancel_runner(self, reason: str) -> None:
+        if self._runner is not None and not self._runner.done() and self._abort_reason is None:
+            self._abort_reason = reason
+            self._runner.cancel()
 
     @staticmethod
     def enter(
@@ -190,23 +293,41 @@ class RunContext:
         *,
         signal: AbortSignal | None = None,
         run_params: dict[str, Any] | None = None,
+        lightweight: bool = False,
     ) -> Run[R]:
+        """Creates a new run context for the given instance and wraps the given function into a run.
+
+        Args:
+            instance: The instance (agent, tool, model, ...) that is being run.
+            fn: The function to be executed within the context.
+            signal: An additional signal which aborts the run.
+            run_params: The input parameters of the run.
+            lightweight: Reduces the per-run overhead for nested runs. The context shares the abort controller
+                of its parent (unless a signal is provided), its emitter is created on first use
+                and the run lifecycle events (start, success, error, finish) are emitted only if they can reach
+                a listener.
+        """
         parent = storage.get(None)
-        context = RunContext(instance, parent=parent, signal=signal, run_params=run_params)
+        context = RunContext(instance, parent=parent, signal=signal, run_params=run_params, lightweight=lightweight)
 
         async def handler() -> R:
-            emitter = context.emitter.child(
-                namespace=["run"],
-                creator=context,
-                context={"internal": True},
-                events=run_context_event_types,
+            emitter = (
+                context.emitter.child(
+                    namespace=["run"],
+                    creator=context,
+                    context={"internal": True},
+                    events=run_context_event_types,
+                )
+                if not context.lightweight or context.has_listeners()
+                else None
             )
 
             error: FrameworkError | None = None
             output: R | None = None
 
             start_event = RunContextStartEvent(input=context.run_params, output=output)
-            await emitter.emit("start", start_event)
+            if emitter is not None:
+                await emitter.emit("start", start_event)
 
             async def _context_storage_run() -> R:
                 storage.set(context)
@@ -215,54 +336,41 @@ class RunContext:
                 else:
                     return await fn(context)
 
-            async def _context_signal_aborted() -> None:
-                fut = asyncio.get_event_loop().create_future()
+            def _on_abort() -> None:
+                context._cancel_runner(context.signal.reason)
 
-                def _on_abort() -> None:
-                    if not fut.done():
-                        fut.set_exception(AbortError(context.signal.reason))
+            context._runner = asyncio.create_task(_context_storage_run(), name="run-task")
+            context.signal.add_event_listener(_on_abort)
 
-                context.signal.add_event_listener(_on_abort)
+            try:
                 try:
-                    await fut
+                    output = await context._runner
+                except asyncio.CancelledError:
+                    if context._abort_reason is None:
+                        raise
+                    raise AbortError(context._abort_reason)
                 finally:
                     context.signal.remove_event_listener(_on_abort)
 
-            runner_task = asyncio.create_task(_context_storage_run(), name="run-task")
-            abort_task = asyncio.create_task(_context_signal_aborted(), name="abort-task")
-
-            try:
-                done, pending = await asyncio.wait(
-                    [runner_task, abort_task],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-
-                if runner_task in done:
-                    output = runner_task.result()
-                    abort_task.cancel()
-                    await asyncio.gather(*pending, return_exceptions=True)
+                if emitter is not None:
                     await emitter.emit(
                         "success",
                         RunContextSuccessEvent(input=context.run_params, output=output),
                     )
-                    return output
-                else:
-                    runner_task.cancel()
-                    await asyncio.gather(*pending, return_exceptions=True)
-                    abort_task.result()  # Will raise AbortError
-                    raise FrameworkError("Unhandled exception")
-
+                return output
             except Exception as e:
                 error = FrameworkError.ensure(e)
-                await emitter.emit("error", error)
+                if emitter is not None:
+                    await emitter.emit("error", error)
                 raise error
             finally:
-                await emitter.emit(
-                    "finish",
-                    RunContextFinishEvent(error=error, input=context.run_params, output=output),
-                )
+                if emitter is not None:
+                    await emitter.emit(
+                        "finish",
+                        RunContextFinishEvent(error=error, input=context.run_params, output=output),
+                    )
+                    emitter.destroy()
                 context.destroy()
-                emitter.destroy()
 
         return Run(handler, context)
 
@@ -310,5 +418,7 @@ __all__ = [
     "RunContextSuccessEvent",
     "RunMiddlewareProtocol",
     "RunMiddlewareType",
+    "RunQueueOverflow",
+    "RunQueueStats",
     "run_context_event_types",
 ]
@@ -6,6 +6,7 @@ from beeai_framework.emitter.emitter import (
     CleanupFn,
     Emitter,
     EventMeta,
+    EventMetaModel,
     Listener,
     Matcher,
     MatcherFn,
@@ -20,6 +21,7 @@ __all__ = [
     "EmitterError",
     "EmitterOptions",
     "EventMeta",
+    "EventMetaModel",
     "EventTrace",
     "Listener",
     "Matcher",
@@ -5,9 +5,12 @@ import asyncio
 import bisect
 import copy
 import functools
+import itertools
 import re
+import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, TypeAlias, overload
 
@@ -36,7 +39,9 @@ class Listener(BaseModel):
     model_config = ConfigDict(frozen=True)
 
 
-class EventMeta(BaseModel):
+class EventMetaModel(BaseModel):
+    """Serializable (pydantic) view of the `EventMeta`."""
+
     id: str
     name: str
     path: str
@@ -49,6 +54,218 @@ class EventMeta(BaseModel):
     data_type: type
 
 
+_UNSET: Any = object()
+
+
+class EventMeta:
+    """Metadata of an emitted event.
+
+    The identifier, the creation date and the copy of the trace are materialized on the first access.
+    When the context and the trace are not provided explicitly, they are taken from the `source` emitter
+    at the time of creation, so later changes of the emitter do not leak into the event.
+    """
+
+    __slots__ = (
+        "_context",
+        "_created_at",
+        "_id",
+        "_timestamp",
+        "_trace",
+        "_trace_source",
+        "creator",
+        "data_type",
+        "group_id",
+        "name",
+        "path",
+        "source",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        path: str,
+        source: "Emitter",
+        creator: object,
+        data_type: type,
+        id: str | None = None,
+        created_at: datetime | None = None,
+        context: dict[str, Any] | None = None,
+        group_id: str | None = None,
+        trace: EventTrace | None = _UNSET,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.source = source
+        self.creator = creator
+        self.data_type = data_type
+        self.group_id = group_id
+        self._id = id
+        self._created_at = created_at
+        self._timestamp = time.time() if created_at is None else 0.0
+        self._context = {**source.context} if context is None else context
+        self._trace = trace
+        self._trace_source = source.trace if trace is _UNSET else None
+
+    @property
+    def id(self) -> str:
+        if self._id is None:
+            self._id = str(uuid.uuid4())
+        return self._id
+
+    @id.setter
+    def id(self, value: str) -> None:
+        self._id = value
+
+    @property
+    def created_at(self) -> datetime:
+        if self._created_at is None:
+            self._created_at = datetime.fromtimestamp(self._timestamp, tz=UTC)
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at = value
+
+    @property
+    def context(self) -> dict[str, Any]:
+        return self._context
+
+    @context.setter
+    def context(self, value: dict[str, Any]) -> None:
+        self._context = value
+
+    @property
+    def trace(self) -> EventTrace | None:
+        if self._trace is _UNSET:
+            self._trace = copy.copy(self._trace_source)
+        return self._trace
+
+    @trace.setter
+    def trace(self, value: EventTrace | None) -> None:
+        self._trace = value
+
+    def to_model(self) -> EventMetaModel:
+        return EventMetaModel(
+            id=self.id,
+            name=self.name,
+            path=self.path,
+            created_at=self.created_at,
+            source=self.source,
+            creator=self.creator,
+            context=self.context,
+            group_id=self.group_id,
+            trace=self.trace,
+            data_type=self.data_type,
+        )
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        return self.to_model().model_dump(**kwargs)
+
+    def to_json_safe(self) -> Any:
+        return self.model_dump()
+
+    def __repr__(self) -> str:
+        return f"EventMeta(id={self.id!r}, name={self.name!r}, path={self.path!r}, created_at={self.created_at!r})"
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexEntry:
+    listener: Listener
+    invoke: Callable[[Any, "EventMeta"], Awaitable[None]]
+    order: tuple[int, int]
+    predicate: MatcherFn | None
+    same_run: bool
+
+
+class _ListenerIndex:
+    """Buckets listeners by what they can match so that dispatch only visits relevant listeners.
+
+    - `path`: dotted string matchers, keyed by the full event path.
+    - `name`: plain name matchers, keyed by the event name (only for events emitted by the owning emitter).
+    - `own`: the `*` matcher (only for events emitted by the owning emitter).
+    - `any`: the `*.*` matcher, regular expressions and custom functions (evaluated for every event).
+
+    Every bucket is kept in the dispatch order (higher priority first, then registration order).
+    """
+
+    def __init__(self) -> None:
+        self._path: dict[str, list[_IndexEntry]] = {}
+        self._name: dict[str, list[_IndexEntry]] = {}
+        self._own: list[_IndexEntry] = []
+        self._any: list[_IndexEntry] = []
+        self._entries: dict[int, tuple[list[_IndexEntry], _IndexEntry]] = {}
+        self._counter = itertools.count()
+
+    def add(self, listener: Listener, *, same_run: bool) -> None:
+        matcher = listener.raw
+        priority = listener.options.priority if listener.options else 0
+        predicate: MatcherFn | None = None
+
+        if matcher == "*":
+            bucket = self._own
+        elif matcher == "*.*":
+            bucket = self._any
+        elif isinstance(matcher, re.Pattern):
+            bucket = self._any
+            predicate = functools.partial(_match_path, matcher)
+        elif callable(matcher):
+            bucket = self._any
+            predicate = matcher
+        elif "." in matcher:
+            bucket = self._path.setdefault(matcher, [])
+        else:
+            bucket = self._name.setdefault(matcher, [])
+
+        entry = _IndexEntry(
+            listener=listener,
+            invoke=ensure_async(listener.callback, offload=bool(listener.options and listener.options.offload)),
+            order=(-priority, next(self._counter)),
+            predicate=predicate,
+            same_run=same_run,
+        )
+        bisect.insort_right(bucket, entry, key=_entry_order)
+        self._entries[id(listener)] = (bucket, entry)
+
+    def remove(self, listener: Listener) -> None:
+        found = self._entries.pop(id(listener), None)
+        if found is not None:
+            bucket, entry = found
+            bucket.remove(entry)
+
+    def clear(self) -> None:
+        self._path.clear()
+        self._name.clear()
+        self._own.clear()
+        self._any.clear()
+        self._entries.clear()
+
+    def lookup(self, event: "EventMeta", *, own: bool, same_run: bool) -> list[_IndexEntry]:
+        buckets = [self._any, self._path.get(event.path)]
+        if own:
+            buckets.append(self._own)
+            buckets.append(self._name.get(event.name))
+
+        candidates = [bucket for bucket in buckets if bucket]
+        if not candidates:
+            return []
+
+        entries = candidates[0] if len(candidates) == 1 else sorted(itertools.chain(*candidates), key=_entry_order)
+        return [
+            entry
+            for entry in entries
+            if (same_run or not entry.same_run) and (entry.predicate is None or entry.predicate(event))
+        ]
+
+
+def _entry_order(entry: _IndexEntry) -> tuple[int, int]:
+    return entry.order
+
+
+def _match_path(pattern: re.Pattern[str], event: "EventMeta") -> bool:
+    return pattern.match(event.path) is not None
+
+
 class Emitter:
     def __init__(
         self,
@@ -62,6 +279,7 @@ class Emitter:
         super().__init__()
 
         self._listeners: list[Listener] = []
+        self._index = _ListenerIndex()
         self._group_id: str | None = group_id
         self.namespace: list[str] = namespace or []
         self.creator: object | None = creator
@@ -120,8 +338,27 @@ class Emitter:
             ),
         )
 
+    def has_listeners(self) -> bool:
+        """Whether events emitted by this emitter can reach any listener (directly or through piped emitters)."""
+        visited: set[int] = set()
+        pending: list[Emitter] = [self]
+        while pending:
+            emitter = pending.pop()
+            if id(emitter) in visited:
+                continue
+            visited.add(id(emitter))
+
+            for listener in emitter._listeners:
+                target = getattr(listener.callback, "__self__", None)
+                if isinstance(target, Emitter) and getattr(listener.callback, "__func__", None) is Emitter._invoke:
+                    pending.append(target)
+                else:
+                    return True
+        return False
+
     def destroy(self) -> None:
         self._listeners.clear()
+        self._index.clear()
         for cleanup in self._cleanups:
             cleanup()
         self._cleanups.clear()
@@ -170,7 +407,7 @@ class Emitter:
 
         for listener in reversed(list(self._listeners)):
             if _match_listener(listener, matcher=event, callback=callback, options=options):
-                self._listeners.remove(listener)
+                self._remove_listener(listener)
 
     @deprecated(reason="Use `on` instead.")
     def match(self, matcher: Matcher, callback: Callback, options: EmitterOptions | None = None) -> CleanupFn:
@@ -182,8 +419,9 @@ class Emitter:
         if not matcher:
             raise ValueError("Cannot listen to events without specifying a matcher.")
 
+        match_nested = _resolve_match_nested(matcher, options)
         listener = Listener(
-            match=self._create_matcher(matcher, options), raw=matcher, callback=callback, options=options
+            match=self._create_matcher(matcher, match_nested), raw=matcher, callback=callback, options=options
         )
 
         bisect.insort_left(
@@ -191,36 +429,31 @@ class Emitter:
             listener,
             key=lambda ln: ln.options.priority if ln.options else 0,
         )
+        self._index.add(listener, same_run=not match_nested)
 
-        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+        return lambda: self._remove_listener(listener) if listener in self._listeners else None
 
-    def _create_matcher(self, matcher: Matcher, options: EmitterOptions | None) -> MatcherFn:
+    def _remove_listener(self, listener: Listener) -> None:
+        self._listeners.remove(listener)
+        self._index.remove(listener)
+
+    def _create_matcher(self, matcher: Matcher, match_nested: bool) -> MatcherFn:
         matchers: list[MatcherFn] = []
-        match_nested = options.match_nested if options else None
 
         if matcher == "*":
-            match_nested = False if match_nested is None else match_nested
             matchers.append(lambda event: event.path == ".".join([*self.namespace, event.name]))
         elif matcher == "*.*":
-            match_nested = True if match_nested is None else match_nested
             matchers.append(lambda _: True)
         elif isinstance(matcher, re.Pattern):
-            match_nested = True if match_nested is None else match_nested
-            matchers.append(lambda event: matcher.match(event.path) is not None)
+            matchers.append(functools.partial(_match_path, matcher))
         elif callable(matcher):
-            match_nested = False if match_nested is None else match_nested
             matchers.append(matcher)
-        elif isinstance(matcher, str):
-            if "." in matcher:
-                match_nested = True if match_nested is None else match_nested
-                matchers.append(lambda event: event.path == matcher)
-            else:
-                match_nested = False if match_nested is None else match_nested
-                matchers.append(
-                    lambda event: event.name == matcher and event.path == ".".join([*self.namespace, event.name])
-                )
+        elif "." in matcher:
+            matchers.append(lambda event: event.path == matcher)
         else:
-            raise EmitterError("Invalid matcher provided!")
+            matchers.append(
+                lambda event: event.name == matcher and event.path == ".".join([*self.namespace, event.name])
+            )
 
         if not match_nested:
 
@@ -242,10 +475,9 @@ class Emitter:
             raise EmitterError.ensure(e)
 
     async def _invoke(self, data: Any, event: EventMeta) -> None:
-        async def run(ln: Listener) -> Any:
+        async def run(entry: _IndexEntry) -> Any:
             try:
-                ln_async = ensure_async(ln.callback)
-                return await ln_async(data, event)
+                return await entry.invoke(data, event)
             except Exception as e:
                 raise EmitterError.ensure(
                     e,
@@ -253,30 +485,38 @@ class Emitter:
                     event=event,
                 )
 
-        async with asyncio.TaskGroup() as tg:
-            for listener in reversed(list(self._listeners)):
-                if not listener.match(event):
-                    continue
+        namespace = ".".join(self.namespace)
+        entries = self._index.lookup(
+            event,
+            own=event.path == (f"{namespace}.{event.name}" if namespace else event.name),
+            same_run=self.trace is None or (event.trace is not None and self.trace.run_id == event.trace.run_id),
+        )
+        if not entries:
+            return
 
-                if listener.options and listener.options.once:
-                    self._listeners.remove(listener)
+        for entry in entries:
+            options = entry.listener.options
+            if options and options.once and entry.listener in self._listeners:
+                self._remove_listener(entry.listener)
 
-                task = tg.create_task(run(listener))
-                if listener.options and listener.options.is_blocking:
+        if len(entries) == 1:
+            await run(entries[0])
+            return
+
+        async with asyncio.TaskGroup() as tg:
+            for entry in entries:
+                task = tg.create_task(run(entry))
+                if entry.listener.options and entry.listener.options.is_blocking:
                     _ = await task
 
     def _create_event(self, name: str) -> EventMeta:
         return EventMeta(
-            id=str(uuid.uuid4()),
             group_id=self._group_id,
             name=name,
             path=".".join([*self.namespace, name]),
-            created_at=datetime.now(tz=UTC),
             source=self,
             creator=self.creator,
-            context={**self.context},
-            trace=copy.copy(self.trace),
-            data_type=self.events.get(name) or type(Any),
+            data_type=self._events.get(name) or type(Any),
         )
 
     async def clone(self) -> "Emitter":
@@ -294,6 +534,21 @@ class Emitter:
         return cloned
 
 
+def _resolve_match_nested(matcher: Matcher, options: EmitterOptions | None) -> bool:
+    match_nested = options.match_nested if options else None
+    if match_nested is not None:
+        return match_nested
+
+    if matcher == "*.*" or isinstance(matcher, re.Pattern):
+        return True
+    elif callable(matcher) or matcher == "*":
+        return False
+    elif isinstance(matcher, str):
+        return "." in matcher
+    else:
+        raise EmitterError("Invalid matcher provided!")
+
+
 def _match_listener(
     listener: Listener,
     *,
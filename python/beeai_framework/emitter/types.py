@@ -15,6 +15,11 @@ class EmitterOptions(BaseModel):
     once: bool | None = None
     persistent: bool | None = None
     match_nested: bool | None = None
+    offload: bool | None = Field(
+        default=None,
+        description="Executes a synchronous callback in a worker thread instead of directly on the event loop. "
+        "Enable it for callbacks that perform blocking I/O.",
+    )
     priority: int = Field(
         default=0,
         description="Defines the priority in which the callback gets executed. A higher value means earlier execution.",
@@ -0,0 +1,122 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Iterable
+
+from beeai_framework.backend.message import AnyMessage
+
+
+class MessageStorage:
+    """Ordered message storage shared by the memory implementations.
+
+    Messages are kept in a plain list (exposed via `messages`) together with an index of the stored instances.
+    Membership checks and deletions of unknown messages are O(1), and bulk operations do not rescan the list
+    once per message. Messages are matched by identity.
+    """
+
+    __slots__ = ("_counts", "_messages")
+
+    def __init__(self, messages: Iterable[AnyMessage] = ()) -> None:
+        self._messages: list[AnyMessage] = []
+        self._counts: dict[int, int] = {}
+        self.insert_many(None, messages)
+
+    @property
+    def messages(self) -> list[AnyMessage]:
+        return self._messages
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __contains__(self, message: object) -> bool:
+        return id(message) in self._counts
+
+    def _normalize_index(self, index: int | None) -> int:
+        return len(self._messages) if index is None else max(0, min(index, len(self._messages)))
+
+    def _track(self, message: AnyMessage) -> None:
+        key = id(message)
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    def _untrack(self, message: AnyMessage) -> None:
+        key = id(message)
+        count = self._counts[key] - 1
+        if count:
+            self._counts[key] = count
+        else:
+            del self._counts[key]
+
+    def insert(self, index: int | None, message: AnyMessage) -> None:
+        self._messages.insert(self._normalize_index(index), message)
+        self._track(message)
+
+    def insert_many(self, index: int | None, messages: Iterable[AnyMessage]) -> None:
+        messages = list(messages)
+        index = self._normalize_index(index)
+        self._messages[index:index] = messages
+        for message in messages:
+            self._track(message)
+
+    def remove(self, message: AnyMessage) -> bool:
+        if message not in self:
+            return False
+
+        self._messages.remove(message)
+        self._untrack(message)
+        return True
+
+    def remove_many(self, messages: Iterable[AnyMessage]) -> list[AnyMessage]:
+        """Removes the given messages (each occurrence only once) in a single pass and returns the removed ones."""
+        pending: dict[int, int] = {}
+        selected: list[AnyMessage] = []
+        for message in messages:
+            key = id(message)
+            if pending.get(key, 0) < self._counts.get(key, 0):
+                pending[key] = pending.get(key, 0) + 1
+                selected.append(message)
+
+        if len(selected) <= 1:
+            for message in selected:
+                self.remove(message)
+            return selected
+
+        # Like `remove`, the first occurrences are removed. Temporary messages are usually the most recent ones,
+        # so the search starts from the end when all occurrences of the removed messages go away.
+        from_end = all(count == self._counts[key] for key, count in pending.items())
+        indices = range(len(self._messages) - 1, -1, -1) if from_end else range(len(self._messages))
+        positions: list[int] = []
+        remaining = len(selected)
+        for idx in indices:
+            key = id(self._messages[idx])
+            if pending.get(key):
+                pending[key] -= 1
+                positions.append(idx)
+                remaining -= 1
+                if not remaining:
+                    break
+
+        positions.sort(reverse=True)
+        removed = [self._messages[idx] for idx in reversed(positions)]
+        for idx in positions:
+            del self._messages[idx]
+        for message in removed:
+            self._untrack(message)
+        return removed
+
+    def remove_first(self, count: int) -> list[AnyMessage]:
+        """Removes the given number of the oldest messages and returns them."""
+        removed = self._messages[:count]
+        del self._messages[:count]
+        for message in removed:
+            self._untrack(message)
+        return removed
+
+    def clear(self) -> None:
+        self._messages.clear()
+        self._counts.clear()
+
+    def copy(self) -> "MessageStorage":
+        storage = MessageStorage()
+        storage._messages = self._messages.copy()
+        storage._counts = self._counts.copy()
+        return storage
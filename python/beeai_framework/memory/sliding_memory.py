@@ -2,11 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import dataclasses
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import TypedDict
 
 from beeai_framework.backend.message import AnyMessage
+from beeai_framework.memory._storage import MessageStorage
 from beeai_framework.memory.base_memory import BaseMemory
 from beeai_framework.memory.errors import ResourceError
 
@@ -37,7 +38,7 @@ class SlidingMemory(BaseMemory):
         Args:
             config: Configuration including window size and optional handlers
         """
-        self._messages: list[AnyMessage] = []
+        self._storage = MessageStorage()
         self._config = config
 
         # Set default handlers if not provided
@@ -51,7 +52,7 @@ class SlidingMemory(BaseMemory):
     @property
     def messages(self) -> list[AnyMessage]:
         """Get list of stored messages."""
-        return self._messages
+        return self._storage.messages
 
     @property
     def config(self) -> SlidingMemoryConfig:
@@ -60,11 +61,7 @@ class SlidingMemory(BaseMemory):
 
     def _is_overflow(self, additional_messages: int = 1) -> bool:
         """Check if adding messages would cause overflow."""
-        return len(self._messages) + additional_messages > self.config.size
-
-    def _ensure_range(self, index: int, min_val: int, max_val: int) -> int:
-        """Ensure index is within the specified range."""
-        return max(min_val, min(index, max_val))
+        return len(self._storage) + additional_messages > self.config.size
 
     async def add(self, message: AnyMessage, index: int | None = None) -> None:
         """Add a message to memory, managing window size.
@@ -80,21 +77,15 @@ class SlidingMemory(BaseMemory):
         if self._is_overflow():
             # Get messages to remove using removal selector
             to_remove: AnyMessage | list[AnyMessage] = (
-                self.config.handlers["removal_selector"](self._messages) if self.config.handlers is not None else []
+                self.config.handlers["removal_selector"](self.messages) if self.config.handlers is not None else []
             )
             if not isinstance(to_remove, list):
                 to_remove = [to_remove]
 
             # Remove selected messages
-            for msg in to_remove:
-                try:
-                    msg_index = self._messages.index(msg)
-                    self._messages.pop(msg_index)
-                except ValueError:
-                    raise ResourceError(
-                        "Cannot delete non existing message.",
-                        # context={"message": msg, "messages": self._messages},
-                    ) from ValueError
+            if any(msg not in self._storage for msg in to_remove):
+                raise ResourceError("Cannot delete non existing message.")
+            self._storage.remove_many(to_remove)
 
             # Check if we still have overflow
             if self._is_overflow():
@@ -103,10 +94,7 @@ class SlidingMemory(BaseMemory):
                 )
 
         # Add new message
-        if index is None:
-            index = len(self._messages)
-        index = self._ensure_range(index, 0, len(self._messages))
-        self._messages.insert(index, message)
+        self._storage.insert(index, message)
 
     async def delete(self, message: AnyMessage) -> bool:
         """Delete a message from memory.
@@ -117,17 +105,17 @@ class SlidingMemory(BaseMemory):
         Returns:
             bool: True if message was found and deleted
         """
-        try:
-            self._messages.remove(message)
-            return True
-        except ValueError:
-            return False
+        return self._storage.remove(message)
+
+    async def delete_many(self, messages: Iterable[AnyMessage]) -> None:
+        """Delete multiple messages from memory in a single pass."""
+        self._storage.remove_many(messages)
 
     def reset(self) -> None:
         """Clear all messages from memory."""
-        self._messages.clear()
+        self._storage.clear()
 
     async def clone(self) -> "SlidingMemory":
         cloned = SlidingMemory(await self._config.clone())
-        cloned._messages = self._messages.copy()
+        cloned._storage = self._storage.copy()
         return cloned
@@ -1,69 +1,184 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 from collections.abc import Iterable
 
 from beeai_framework.backend.chat import ChatModel
 from beeai_framework.backend.message import AnyMessage, SystemMessage, UserMessage
+from beeai_framework.logger import Logger
 from beeai_framework.memory.base_memory import BaseMemory
+from beeai_framework.memory.token_memory import simple_tokenize
+
+logger = Logger(__name__)
 
 
 class SummarizeMemory(BaseMemory):
-    """Memory implementation that summarizes conversations."""
+    """Memory implementation that summarizes conversations.
+
+    Messages are kept as they are until the summarization is triggered (by default, after every message).
+    Then only these pending messages are folded into the running summary, so the conversation is never
+    re-summarized from scratch. With `background=True`, the summarization runs in a separate task and
+    `add` returns immediately. Messages which have not been summarized yet stay in the memory.
+    """
+
+    def __init__(
+        self,
+        model: ChatModel,
+        *,
+        summarize_every: int = 1,
+        max_pending_tokens: int | None = None,
+        background: bool = False,
+    ) -> None:
+        """Initialize SummarizeMemory.
+
+        Args:
+            model: Chat model used for summarization
+            summarize_every: Number of pending messages that triggers the summarization
+            max_pending_tokens: Estimated token count of pending messages that triggers the summarization
+            background: Whether to summarize in a background task instead of waiting for it in `add`
+        """
+        if summarize_every < 1:
+            raise ValueError('"summarize_every" must be a positive number')
 
-    def __init__(self, model: ChatModel) -> None:
-        self._messages: list[AnyMessage] = []
         self._model = model
+        self._summarize_every = summarize_every
+        self._max_pending_tokens = max_pending_tokens
+        self._background = background
+        self._summary: SystemMessage | None = None
+        self._pending: list[AnyMessage] = []
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        # incremented by reset, so that an in-flight summarization does not restore the cleared state
+        self._generation = 0
 
     @property
     def messages(self) -> list[AnyMessage]:
-        return self._messages
+        return [self._summary, *self._pending] if self._summary is not None else self._pending
+
+    @property
+    def summary(self) -> str | None:
+        """The running summary or None if nothing has been summarized yet."""
+        return self._summary.text if self._summary is not None else None
+
+    @property
+    def pending_messages(self) -> list[AnyMessage]:
+        """Messages which have not been folded into the summary yet."""
+        return self._pending
 
     async def add(self, message: AnyMessage, index: int | None = None) -> None:
         """Add a message and trigger summarization if needed."""
-        messages_to_summarize = [*self._messages, message]
-        summary = await self._summarize_messages(messages_to_summarize)
-
-        self._messages = [SystemMessage(summary)]
+        offset = 0 if self._summary is None else 1
+        index = len(self._pending) if index is None else max(0, min(index - offset, len(self._pending)))
+        self._pending.insert(index, message)
+        await self._schedule()
 
     async def add_many(self, messages: Iterable[AnyMessage], start: int | None = None) -> None:
-        """Add multiple messages and summarize."""
-        messages_to_summarize = self._messages + list(messages)
-        summary = await self._summarize_messages(messages_to_summarize)
+        """Add multiple messages and trigger summarization (at most once) if needed."""
+        offset = 0 if self._summary is None else 1
+        index = len(self._pending) if start is None else max(0, min(start - offset, len(self._pending)))
+        self._pending[index:index] = messages
+        await self._schedule()
+
+    async def sync(self) -> None:
+        """Wait for a running summarization and fold all remaining pending messages into the summary."""
+        if self._task is not None:
+            await asyncio.wait([self._task])
+        while self._pending:
+            await self._summarize()
+
+    def _should_summarize(self) -> bool:
+        if len(self._pending) >= self._summarize_every:
+            return True
+        return self._max_pending_tokens is not None and simple_tokenize(self._pending) >= self._max_pending_tokens
 
-        self._messages = [SystemMessage(summary)]
+    async def _schedule(self) -> None:
+        if not self._should_summarize():
+            return
 
-    async def _summarize_messages(self, messages: list[AnyMessage]) -> str:
-        """Summarize a list of messages using the LLM."""
-        if not messages:
-            return ""
+        if not self._background:
+            await self._summarize()
+        elif self._task is None:
+            self._task = asyncio.create_task(self._summarize_in_background())
+
+    async def _summarize_in_background(self) -> None:
+        try:
+            while self._should_summarize():
+                await self._summarize()
+        except Exception as e:
+            logger.warning(f"Background summarization has failed: {e!s}")
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    async def _summarize(self) -> None:
+        async with self._lock:
+            messages = self._pending.copy()
+            if not messages:
+                return
+
+            generation = self._generation
+            summary = await self._summarize_messages(messages)
+            if generation != self._generation:
+                return
+
+            summarized = {id(msg) for msg in messages}
+            self._pending = [msg for msg in self._pending if id(msg) not in summarized]
+            self._summary = SystemMessage(summary)
 
-        prompt = UserMessage(
-            """Summarize the following conversation. Be concise but include all key information.
+    async def _summarize_messages(self, messages: list[AnyMessage]) -> str:
+        """Fold the given messages into the current summary using the LLM."""
+        conversation = "\n".join([f"{msg.role}: {msg.text}" for msg in messages])
+        if self._summary is None:
+            prompt = f"""Summarize the following conversation. Be concise but include all key information.
 
 Previous messages:
-{}
+{conversation}
 
-Summary:""".format("\n".join([f"{msg.role}: {msg.text}" for msg in messages]))
-        )
+Summary:"""
+        else:
+            prompt = f"""Extend the summary with the new messages. Be concise but include all key information.
+
+Current summary:
+{self._summary.text}
+
+New messages:
+{conversation}
 
-        response = await self._model.run([prompt])
+Updated summary:"""
+
+        response = await self._model.run([UserMessage(prompt)])
 
         return response.output[0].get_texts()[0].text
 
     async def delete(self, message: AnyMessage) -> bool:
         """Delete a message from memory."""
+        if message is self._summary:
+            self._summary = None
+            return True
+
         try:
-            self._messages.remove(message)
+            self._pending.remove(message)
             return True
         except ValueError:
             return False
 
     def reset(self) -> None:
         """Clear all messages from memory."""
-        self._messages.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._generation += 1
+        self._summary = None
+        self._pending.clear()
 
     async def clone(self) -> "SummarizeMemory":
-        cloned = SummarizeMemory(await self._model.clone())
-        cloned._messages = self._messages.copy()
+        cloned = SummarizeMemory(
+            await self._model.clone(),
+            summarize_every=self._summarize_every,
+            max_pending_tokens=self._max_pending_tokens,
+            background=self._background,
+        )
+        cloned._summary = self._summary
+        cloned._pending = self._pending.copy()
         return cloned
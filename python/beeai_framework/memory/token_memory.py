@@ -1,13 +1,20 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+from collections.abc import Iterable
+from dataclasses import dataclass
 from math import ceil
 from typing import Any
 
-from beeai_framework.backend.message import AnyMessage
+from beeai_framework.backend.message import AnyMessage, Role
+from beeai_framework.logger import Logger
+from beeai_framework.memory._storage import MessageStorage
 from beeai_framework.memory.base_memory import BaseMemory
+from beeai_framework.memory.errors import ResourceError, ResourceFatalError
 from beeai_framework.utils.cloneable import Cloneable
 
+logger = Logger(__name__)
+
 
 def simple_estimate(msg: AnyMessage) -> int:
     return ceil(len(msg.text) / 4)
@@ -17,8 +24,30 @@ def simple_tokenize(msgs: list[AnyMessage]) -> int:
     return sum(map(simple_estimate, msgs))
 
 
+def _remove_oldest_non_system(msgs: list[AnyMessage]) -> AnyMessage:
+    return next((msg for msg in msgs if msg.role != Role.SYSTEM), msgs[0])
+
+
+@dataclass(slots=True)
+class _TokenInfo:
+    message: AnyMessage
+    tokens_count: int
+    dirty: bool = True
+    # how many times the same message instance is stored
+    references: int = 1
+
+
 class TokenMemory(BaseMemory):
-    """Memory implementation that respects token limits."""
+    """Memory implementation that respects token limits.
+
+    Token counts are tracked per message instance and kept as a running total, so adding a message does not
+    rescan the whole memory. A new message is counted with the cheap `estimate` handler first. Once the share of
+    estimated (dirty) messages reaches `sync_threshold`, they are recounted with the `tokenize` handler,
+    which can be any local tokenizer (the default one approximates a token as four characters).
+
+    When `max_tokens` is set and exceeded, messages picked by the `removal_selector` handler are evicted
+    (by default, the oldest non-system message).
+    """
 
     def __init__(
         self,
@@ -28,18 +57,20 @@ class TokenMemory(BaseMemory):
         capacity_threshold: float = 0.75,
         handlers: dict[str, Any] | None = None,
     ) -> None:
-        self._messages: list[AnyMessage] = []
+        self._storage = MessageStorage()
         self.llm = llm
         self._max_tokens = max_tokens
         self._threshold = capacity_threshold
         self._sync_threshold = sync_threshold
-        self._tokens_by_message: dict[str, Any] = {}
+        self._tokens_by_message: dict[int, _TokenInfo] = {}
+        self._tokens_used = 0
+        self._dirty_count = 0
 
         self._handlers = {
             "tokenize": (handlers.get("tokenize", simple_tokenize) if handlers else simple_tokenize),
             "estimate": (handlers.get("estimate", self._default_estimate) if handlers else self._default_estimate),
             "removal_selector": (
-                handlers.get("removal_selector", lambda msgs: msgs[0]) if handlers else lambda msgs: msgs[0]
+                handlers.get("removal_selector", _remove_oldest_non_system) if handlers else _remove_oldest_non_system
             ),
         }
 
@@ -50,72 +81,100 @@ class TokenMemory(BaseMemory):
     def _default_estimate(msg: AnyMessage) -> int:
         return int((len(msg.role) + len(msg.text)) / 4)
 
-    def _get_message_key(self, message: AnyMessage) -> str:
-        """Generate a unique key for a message."""
-        return f"{message.role}:{message.text}"
-
     @property
     def messages(self) -> list[AnyMessage]:
-        return self._messages
+        return self._storage.messages
 
     @property
     def handlers(self) -> dict[str, Any]:
         return self._handlers
 
+    @property
+    def max_tokens(self) -> int | None:
+        return self._max_tokens
+
     @property
     def tokens_used(self) -> int:
-        return sum(info.get("tokens_count", 0) for info in self._tokens_by_message.values())
+        return self._tokens_used
 
     @property
     def is_dirty(self) -> bool:
-        return any(info.get("dirty", True) for info in self._tokens_by_message.values())
+        return self._dirty_count > 0
+
+    def _update_info(self, info: _TokenInfo, *, tokens_count: int, dirty: bool) -> None:
+        self._tokens_used += (tokens_count - info.tokens_count) * info.references
+        self._dirty_count += dirty - info.dirty
+        info.tokens_count = tokens_count
+        info.dirty = dirty
 
     async def sync(self) -> None:
-        """Synchronize token counts with LLM."""
-        for msg in self._messages:
-            key = self._get_message_key(msg)
-            cache = self._tokens_by_message.get(key, {})
-            if cache.get("dirty", True):
-                try:
-                    result = self.handlers["tokenize"]([msg])
-                    self._tokens_by_message[key] = {
-                        "tokens_count": result,
-                        "dirty": False,
-                    }
-                except Exception as e:
-                    print(f"Error tokenizing message: {e!s}")
-                    self._tokens_by_message[key] = {
-                        "tokens_count": self.handlers["estimate"](msg),
-                        "dirty": True,
-                    }
+        """Recounts the tokens of the messages which have only been estimated so far."""
+        for info in list(self._tokens_by_message.values()):
+            if not info.dirty:
+                continue
 
-    async def add(self, message: AnyMessage, index: int | None = None) -> None:
-        index = len(self._messages) if index is None else max(0, min(index, len(self._messages)))
-        self._messages.insert(index, message)
-
-        key = self._get_message_key(message)
-        estimated_tokens = self.handlers["estimate"](message)
-        self._tokens_by_message[key] = {
-            "tokens_count": estimated_tokens,
-            "dirty": True,
-        }
+            try:
+                self._update_info(info, tokens_count=self.handlers["tokenize"]([info.message]), dirty=False)
+            except Exception as e:
+                logger.warning(f"Error tokenizing message: {e!s}")
+
+        await self._evict()
 
-        dirty_count = sum(1 for info in self._tokens_by_message.values() if info.get("dirty", True))
-        if len(self._messages) > 0 and dirty_count / len(self._messages) >= self._sync_threshold:
+    async def add(self, message: AnyMessage, index: int | None = None) -> None:
+        info = self._tokens_by_message.get(id(message))
+        tokens_count = info.tokens_count if info is not None else self.handlers["estimate"](message)
+        if self._max_tokens is not None and tokens_count > self._max_tokens:
+            raise ResourceFatalError(
+                f"Message ({tokens_count} tokens) cannot fit inside the memory ({self._max_tokens} tokens)."
+            )
+
+        await self._evict(reserved=tokens_count)
+
+        self._storage.insert(index, message)
+        info = self._tokens_by_message.get(id(message))  # the message might have been evicted in the meantime
+        if info is None:
+            self._tokens_by_message[id(message)] = _TokenInfo(message=message, tokens_count=tokens_count)
+            self._dirty_count += 1
+        else:
+            info.references += 1
+        self._tokens_used += tokens_count
+
+        if self._dirty_count / len(self._storage) >= self._sync_threshold:
             await self.sync()
 
+    async def _evict(self, *, reserved: int = 0) -> None:
+        if self._max_tokens is None:
+            return
+
+        while self._storage and self._tokens_used + reserved > self._max_tokens:
+            message = self.handlers["removal_selector"](self.messages)
+            if not await self.delete(message):
+                raise ResourceError("Cannot delete non existing message.")
+
     async def delete(self, message: AnyMessage) -> bool:
-        try:
-            key = self._get_message_key(message)
-            self._messages.remove(message)
-            self._tokens_by_message.pop(key, None)
-            return True
-        except ValueError:
+        if not self._storage.remove(message):
             return False
 
+        self._release(message)
+        return True
+
+    async def delete_many(self, messages: Iterable[AnyMessage]) -> None:
+        for message in self._storage.remove_many(messages):
+            self._release(message)
+
+    def _release(self, message: AnyMessage) -> None:
+        info = self._tokens_by_message[id(message)]
+        self._tokens_used -= info.tokens_count
+        info.references -= 1
+        if info.references == 0:
+            del self._tokens_by_message[id(message)]
+            self._dirty_count -= info.dirty
+
     def reset(self) -> None:
-        self._messages.clear()
+        self._storage.clear()
         self._tokens_by_message.clear()
+        self._tokens_used = 0
+        self._dirty_count = 0
 
     async def clone(self) -> "TokenMemory":
         llm_clone = await self.llm.clone() if self.llm is not None else None
@@ -126,6 +185,11 @@ class TokenMemory(BaseMemory):
             self._threshold,
             self._handlers.copy() if self._handlers else None,
         )
-        cloned._messages = self._messages.copy()
-        cloned._tokens_by_message = self._tokens_by_message.copy()
+        cloned._storage = self._storage.copy()
+        cloned._tokens_by_message = {
+            key: _TokenInfo(info.message, info.tokens_count, info.dirty, info.references)
+            for key, info in self._tokens_by_message.items()
+        }
+        cloned._tokens_used = self._tokens_used
+        cloned._dirty_count = self._dirty_count
         return cloned
@@ -1,7 +1,10 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+from collections.abc import Iterable
+
 from beeai_framework.backend.message import AnyMessage
+from beeai_framework.memory._storage import MessageStorage
 from beeai_framework.memory.base_memory import BaseMemory
 
 
@@ -9,27 +12,28 @@ class UnconstrainedMemory(BaseMemory):
     """Simple memory implementation with no constraints."""
 
     def __init__(self) -> None:
-        self._messages: list[AnyMessage] = []
+        self._storage = MessageStorage()
 
     @property
     def messages(self) -> list[AnyMessage]:
-        return self._messages
+        return self._storage.messages
 
     async def add(self, message: AnyMessage, index: int | None = None) -> None:
-        index = len(self._messages) if index is None else max(0, min(index, len(self._messages)))
-        self._messages.insert(index, message)
+        self._storage.insert(index, message)
+
+    async def add_many(self, messages: Iterable[AnyMessage], start: int | None = None) -> None:
+        self._storage.insert_many(start, messages)
 
     async def delete(self, message: AnyMessage) -> bool:
-        try:
-            self._messages.remove(message)
-            return True
-        except ValueError:
-            return False
+        return self._storage.remove(message)
+
+    async def delete_many(self, messages: Iterable[AnyMessage]) -> None:
+        self._storage.remove_many(messages)
 
     def reset(self) -> None:
-        self._messages.clear()
+        self._storage.clear()
 
     async def clone(self) -> "UnconstrainedMemory":
         cloned = UnconstrainedMemory()
-        cloned._messages = self._messages.copy()
+        cloned._storage = self._storage.copy()
         return cloned
@@ -8,15 +8,17 @@ from typing import Any
 from pydantic import BaseModel
 
 from beeai_framework.backend import (
+    AssistantMessage,
     ChatModel,
     ChatModelNewTokenEvent,
-    ChatModelOutput,
     ChatModelStartEvent,
     ChatModelSuccessEvent,
+    MessageToolCallContent,
 )
 from beeai_framework.backend.utils import parse_broken_json
 from beeai_framework.context import RunContext, RunMiddlewareProtocol
 from beeai_framework.emitter import Emitter, EmitterOptions, EventMeta
+from beeai_framework.parsers.json_stream import IncrementalJSONParser
 from beeai_framework.tools import AnyTool
 
 
@@ -39,18 +41,22 @@ class StreamToolCallMiddleware(RunMiddlewareProtocol):
 
         self._target = target
         self._key = key
-        self._output = ChatModelOutput(output=[])
-        self._buffer = ""
-        self._delta = ""
         self._match_nested = match_nested
         self._force_streaming = force_streaming
         self._cleanups: list[Callable[[], None]] = []
+        self._reset()
 
-    def bind(self, ctx: "RunContext") -> None:
-        self._output = ChatModelOutput(output=[])
+    def _reset(self) -> None:
+        self._tool_calls: dict[str, _StreamedJSON] = {}
+        self._last_tool_call_id = ""
+        self._text = _StreamedJSON()
+        self._received = False
         self._buffer = ""
         self._delta = ""
 
+    def bind(self, ctx: "RunContext") -> None:
+        self._reset()
+
         self._cleanups.append(
             ctx.instance.emitter.on(
                 lambda meta: isinstance(meta.creator, ChatModel) and meta.name == "start",
@@ -116,25 +122,56 @@ class StreamToolCallMiddleware(RunMiddlewareProtocol):
             data.input.stream_partial_tool_calls = True
 
     async def _handle_success(self, data: ChatModelSuccessEvent, meta: EventMeta) -> None:
-        if self._output.is_empty():
+        if not self._received:
             await self._handle_new_token(ChatModelNewTokenEvent(value=data.value, abort=lambda: None), meta)
 
     async def _handle_new_token(self, data: ChatModelNewTokenEvent, meta: EventMeta) -> None:
-        self._output.merge(data.value)
+        # Only the new deltas are parsed, the state of each tool call (and of the text) is kept between tokens.
+        for message in data.value.output:
+            if not isinstance(message, AssistantMessage):
+                continue
+
+            for chunk in message.content:
+                if isinstance(chunk, MessageToolCallContent):
+                    tool_call_id = chunk.id or self._last_tool_call_id
+                    self._last_tool_call_id = tool_call_id
+                    tool_call = self._tool_calls.setdefault(tool_call_id, _StreamedJSON())
+                    tool_call.name = tool_call.name or chunk.tool_name
+                    if chunk.args:
+                        self._received = True
+                        await self._process(tool_call.name, tool_call.feed(chunk.args))
+                elif chunk.text:
+                    self._received = True
+                    await self._process_text(self._text.feed(chunk.text))
+
+    async def _process_text(self, tool_call: Any) -> None:
+        if not isinstance(tool_call, dict):
+            return
 
-        tool_calls = self._output.get_tool_calls()
-        for tool_call in tool_calls:
-            await self._process(tool_call.tool_name, tool_call.args)
-        else:
-            tool_call = parse_broken_json(self._output.get_text_content(), fallback={}, stream_stable=True)
-            if not isinstance(tool_call, dict):
-                return
+        tool_call = tool_call.get("item", tool_call)  # WrappedRootModel was used
+        if not isinstance(tool_call, dict):
+            return
 
-            tool_call = tool_call.get("item", tool_call)  # WrappedRootModel was used
-            if not isinstance(tool_call, dict):
-                return
+        await self._process(tool_call.get("name", ""), tool_call.get("parameters"))
+
+
+class _StreamedJSON:
+    """Incrementally parsed JSON of a streamed tool call (or text)."""
+
+    __slots__ = ("chunks", "name", "parser")
+
+    def __init__(self) -> None:
+        self.name = ""
+        self.chunks: list[str] = []
+        self.parser = IncrementalJSONParser()
 
-            await self._process(tool_call.get("name", ""), tool_call.get("parameters"))
+    def feed(self, delta: str) -> Any:
+        self.chunks.append(delta)
+        if not self.parser.failed:
+            self.parser.feed(delta)
+        if self.parser.failed:
+            return parse_broken_json("".join(self.chunks), fallback={}, stream_stable=True)
+        return self.parser.value
 
 
 class StreamToolCallMiddlewareUpdateEvent(BaseModel):
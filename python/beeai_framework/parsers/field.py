@@ -7,34 +7,78 @@ from typing import Any, Generic, TypeVar
 from pydantic import BaseModel, RootModel, field_validator
 
 from beeai_framework.backend.utils import parse_broken_json
+from beeai_framework.parsers.json_stream import IncrementalJSONParser
 
 T = TypeVar("T", bound=BaseModel)
 TP = TypeVar("TP")
 
 
 class ParserField(Generic[T]):
-    def __init__(self, schema: type[T], default: T | None = None, *, as_json: bool = True) -> None:
+    def __init__(
+        self, schema: type[T], default: T | None = None, *, as_json: bool = True, incremental: bool = True
+    ) -> None:
+        """
+        Args:
+            schema: The schema of the value.
+            default: The value used when nothing has been written.
+            as_json: Whether the raw value is JSON.
+            incremental: Whether JSON is parsed as it is written (see `IncrementalJSONParser`), so that `get`
+                does not need to parse the whole buffer again.
+        """
         self.schema = schema
-        self.raw = ""
         self.default = default
         self._as_json = as_json
+        self._incremental = incremental
+        self._raw = ""
+        self._chunks: list[str] = []
+        self._parser: IncrementalJSONParser | None = IncrementalJSONParser() if as_json and incremental else None
+
+    @property
+    def raw(self) -> str:
+        if self._chunks:
+            self._raw += "".join(self._chunks)
+            self._chunks.clear()
+        return self._raw
+
+    @raw.setter
+    def raw(self, value: str) -> None:
+        self._raw = ""
+        self._chunks.clear()
+        if self._parser is not None:
+            self._parser = IncrementalJSONParser()
+        self.write(value)
+
+    @property
+    def empty(self) -> bool:
+        return not self._raw and not any(self._chunks)
 
     def write(self, chunk: str) -> None:
-        self.raw += chunk
+        self._chunks.append(chunk)
+        if self._parser is not None and not self._parser.failed:
+            self._parser.feed(chunk)
 
     def get(self) -> T:
-        if self.default is not None and not self.raw:
+        if self.default is not None and self.empty:
             return self.default
 
         if self._as_json:
-            input = parse_broken_json(self.raw)
-            return self.schema.model_validate(input, strict=False)
+            return self.schema.model_validate(self._parse(), strict=False)
         else:
             return self.schema.model_validate_strings(self.raw, strict=False)
 
     def get_partial(self) -> str:
         return self.raw
 
+    def _parse(self) -> Any:
+        parser = self._parser
+        if parser is not None and parser.done:
+            # The parser skips the text around the document, which the lenient parser would take into account.
+            raw = self.raw.strip()
+            if raw[:1] in "{[" and raw[-1:] in "}]":
+                return parser.value
+
+        return parse_broken_json(self.raw)
+
     def end(self) -> None:
         pass
 
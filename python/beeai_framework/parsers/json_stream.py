@@ -0,0 +1,285 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import re
+from typing import Any
+
+__all__ = ["IncrementalJSONParser", "JSONPath"]
+
+JSONPath = tuple[str | int, ...]
+
+_START, _VALUE, _ARRAY_VALUE_OR_END, _KEY_OR_END, _KEY, _COLON, _COMMA_OR_END, _STRING, _SCALAR, _END, _ERROR = range(
+    11
+)
+
+_WHITESPACE = frozenset(" \t\n\r")
+_SCALAR_START = frozenset("-0123456789tfn")
+_SCALAR_CHARS = frozenset("-+.0123456789eEtruefalsn")
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_STRING_SPECIAL = re.compile(r'["\\]')
+_MISSING = object()
+
+
+class _Frame:
+    __slots__ = ("container", "key")
+
+    def __init__(self, container: dict[str, Any] | list[Any]) -> None:
+        self.container = container
+        self.key: str | int = ""
+
+
+class IncrementalJSONParser:
+    """Parses a JSON document which arrives in chunks (for example tool call arguments streamed by an LLM).
+
+    The parser keeps its state between the `feed` calls, so every character is processed only once.
+    The partially parsed document is available at any time via `value`. Unfinished strings and numbers
+    are included, keys without a value are not.
+
+    Any text before the first `{` or `[` (such as a Markdown code fence) and after the end of the document is ignored.
+    Once the parser encounters invalid JSON, it stops and sets `failed`, so the caller can fall back
+    to a more lenient (and slower) parser like `parse_broken_json`.
+    """
+
+    def __init__(self) -> None:
+        self._state = _START
+        self._stack: list[_Frame] = []
+        self._root: Any = _MISSING
+        self._buffer: list[str] = []
+        self._is_key = False
+        self._escape: str | None = None
+        self._surrogates = False
+        self._attached = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole document has been parsed."""
+        return self._state == _END
+
+    @property
+    def failed(self) -> bool:
+        return self._state == _ERROR
+
+    @property
+    def value(self) -> Any:
+        """Returns the (partially) parsed document or None if nothing has been parsed yet.
+
+        The returned containers are updated in place by the subsequent `feed` calls.
+        """
+        if self._state == _STRING and not self._is_key:
+            self._replace(self._materialize_string())
+        elif self._state == _SCALAR:
+            scalar = self._parse_scalar("".join(self._buffer))
+            if scalar is not _MISSING:
+                self._attach_scalar(scalar)
+
+        return None if self._root is _MISSING else self._root
+
+    def feed(self, chunk: str) -> list[tuple[JSONPath, Any]]:
+        """Processes the next chunk of the document.
+
+        Returns:
+            Values (together with their paths) which have been completed by the given chunk.
+        """
+        completed: list[tuple[JSONPath, Any]] = []
+        idx, length = 0, len(chunk)
+        while idx < length:
+            state = self._state
+            if state == _STRING:
+                idx = self._read_string(chunk, idx, completed)
+                continue
+            if state in (_END, _ERROR):
+                break
+
+            char = chunk[idx]
+            if state == _SCALAR:
+                if char in _SCALAR_CHARS:
+                    self._buffer.append(char)
+                    idx += 1
+                else:
+                    self._end_scalar(completed)
+                continue
+
+            idx += 1
+            if char in _WHITESPACE:
+                continue
+
+            if state == _START:
+                if char == "{" or char == "[":
+                    self._open(char)
+            elif state in (_VALUE, _ARRAY_VALUE_OR_END):
+                if char == "]" and isinstance(self._container, list):
+                    self._close(char, completed)
+                else:
+                    self._start_value(char)
+            elif state in (_KEY_OR_END, _KEY):
+                if char == '"':
+                    self._start_string(is_key=True)
+                elif char == "}":
+                    self._close(char, completed)
+                else:
+                    self._state = _ERROR
+            elif state == _COLON:
+                self._state = _VALUE if char == ":" else _ERROR
+            elif state == _COMMA_OR_END:
+                if char == ",":
+                    self._state = _KEY if isinstance(self._container, dict) else _VALUE
+                elif char == "}" or char == "]":
+                    self._close(char, completed)
+                else:
+                    self._state = _ERROR
+
+        return completed
+
+    @property
+    def _container(self) -> dict[str, Any] | list[Any] | None:
+        return self._stack[-1].container if self._stack else None
+
+    def _path(self) -> JSONPath:
+        return tuple(frame.key for frame in self._stack)
+
+    def _start_value(self, char: str) -> None:
+        if char == "{" or char == "[":
+            self._open(char)
+        elif char == '"':
+            self._start_string(is_key=False)
+            self._attach("")
+        elif char in _SCALAR_START:
+            self._state = _SCALAR
+            self._buffer = [char]
+            self._attached = False
+        else:
+            self._state = _ERROR
+
+    def _attach(self, value: Any) -> None:
+        if not self._stack:
+            self._root = value
+            return
+
+        frame = self._stack[-1]
+        if isinstance(frame.container, dict):
+            frame.container[frame.key] = value  # type: ignore[index]
+        else:
+            frame.container.append(value)
+            frame.key = len(frame.container) - 1
+
+    def _replace(self, value: Any) -> None:
+        if not self._stack:
+            self._root = value
+        else:
+            frame = self._stack[-1]
+            frame.container[frame.key] = value  # type: ignore[index]
+
+    def _open(self, char: str) -> None:
+        container: dict[str, Any] | list[Any] = {} if char == "{" else []
+        self._attach(container)
+        self._stack.append(_Frame(container))
+        self._state = _KEY_OR_END if char == "{" else _ARRAY_VALUE_OR_END
+
+    def _close(self, char: str, completed: list[tuple[JSONPath, Any]]) -> None:
+        frame = self._stack[-1]
+        if (char == "}") != isinstance(frame.container, dict):
+            self._state = _ERROR
+            return
+
+        self._stack.pop()
+        completed.append((self._path(), frame.container))
+        self._end_value()
+
+    def _end_value(self) -> None:
+        self._state = _COMMA_OR_END if self._stack else _END
+
+    def _start_string(self, *, is_key: bool) -> None:
+        self._state = _STRING
+        self._is_key = is_key
+        self._buffer = []
+        self._escape = None
+        self._surrogates = False
+
+    def _read_string(self, chunk: str, idx: int, completed: list[tuple[JSONPath, Any]]) -> int:
+        length = len(chunk)
+        while idx < length:
+            if self._escape is not None:
+                idx = self._read_escape(chunk, idx)
+                continue
+
+            match = _STRING_SPECIAL.search(chunk, idx)
+            if match is None:
+                self._buffer.append(chunk[idx:])
+                return length
+
+            end = match.start()
+            if end > idx:
+                self._buffer.append(chunk[idx:end])
+            if chunk[end] == "\\":
+                self._escape = ""
+                idx = end + 1
+                continue
+
+            text = self._materialize_string()
+            if self._is_key:
+                self._stack[-1].key = text
+                self._state = _COLON
+            else:
+                self._replace(text)
+                completed.append((self._path(), text))
+                self._end_value()
+            return end + 1
+
+        return idx
+
+    def _read_escape(self, chunk: str, idx: int) -> int:
+        assert self._escape is not None
+        if not self._escape:
+            char = chunk[idx]
+            if char == "u":
+                self._escape = "u"
+            else:
+                self._buffer.append(_ESCAPES.get(char, char))
+                self._escape = None
+            return idx + 1
+
+        missing = 5 - len(self._escape)
+        self._escape += chunk[idx : idx + missing]
+        if len(self._escape) == 5:
+            try:
+                code = int(self._escape[1:], 16)
+            except ValueError:
+                self._state = _ERROR
+                return len(chunk)
+
+            self._surrogates = self._surrogates or 0xD800 <= code <= 0xDFFF
+            self._buffer.append(chr(code))
+            self._escape = None
+        return idx + missing
+
+    def _materialize_string(self) -> str:
+        text = "".join(self._buffer)
+        self._buffer = [text]
+        if self._surrogates:
+            text = text.encode("utf-16", "surrogatepass").decode("utf-16", "surrogatepass")
+        return text
+
+    def _attach_scalar(self, value: Any) -> None:
+        if self._attached:
+            self._replace(value)
+        else:
+            self._attach(value)
+            self._attached = True
+
+    def _end_scalar(self, completed: list[tuple[JSONPath, Any]]) -> None:
+        scalar = self._parse_scalar("".join(self._buffer))
+        if scalar is _MISSING:
+            self._state = _ERROR
+            return
+
+        self._attach_scalar(scalar)
+        completed.append((self._path(), scalar))
+        self._end_value()
+
+    @staticmethod
+    def _parse_scalar(text: str) -> Any:
+        try:
+            return json.loads(text)
+        except ValueError:
+            return _MISSING
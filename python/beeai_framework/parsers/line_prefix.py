@@ -1,7 +1,9 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any, NoReturn
 
@@ -22,12 +24,14 @@ class LinePrefixParserUpdate(BaseModel):
     field: InstanceOf[ParserField[Any]]
 
 
-class LinePrefixParserLine(BaseModel):
+@dataclass(slots=True)
+class LinePrefixParserLine:
     value: str
     new_line: bool
 
 
-class LinePrefixParserExtractedLine(BaseModel):
+@dataclass(slots=True)
+class LinePrefixParserExtractedLine:
     key: str
     value: str
     partial: bool
@@ -52,7 +56,7 @@ Nodes = dict[str, LinePrefixParserNode]
 Customizer = Callable[[Nodes, LinePrefixParserOptions], tuple[Nodes, LinePrefixParserOptions]]
 
 
-def _lines_to_string(lines: list["LinePrefixParserLine"]) -> str:
+def _lines_to_string(lines: Iterable[LinePrefixParserLine]) -> str:
     result = ""
     for line in lines:
         if line.new_line:
@@ -62,6 +66,55 @@ def _lines_to_string(lines: list["LinePrefixParserLine"]) -> str:
     return result
 
 
+@dataclass(slots=True)
+class _PrefixTrieNode:
+    children: dict[str, "_PrefixTrieNode"] = field(default_factory=dict)
+    # key of the node whose (lower-cased) prefix ends here
+    key: str | None = None
+    # the shortest prefix passing through this node, used to resolve partial matches
+    shortest: tuple[int, int, str] | None = None
+
+
+class _PrefixTrie:
+    """Case-insensitive prefix matcher compiled from the parser nodes.
+
+    Matches a line against all prefixes in a single pass. The shortest matching prefix wins (the first defined one
+    if there are more of the same length). A line which is a beginning of some prefix is reported as a partial match.
+    """
+
+    def __init__(self, nodes: Nodes) -> None:
+        self._root = _PrefixTrieNode()
+        for order, (key, node) in enumerate(nodes.items()):
+            prefix = node.prefix.lower()
+            rank = (len(prefix), order, key)
+            current = self._root
+            for char in prefix:
+                if current.shortest is None or rank < current.shortest:
+                    current.shortest = rank
+                current = current.children.setdefault(char, _PrefixTrieNode())
+            if current.key is None:
+                current.key = key
+
+    def match(self, line: str) -> LinePrefixParserExtractedLine | None:
+        current = self._root
+        if current.key is not None:
+            return LinePrefixParserExtractedLine(key=current.key, value=line, partial=False)
+
+        for idx, char in enumerate(line.lower()):
+            next_node = current.children.get(char)
+            if next_node is None:
+                return None
+            current = next_node
+            if current.key is not None:
+                return LinePrefixParserExtractedLine(
+                    key=current.key, value=trim_left_spaces(line[idx + 1 :]), partial=False
+                )
+
+        if current.shortest is None:
+            return None
+        return LinePrefixParserExtractedLine(key=current.shortest[2], value=line, partial=True)
+
+
 class LinePrefixParser:
     def __init__(self, nodes: Nodes, options: LinePrefixParserOptions | None = None) -> None:
         if options is None:
@@ -76,7 +129,7 @@ class LinePrefixParser:
                 "partial_update": LinePrefixParserUpdate,
             },
         )
-        self._lines: list[LinePrefixParserLine] = []
+        self._lines: deque[LinePrefixParserLine] = deque()
         self._excluded_lines: list[LinePrefixParserLine] = []
         self._done: bool = False
         self._last_node_key: str | None = None
@@ -101,6 +154,8 @@ class LinePrefixParser:
         if not has_end_node:
             raise ValueError("At least one end node must be provided!")
 
+        self._trie = _PrefixTrie(self._nodes)
+
     @property
     def done(self) -> bool:
         return self._done
@@ -135,7 +190,7 @@ class LinePrefixParser:
             if is_last_line and ((parsed_line is not None and parsed_line.partial) or not line.value):
                 break
 
-            self._lines.pop(0)
+            self._lines.popleft()
 
             if parsed_line and not parsed_line.partial:
                 assert parsed_line is not None
@@ -165,20 +220,20 @@ class LinePrefixParser:
                 node = self._nodes[parsed_line.key]
                 node.field.write(parsed_line.value)
                 await self._emit_partial_update(
-                    LinePrefixParserUpdate(
+                    LinePrefixParserUpdate.model_construct(
                         key=parsed_line.key, value=parsed_line.value, delta=parsed_line.value, field=node.field
                     )
                 )
                 self._last_node_key = parsed_line.key
             elif self._last_node_key:
-                if not self._nodes[self._last_node_key].field.raw:
+                if self._nodes[self._last_node_key].field.empty:
                     line.value = trim_left_spaces(line.value)
                 if line.new_line:
                     line.value = NEW_LINE_CHARACTER + line.value
                 node = self._nodes[self._last_node_key]
                 node.field.write(line.value)
                 await self._emit_partial_update(
-                    LinePrefixParserUpdate(
+                    LinePrefixParserUpdate.model_construct(
                         key=self._last_node_key, value=node.field.get_partial(), delta=line.value, field=node.field
                     )
                 )
@@ -187,7 +242,7 @@ class LinePrefixParser:
 
     def _throw_with_context(self, message: str, reason: str, extra: dict[str, Any] | None = None) -> NoReturn:
         extra = extra or {}
-        context_lines = self._lines + ([extra["line"]] if "line" in extra else [])
+        context_lines = [*self._lines, *([extra["line"]] if "line" in extra else [])]
         context = {
             "lines": _lines_to_string(context_lines),
             "excludedLines": _lines_to_string(self._excluded_lines),
@@ -202,7 +257,7 @@ class LinePrefixParser:
             return self.final_state
 
         if not self._last_node_key and self._options.fallback:
-            stash = _lines_to_string(self._excluded_lines + self._lines)
+            stash = _lines_to_string([*self._excluded_lines, *self._lines])
             self._excluded_lines.clear()
             self._lines.clear()
             fallback_nodes = self._options.fallback(stash)
@@ -222,7 +277,9 @@ class LinePrefixParser:
         if stash:
             field.write(stash)
             await self._emit_partial_update(
-                LinePrefixParserUpdate(key=self._last_node_key, value=field.get_partial(), delta=stash, field=field)
+                LinePrefixParserUpdate.model_construct(
+                    key=self._last_node_key, value=field.get_partial(), delta=stash, field=field
+                )
             )
         await self._emit_final_update(self._last_node_key, field)
         current_node = self._nodes[self._last_node_key]
@@ -263,29 +320,12 @@ class LinePrefixParser:
                 LinePrefixParserError.Reason.InvalidSchema,
             )
 
-    @property
-    def _normalized_nodes(self) -> list[tuple[str, dict[str, Any]]]:
-        sorted_nodes = sorted(self._nodes.items(), key=lambda item: len(item[1].prefix))
-        return [(key, {"lowerCasePrefix": node.prefix.lower(), "ref": node}) for key, node in sorted_nodes]
-
     def _extract_line(self, line: str) -> LinePrefixParserExtractedLine | None:
         trimmed_line = trim_left_spaces(line)
         if not trimmed_line:
             return None
 
-        for key, node_info in self._normalized_nodes:
-            lower_case_prefix = node_info["lowerCasePrefix"]
-            partial = len(lower_case_prefix) > len(trimmed_line)
-            if partial:
-                a, b = lower_case_prefix, trimmed_line
-            else:
-                a, b = trimmed_line, lower_case_prefix
-
-            if a.lower().startswith(b.lower()):
-                value = trimmed_line if partial else trim_left_spaces(trimmed_line[len(b) :])
-                return LinePrefixParserExtractedLine(key=key, value=value, partial=partial)
-
-        return None
+        return self._trie.match(trimmed_line)
 
 
 class LinePrefixParserError(FrameworkError):
@@ -4,7 +4,7 @@
 import functools
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
-from typing import Any, Generic, TypeAlias, TypedDict, Unpack
+from typing import Any, Generic, TypeAlias, TypedDict, Unpack, overload
 
 from pydantic import BaseModel, ConfigDict, InstanceOf
 from typing_extensions import ParamSpec, TypeVar
@@ -86,7 +86,13 @@ class Runnable(Generic[R], ABC):
         return self._middlewares
 
 
-def runnable_entry(handler: Callable[P, Awaitable[R]]) -> Callable[P, Run[R]]:
+@overload
+def runnable_entry(handler: Callable[P, Awaitable[R]], /) -> Callable[P, Run[R]]: ...
+@overload
+def runnable_entry(*, lightweight: bool = False) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Run[R]]]: ...
+def runnable_entry(
+    handler: Callable[P, Awaitable[R]] | None = None, /, *, lightweight: bool = False
+) -> Callable[P, Run[R]] | Callable[[Callable[P, Awaitable[R]]], Callable[P, Run[R]]]:
     """A decorator that wraps the runnable into an execution context.
 
     For example:
@@ -96,35 +102,42 @@ def runnable_entry(handler: Callable[P, Awaitable[R]]) -> Callable[P, Run[R]]:
             ctx = RunContext.get()
             # ... runnable logic ...
             return RunnableOutput(output=...)
-    """
-
-    @functools.wraps(handler)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Run[R]:
-        """Wrapper that automates the call to RunContext.enter()."""
-
-        async def inner(_: RunContext) -> R:
-            return await handler(*args, **kwargs)
 
-        self = args[0] if args else None
-        if not isinstance(self, Runnable):
-            raise TypeError("The first argument of a runnable's run method must be a Runnable instance.")
-
-        if len(args) < 2:
-            raise ValueError("The positional input argument is required.")
+    Runnables that are typically invoked from other runs (models, tools, ...) can use
+    `@runnable_entry(lightweight=True)` to reduce the per-run overhead (see `RunContext.enter`).
+    """
 
-        runnable_kwargs: RunnableOptions = kwargs  # type: ignore
-        return (
-            RunContext.enter(
-                self,
-                inner,
-                signal=runnable_kwargs.get("signal", None),
-                run_params={"input": args[1], **exclude_keys(kwargs, {"signal", "input"})},
+    def decorator(handler: Callable[P, Awaitable[R]]) -> Callable[P, Run[R]]:
+        @functools.wraps(handler)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Run[R]:
+            """Wrapper that automates the call to RunContext.enter()."""
+
+            async def inner(_: RunContext) -> R:
+                return await handler(*args, **kwargs)
+
+            self = args[0] if args else None
+            if not isinstance(self, Runnable):
+                raise TypeError("The first argument of a runnable's run method must be a Runnable instance.")
+
+            if len(args) < 2:
+                raise ValueError("The positional input argument is required.")
+
+            runnable_kwargs: RunnableOptions = kwargs  # type: ignore
+            return (
+                RunContext.enter(
+                    self,
+                    inner,
+                    signal=runnable_kwargs.get("signal", None),
+                    run_params={"input": args[1], **exclude_keys(kwargs, {"signal", "input"})},
+                    lightweight=lightweight,
+                )
+                .middleware(*self.middlewares)
+                .context(runnable_kwargs.get("context") or {})
             )
-            .middleware(*self.middlewares)
-            .context(runnable_kwargs.get("context") or {})
-        )
 
-    return wrapper
+        return wrapper
+
+    return decorator(handler) if handler is not None else decorator
 
 
 AnyRunnable: TypeAlias = Runnable[Any]
@@ -1,7 +1,8 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+from beeai_framework.serve.file_memory_manager import FileMemoryManager
 from beeai_framework.serve.server import Server
 from beeai_framework.serve.utils import MemoryManager, init_agent_memory
 
-__all__ = ["MemoryManager", "Server", "init_agent_memory"]
+__all__ = ["FileMemoryManager", "MemoryManager", "Server", "init_agent_memory"]
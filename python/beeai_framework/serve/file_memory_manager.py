@@ -0,0 +1,349 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import contextlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from cachetools import LRUCache
+
+from beeai_framework.backend.message import AnyMessage
+from beeai_framework.memory import BaseMemory, UnconstrainedMemory
+from beeai_framework.serve.utils import MemoryManager
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    namespace TEXT NOT NULL,
+    id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, id)
+);
+CREATE INDEX IF NOT EXISTS sessions_updated_at ON sessions (namespace, updated_at);
+CREATE TABLE IF NOT EXISTS messages (
+    namespace TEXT NOT NULL,
+    session TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (namespace, session, position)
+);
+"""
+
+
+class FileMemoryManager(MemoryManager):
+    """Persistent memory manager backed by a local SQLite database (in WAL mode).
+
+    Conversations survive restarts and can be shared by multiple worker processes that point to the same file.
+    The returned memories write every change through to the database (appended messages are stored as new rows,
+    other changes rewrite the session), so servers keep working with them as with in-process memories.
+    Agents typically reset their memory and add the whole history again on every run. When the re-added messages
+    start with the already stored ones, only the new messages are written.
+
+    Message histories are loaded lazily (when the session is requested) and recently used sessions are kept
+    in-process. A cached session is reloaded when another process has changed it in the meantime.
+
+    Messages are serialized with `pickle` by default. Only load files that you trust.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        ttl: float | None = None,
+        max_messages: int | None = None,
+        memory_factory: Callable[[], BaseMemory] = UnconstrainedMemory,
+        cache_size: int = 128,
+        namespace: str = "default",
+        serialize: Callable[[AnyMessage], bytes] = pickle.dumps,
+        deserialize: Callable[[bytes], AnyMessage] = pickle.loads,
+        timeout: float = 30,
+    ) -> None:
+        """
+        Args:
+            path: The path to the database file. Missing parent directories are created.
+            ttl: The number of seconds of inactivity after which a session expires.
+            max_messages: The maximum number of messages per session. The oldest messages are dropped first.
+            memory_factory: Creates the memory for a session restored from the database.
+            cache_size: The maximum number of sessions kept in-process.
+            namespace: Separates independent managers stored in the same file.
+            serialize: Converts a message to bytes.
+            deserialize: Converts bytes back to a message.
+            timeout: How long (in seconds) to wait for a lock held by another connection or process.
+        """
+        if max_messages is not None and max_messages <= 0:
+            raise ValueError("The 'max_messages' parameter must be a positive integer.")
+
+        self._path = Path(path)
+        self._ttl = ttl
+        self._max_messages = max_messages
+        self._memory_factory = memory_factory
+        self._namespace = namespace
+        self._serialize = serialize
+        self._deserialize = deserialize
+        self._timeout = timeout
+        self._sessions: LRUCache[str, _SessionMemory] = LRUCache(cache_size)
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def source(self) -> Path:
+        return self._path
+
+    async def set(self, key: str, value: BaseMemory) -> None:
+        if isinstance(value, _SessionMemory):
+            value = value.memory
+
+        session = _SessionMemory(value, manager=self, key=key)
+        await session.flush(rewrite=True)
+        self._sessions[key] = session
+
+    async def get(self, key: str) -> BaseMemory:
+        version: int | None = await asyncio.to_thread(self._execute, self._touch_sync, key)
+        if version is None:
+            self._sessions.pop(key, None)
+            raise KeyError(key)
+
+        session = self._sessions.get(key)
+        if session is None or session.version != version:
+            version, messages = await asyncio.to_thread(self._execute, self._load_sync, key)
+            memory = self._memory_factory()
+            await memory.add_many(messages)
+            session = _SessionMemory(memory, manager=self, key=key, version=version, persisted=len(messages))
+            self._sessions[key] = session
+        return session
+
+    async def contains(self, key: str) -> bool:
+        return await asyncio.to_thread(self._execute, self._version_sync, key) is not None
+
+    async def delete(self, key: str) -> bool:
+        self._sessions.pop(key, None)
+        return await asyncio.to_thread(self._execute, self._delete_sync, key)
+
+    async def close(self) -> None:
+        """Closes the underlying database connection. It is reopened on the next operation."""
+        await asyncio.to_thread(self._close_sync)
+
+    async def _save(self, key: str, messages: list[AnyMessage], *, start: int, version: int | None) -> int:
+        return await asyncio.to_thread(self._execute, self._save_sync, key, messages, start, version)
+
+    def _execute(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._connect()
+            return fn(self._connection, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _close_sync(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _expires_before(self) -> float:
+        return time.time() - self._ttl if self._ttl is not None else float("-inf")
+
+    def _version_sync(self, db: sqlite3.Connection, key: str) -> int | None:
+        row = db.execute(
+            "SELECT version FROM sessions WHERE namespace = ? AND id = ? AND updated_at > ?",
+            (self._namespace, key, self._expires_before()),
+        ).fetchone()
+        return None if row is None else int(row[0])
+
+    def _touch_sync(self, db: sqlite3.Connection, key: str) -> int | None:
+        version = self._version_sync(db, key)
+        if version is not None and self._ttl is not None:
+            db.execute(
+                "UPDATE sessions SET updated_at = ? WHERE namespace = ? AND id = ?", (time.time(), self._namespace, key)
+            )
+        return version
+
+    def _load_sync(self, db: sqlite3.Connection, key: str) -> tuple[int, list[AnyMessage]]:
+        with _transaction(db, immediate=False):
+            row = db.execute(
+                "SELECT version FROM sessions WHERE namespace = ? AND id = ?", (self._namespace, key)
+            ).fetchone()
+            if row is None:
+                raise KeyError(key)
+            rows = db.execute(
+                "SELECT data FROM messages WHERE namespace = ? AND session = ? ORDER BY position",
+                (self._namespace, key),
+            ).fetchall()
+        return int(row[0]), [self._deserialize(bytes(data)) for (data,) in rows]
+
+    def _save_sync(
+        self, db: sqlite3.Connection, key: str, messages: list[AnyMessage], start: int, version: int | None
+    ) -> int:
+        with _transaction(db):
+            self._purge_expired(db)
+            current = db.execute(
+                "SELECT version FROM sessions WHERE namespace = ? AND id = ?", (self._namespace, key)
+            ).fetchone()
+            if current is None or int(current[0]) != version:
+                # the session has expired or has been changed by someone else in the meantime (last write wins)
+                start = 0
+            if start == 0:
+                db.execute("DELETE FROM messages WHERE namespace = ? AND session = ?", (self._namespace, key))
+            db.executemany(
+                "INSERT OR REPLACE INTO messages (namespace, session, position, data) VALUES (?, ?, ?, ?)",
+                (
+                    (self._namespace, key, position, self._serialize(messages[position]))
+                    for position in range(start, len(messages))
+                ),
+            )
+            new_version = int(current[0]) + 1 if current is not None else 1
+            db.execute(
+                "INSERT OR REPLACE INTO sessions (namespace, id, version, updated_at) VALUES (?, ?, ?, ?)",
+                (self._namespace, key, new_version, time.time()),
+            )
+        return new_version
+
+    def _delete_sync(self, db: sqlite3.Connection, key: str) -> bool:
+        with _transaction(db):
+            db.execute("DELETE FROM messages WHERE namespace = ? AND session = ?", (self._namespace, key))
+            cursor = db.execute("DELETE FROM sessions WHERE namespace = ? AND id = ?", (self._namespace, key))
+        return cursor.rowcount > 0
+
+    def _purge_expired(self, db: sqlite3.Connection) -> None:
+        if self._ttl is None:
+            return
+
+        expires_before = self._expires_before()
+        db.execute(
+            "DELETE FROM messages WHERE namespace = ? AND session IN "
+            "(SELECT id FROM sessions WHERE namespace = ? AND updated_at <= ?)",
+            (self._namespace, self._namespace, expires_before),
+        )
+        db.execute("DELETE FROM sessions WHERE namespace = ? AND updated_at <= ?", (self._namespace, expires_before))
+
+
+class _SessionMemory(BaseMemory):
+    """Memory of a single session which writes all changes through to the FileMemoryManager.
+
+    The reset is persisted by a background flush. The stored messages are remembered until then, so that
+    the common `reset()` + `add_many(history + new_messages)` sequence only appends the new messages.
+    """
+
+    def __init__(
+        self,
+        memory: BaseMemory,
+        *,
+        manager: FileMemoryManager | None,
+        key: str,
+        version: int | None = None,
+        persisted: int = 0,
+    ) -> None:
+        self._memory = memory
+        self._manager = manager
+        self._key = key
+        self._version = version
+        self._persisted = persisted
+        self._rewrite = False
+        self._reset_messages: list[AnyMessage] | None = None
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def memory(self) -> BaseMemory:
+        return self._memory
+
+    @property
+    def version(self) -> int | None:
+        return self._version
+
+    @property
+    def messages(self) -> list[AnyMessage]:
+        return self._memory.messages
+
+    async def add(self, message: AnyMessage, index: int | None = None) -> None:
+        await self.add_many([message], index)
+
+    async def add_many(self, messages: Iterable[AnyMessage], start: int | None = None) -> None:
+        messages = list(messages)
+        length = len(self.messages)
+        await self._memory.add_many(messages, start)
+        appended = len(self.messages) == length + len(messages) and all(
+            a is b for a, b in zip(self.messages[length:], messages, strict=True)
+        )
+        if appended and length == 0 and self._reset_messages is not None:
+            # the stored messages have been added again, the reset does not need to be persisted
+            persisted = self._reset_messages
+            if len(messages) >= len(persisted) and all(a is b for a, b in zip(messages, persisted, strict=False)):
+                self._rewrite = False
+        await self.flush(rewrite=not appended)
+
+    async def delete(self, message: AnyMessage) -> bool:
+        deleted = await self._memory.delete(message)
+        if deleted:
+            await self.flush(rewrite=True)
+        return deleted
+
+    async def delete_many(self, messages: Iterable[AnyMessage]) -> None:
+        length = len(self.messages)
+        await self._memory.delete_many(messages)
+        if len(self.messages) != length:
+            await self.flush(rewrite=True)
+
+    def reset(self) -> None:
+        if not self._rewrite:
+            self._reset_messages = self.messages[: self._persisted]
+        self._memory.reset()
+        self._rewrite = True
+        with contextlib.suppress(RuntimeError):  # no running event loop, the next change is going to persist it
+            task = asyncio.get_running_loop().create_task(self.flush())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def flush(self, *, rewrite: bool = False) -> None:
+        """Persists the pending changes."""
+        if self._manager is None:
+            return
+
+        self._rewrite = self._rewrite or rewrite
+        async with self._lock:
+            max_messages = self._manager._max_messages
+            if max_messages is not None and len(self.messages) > max_messages:
+                await self._memory.delete_many(self.messages[: len(self.messages) - max_messages])
+                self._rewrite = True
+
+            messages = self.messages.copy()
+            rewrite, self._rewrite = self._rewrite or self._persisted > len(messages), False
+            self._reset_messages = None
+            start = 0 if rewrite else self._persisted
+            if start == len(messages) and not rewrite and self._version is not None:
+                return
+
+            try:
+                self._version = await self._manager._save(self._key, messages, start=start, version=self._version)
+                self._persisted = len(messages)
+            except BaseException:
+                self._rewrite = True
+                raise
+
+    async def clone(self) -> "_SessionMemory":
+        return _SessionMemory(await self._memory.clone(), manager=None, key=self._key)
+
+
+@contextlib.contextmanager
+def _transaction(db: sqlite3.Connection, *, immediate: bool = True) -> Iterator[None]:
+    db.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    try:
+        yield
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    else:
+        db.execute("COMMIT")
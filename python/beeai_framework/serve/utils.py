@@ -1,11 +1,13 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
-from collections.abc import Callable
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from typing import Protocol
 
-from cachetools import LRUCache
-
 from beeai_framework.agents import AnyAgent
+from beeai_framework.backend.message import AnyMessage
+from beeai_framework.cache.types import CacheStats
 from beeai_framework.logger import Logger
 from beeai_framework.memory import BaseMemory
 
@@ -34,18 +36,236 @@ class UnlimitedMemoryManager(MemoryManager):
         return key in self._memory
 
 
+def estimate_message_size(message: AnyMessage) -> int:
+    """Approximates the size of a message (in bytes) by the size of its UTF-8 encoded JSON representation."""
+    return len(str(message).encode())
+
+
 class LRUMemoryManager(MemoryManager):
-    def __init__(self, maxsize: int, getsizeof: Callable[[BaseMemory], int] | None = None) -> None:
-        self._cache: LRUCache[str, BaseMemory] = LRUCache(maxsize, getsizeof)
+    """Keeps the memories of the recently used sessions in-process.
+
+    Besides the number of sessions, the capacity can be limited by the total size of the stored messages.
+    Sizes are tracked as messages are added to the returned memories, so sessions which grow after being stored
+    are accounted for. The least recently used sessions are evicted first.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        getsizeof: Callable[[BaseMemory], int] | None = None,
+        *,
+        max_bytes: int | None = None,
+        max_session_bytes: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[[AnyMessage], int] = estimate_message_size,
+    ) -> None:
+        """
+        Args:
+            maxsize: The maximum number of sessions (or their total weight if `getsizeof` is set).
+            getsizeof: Computes the weight of a memory when it is stored.
+            max_bytes: The maximum total size of the messages in all sessions.
+            max_session_bytes: The maximum size of the messages in a single session.
+                The oldest messages of the session are dropped first (the last message is always kept).
+            ttl: The number of seconds of inactivity after which a session expires.
+            sizeof: Computes the size of a single message.
+        """
+        if maxsize <= 0:
+            raise ValueError("The 'maxsize' parameter must be a positive integer.")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("The 'max_bytes' parameter must be a positive integer.")
+        if max_session_bytes is not None and max_session_bytes <= 0:
+            raise ValueError("The 'max_session_bytes' parameter must be a positive integer.")
+
+        self._maxsize = maxsize
+        self._getsizeof = getsizeof
+        self._max_bytes = max_bytes
+        self._max_session_bytes = max_session_bytes
+        self._ttl = ttl
+        self._sizeof = sizeof
+        self._sessions: OrderedDict[str, _TrackedMemory] = OrderedDict()
+        self._accessed_at: dict[str, float] = {}
+        self._weights: dict[str, int] = {}
+        self._total_weight = 0
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def size(self) -> int:
+        """The number of stored sessions."""
+        return len(self._sessions)
+
+    @property
+    def bytes(self) -> int:
+        """The total size of the messages in all sessions."""
+        return self._total_bytes
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns the statistics collected since the manager was created (or since the last `reset_stats` call)."""
+        return CacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions, bytes=self._total_bytes)
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     async def set(self, key: str, value: BaseMemory) -> None:
-        self._cache[key] = value
+        if isinstance(value, _TrackedMemory):
+            value = value.memory
+
+        weight = self._getsizeof(value) if self._getsizeof is not None else 1
+        if weight > self._maxsize:
+            raise ValueError("The memory is too large to be stored.")
+
+        self._expire()
+        self._remove(key)
+        session = _TrackedMemory(value, manager=self, key=key)
+        self._sessions[key] = session
+        self._accessed_at[key] = time.monotonic()
+        self._weights[key] = weight
+        self._total_weight += weight
+        self._total_bytes += session.bytes
+        await session.enforce_limit()
+        self._evict(keep=key)
 
     async def get(self, key: str) -> BaseMemory:
-        return self._cache[key]
+        self._expire()
+        session = self._sessions.get(key)
+        if session is None:
+            self._misses += 1
+            raise KeyError(key)
+
+        self._hits += 1
+        self._touch(key)
+        return session
 
     async def contains(self, key: str) -> bool:
-        return key in self._cache
+        self._expire()
+        return key in self._sessions
+
+    def _touch(self, key: str) -> None:
+        self._sessions.move_to_end(key)
+        self._accessed_at[key] = time.monotonic()
+
+    def _on_resize(self, key: str, delta: int) -> None:
+        self._total_bytes += delta
+        self._touch(key)
+        self._evict(keep=key)
+
+    def _remove(self, key: str) -> None:
+        session = self._sessions.pop(key, None)
+        if session is None:
+            return
+
+        session.detach()
+        del self._accessed_at[key]
+        self._total_weight -= self._weights.pop(key)
+        self._total_bytes -= session.bytes
+
+    def _expire(self) -> None:
+        if self._ttl is None:
+            return
+
+        expires_before = time.monotonic() - self._ttl
+        while self._sessions:
+            key = next(iter(self._sessions))
+            if self._accessed_at[key] > expires_before:
+                break
+            self._remove(key)
+            self._evictions += 1
+
+    def _evict(self, *, keep: str) -> None:
+        """Removes the least recently used sessions (except the given one) until the limits are met."""
+        while self._total_weight > self._maxsize or (
+            self._max_bytes is not None and self._total_bytes > self._max_bytes
+        ):
+            key = next((key for key in self._sessions if key != keep), None)
+            if key is None:
+                break
+            self._remove(key)
+            self._evictions += 1
+
+
+class _TrackedMemory(BaseMemory):
+    """Memory of a single session which reports its size changes to the LRUMemoryManager."""
+
+    def __init__(self, memory: BaseMemory, *, manager: LRUMemoryManager | None, key: str) -> None:
+        self._memory = memory
+        self._manager = manager
+        self._key = key
+        self._sizeof = manager._sizeof if manager is not None else estimate_message_size
+        self._bytes = self._count()
+
+    @property
+    def memory(self) -> BaseMemory:
+        return self._memory
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def messages(self) -> list[AnyMessage]:
+        return self._memory.messages
+
+    def detach(self) -> None:
+        self._manager = None
+
+    async def add(self, message: AnyMessage, index: int | None = None) -> None:
+        await self.add_many([message], index)
+
+    async def add_many(self, messages: Iterable[AnyMessage], start: int | None = None) -> None:
+        messages = list(messages)
+        length = len(self.messages)
+        await self._memory.add_many(messages, start)
+        if len(self.messages) == length + len(messages):
+            self._resize(sum(map(self._sizeof, messages)))
+        else:
+            self._resize(self._count() - self._bytes)
+        await self.enforce_limit()
+
+    async def delete(self, message: AnyMessage) -> bool:
+        deleted = await self._memory.delete(message)
+        if deleted:
+            self._resize(-self._sizeof(message))
+        return deleted
+
+    async def delete_many(self, messages: Iterable[AnyMessage]) -> None:
+        length = len(self.messages)
+        await self._memory.delete_many(messages)
+        if len(self.messages) != length:
+            self._resize(self._count() - self._bytes)
+
+    def reset(self) -> None:
+        self._memory.reset()
+        self._resize(-self._bytes)
+
+    async def enforce_limit(self) -> None:
+        """Drops the oldest messages until the session fits into its size limit."""
+        limit = self._manager._max_session_bytes if self._manager is not None else None
+        if limit is None or self._bytes <= limit:
+            return
+
+        excess, dropped = self._bytes - limit, []
+        for message in self.messages[:-1]:
+            if excess <= 0:
+                break
+            excess -= self._sizeof(message)
+            dropped.append(message)
+        await self.delete_many(dropped)
+
+    def _count(self) -> int:
+        return sum(map(self._sizeof, self.messages))
+
+    def _resize(self, delta: int) -> None:
+        self._bytes += delta
+        if self._manager is not None and delta:
+            self._manager._on_resize(self._key, delta)
+
+    async def clone(self) -> "_TrackedMemory":
+        return _TrackedMemory(await self._memory.clone(), manager=None, key=self._key)
 
 
 async def init_agent_memory(
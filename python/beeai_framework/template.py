@@ -1,10 +1,12 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 from collections.abc import Callable
 from typing import Any, Generic, Self, TypeVar, overload
 
 import chevron
+from chevron.tokenizer import tokenize
 from deprecated import deprecated
 from pydantic import BaseModel, Field
 
@@ -13,6 +15,18 @@ from beeai_framework.utils.models import ModelLike, to_model_optional
 
 T = TypeVar("T", bound=BaseModel)
 
+CompiledTemplate = tuple[tuple[str, str], ...]
+
+
+@functools.lru_cache(maxsize=512)
+def compile_template(template: str) -> CompiledTemplate:
+    """Tokenizes the given Mustache template.
+
+    The result is cached process-wide (keyed by the template text), so the same template is parsed only once,
+    regardless of how many PromptTemplate instances use it.
+    """
+    return tuple(tokenize(template))
+
 
 class PromptTemplateInput(BaseModel, Generic[T]):
     input_schema: type[T] = Field(..., alias="schema")
@@ -81,6 +95,11 @@ class PromptTemplate(Generic[T]):
         )
 
     def render(self, template_input: ModelLike[T] | None = None, /, **kwargs: Any) -> str:
+        data = self.resolve(template_input, **kwargs)
+        return chevron.render(template=self.compiled, data=data)
+
+    def resolve(self, template_input: ModelLike[T] | None = None, /, **kwargs: Any) -> dict[str, Any]:
+        """Returns the data the template is rendered with (the input with defaults and function derived values)."""
         input_model = to_model_optional(self._config.input_schema, template_input)
         data = input_model.model_dump() if input_model else kwargs
 
@@ -95,7 +114,7 @@ class PromptTemplate(Generic[T]):
                 raise PromptTemplateError(f"Function named '{key}' clashes with input data field!")
             data[key] = self._config.functions[key](data)
 
-        return chevron.render(template=self._config.template, data=data)
+        return data
 
     def fork(
         self, customizer: Callable[[PromptTemplateInput[Any]], PromptTemplateInput[Any]] | None
@@ -138,6 +157,11 @@ class PromptTemplate(Generic[T]):
     def input_schema(self) -> type[T]:
         return self._config.input_schema
 
+    @property
+    def compiled(self) -> CompiledTemplate:
+        """The tokenized template which is used for rendering."""
+        return compile_template(self._config.template)
+
 
 class PromptTemplateError(FrameworkError):
     """Represents an error related to prompt templates."""
@@ -152,4 +176,4 @@ class PromptTemplateError(FrameworkError):
         super().__init__(message, is_fatal=True, is_retryable=False, cause=cause, context=context)
 
 
-__all__ = ["PromptTemplate", "PromptTemplateError", "PromptTemplateInput"]
+__all__ = ["CompiledTemplate", "PromptTemplate", "PromptTemplateError", "PromptTemplateInput", "compile_template"]
@@ -2,7 +2,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from beeai_framework.tools.errors import ToolError, ToolInputValidationError
-from beeai_framework.tools.events import ToolErrorEvent, ToolRetryEvent, ToolStartEvent, ToolSuccessEvent
+from beeai_framework.tools.events import (
+    ToolCacheEvent,
+    ToolErrorEvent,
+    ToolRetryEvent,
+    ToolStartEvent,
+    ToolSuccessEvent,
+)
 from beeai_framework.tools.tool import (
     AnyTool,
     Tool,
@@ -15,6 +21,7 @@ __all__ = [
     "JSONToolOutput",
     "StringToolOutput",
     "Tool",
+    "ToolCacheEvent",
     "ToolError",
     "ToolErrorEvent",
     "ToolInputValidationError",
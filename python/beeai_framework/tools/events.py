@@ -6,6 +6,7 @@ from typing import Any
 
 from pydantic import BaseModel, InstanceOf, SerializeAsAny
 
+from beeai_framework.cache.types import CacheStats
 from beeai_framework.errors import FrameworkError
 from beeai_framework.tools.types import ToolOutput, ToolRunOptions
 
@@ -33,10 +34,17 @@ class ToolRetryEvent(BaseModel):
     options: ToolRunOptions | None = None
 
 
+class ToolCacheEvent(BaseModel):
+    hit: bool
+    key: str
+    stats: CacheStats
+
+
 tool_event_types: dict[str, type] = {
     "start": ToolStartEvent,
     "success": ToolSuccessEvent,
     "error": ToolErrorEvent,
     "retry": ToolRetryEvent,
+    "cache": ToolCacheEvent,
     "finish": NoneType,
 }
@@ -21,6 +21,7 @@ from beeai_framework.logger import Logger
 from beeai_framework.retryable import Retryable, RetryableConfig, RetryableContext, RetryableInput
 from beeai_framework.tools.errors import ToolError, ToolInputValidationError
 from beeai_framework.tools.events import (
+    ToolCacheEvent,
     ToolErrorEvent,
     ToolRetryEvent,
     ToolStartEvent,
@@ -121,17 +122,26 @@ class Tool(Generic[TInput, TRunOptions, TOutput], ABC):
                     error_propagated = False
                     await context.emitter.emit("start", ToolStartEvent(input=validated_input, options=options))
 
-                    if self.cache.enabled:
-                        cache_key = self._generate_key(input, options)
-                        result = await self.cache.get(cache_key)
-                        if result:
-                            return result
+                    if not self.cache.enabled:
+                        return await self._run(validated_input, options, context)
 
-                    result = await self._run(validated_input, options, context)
-                    if self.cache.enabled:
-                        await self.cache.set(cache_key, result)
+                    cache_key = self._generate_key(input, options)
+                    produced = False
 
-                    return result
+                    async def produce() -> TOutput:
+                        nonlocal produced
+                        produced = True
+                        await context.emitter.emit(
+                            "cache", ToolCacheEvent(hit=False, key=cache_key, stats=self.cache.stats)
+                        )
+                        return await self._run(validated_input, options, context)
+
+                    output = await self.cache.single_flight(cache_key, produce)
+                    if not produced:
+                        await context.emitter.emit(
+                            "cache", ToolCacheEvent(hit=True, key=cache_key, stats=self.cache.stats)
+                        )
+                    return output
 
                 async def on_error(error: Exception, _: RetryableContext) -> None:
                     nonlocal error_propagated
@@ -181,6 +191,7 @@ class Tool(Generic[TInput, TRunOptions, TOutput], ABC):
             handler,
             signal=options.signal if options else None,
             run_params={"input": input, "options": options},
+            lightweight=True,
         ).middleware(*self.middlewares)
 
     async def clone(self) -> Self:
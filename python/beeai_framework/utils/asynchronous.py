@@ -13,13 +13,20 @@ T = TypeVar("T")
 P = ParamSpec("P")
 
 
-def ensure_async(fn: Callable[P, T | Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+def ensure_async(fn: Callable[P, T | Awaitable[T]], *, offload: bool = True) -> Callable[P, Awaitable[T]]:
+    """Wraps the given function so that it can always be awaited.
+
+    Args:
+        fn: The function to wrap. Coroutine functions are returned unchanged.
+        offload: Whether a synchronous function is executed in a worker thread (default)
+            or directly on the running event loop.
+    """
     if asyncio.iscoroutinefunction(fn):
         return fn
 
     @functools.wraps(fn)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        result: T | Awaitable[T] = await asyncio.to_thread(fn, *args, **kwargs)
+        result: T | Awaitable[T] = await asyncio.to_thread(fn, *args, **kwargs) if offload else fn(*args, **kwargs)
         if inspect.isawaitable(result):
             return await result
         else:
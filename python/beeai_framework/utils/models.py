@@ -3,17 +3,22 @@
 
 import contextlib
 import copy
+import json
+import time
 from abc import ABC
+from collections import OrderedDict
 from collections.abc import Generator, Sequence
 from contextlib import suppress
+from hashlib import blake2b
 from logging import Logger
 from typing import Any, Generic, Literal, Optional, Self, TypeGuard, TypeVar, Union
 
 from pydantic import BaseModel, ConfigDict, Field, GetJsonSchemaHandler, RootModel, ValidationError, create_model
 from pydantic.fields import FieldInfo
 from pydantic.json_schema import JsonSchemaValue
-from pydantic_core import CoreSchema, SchemaValidator
+from pydantic_core import CoreSchema
 
+from beeai_framework.cache.types import CacheStats
 from beeai_framework.utils.dicts import remap_key
 from beeai_framework.utils.schema import simplify_json_schema
 
@@ -45,8 +50,7 @@ def to_model_optional(cls: type[T], obj: ModelLike[T] | None) -> T | None:
 
 
 def check_model(model: T) -> None:
-    schema_validator = SchemaValidator(schema=model.__pydantic_core_schema__)
-    schema_validator.validate_python(model.__dict__)
+    type(model).__pydantic_validator__.validate_python(model.__dict__)
 
 
 class JSONSchemaModel(ABC, BaseModel):
@@ -73,6 +77,21 @@ class JSONSchemaModel(ABC, BaseModel):
 
     @classmethod
     def create(cls, schema_name: str, schema: dict[str, Any]) -> type["JSONSchemaModel"]:
+        """Creates a model from the given JSON schema.
+
+        Models are cached process-wide (see `json_schema_model_cache`), so calling the method repeatedly
+        with an identical schema returns the same class.
+        """
+        # the key preserves the order of the keys, because it determines the order of the fields
+        key = blake2b(json.dumps([schema_name, schema], separators=(",", ":"), default=str).encode()).hexdigest()
+        model = json_schema_model_cache.get(cls, key)
+        if model is None:
+            model = cls._create(schema_name, schema)
+            json_schema_model_cache.set(cls, key, model)
+        return model
+
+    @classmethod
+    def _create(cls, schema_name: str, schema: dict[str, Any]) -> type["JSONSchemaModel"]:
         from beeai_framework.backend.utils import inline_schema_refs
 
         schema = inline_schema_refs(copy.deepcopy(schema))
@@ -186,6 +205,78 @@ class JSONSchemaModel(ABC, BaseModel):
         return model
 
 
+class JSONSchemaModelCache:
+    """Process-wide cache of the models generated by `JSONSchemaModel.create`.
+
+    The cache is content-addressed: the key is a hash of the schema (and the model name) serialized as is,
+    so identical schemas share the same model class. The key depends on the order of the dictionary keys,
+    because the order of the properties determines the order of the fields of the generated model
+    (and thus of its JSON schema and serialized output).
+    The least recently used models are dropped once the cache exceeds its size.
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        self._max_size = size
+        self._entries: OrderedDict[tuple[type[JSONSchemaModel], str], type[JSONSchemaModel]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lookup_time = 0.0
+
+    @property
+    def size(self) -> int:
+        """The number of cached models."""
+        return len(self._entries)
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def stats(self) -> CacheStats:
+        lookups = self._hits + self._misses
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            average_lookup_latency=self._lookup_time / lookups if lookups else 0,
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        return self.stats.hit_rate
+
+    def get(self, cls: type[JSONSchemaModel], key: str) -> type[JSONSchemaModel] | None:
+        started_at = time.perf_counter()
+        model = self._entries.get((cls, key))
+        if model is not None:
+            self._entries.move_to_end((cls, key))
+            self._hits += 1
+        else:
+            self._misses += 1
+        self._lookup_time += time.perf_counter() - started_at
+        return model
+
+    def set(self, cls: type[JSONSchemaModel], key: str, model: type[JSONSchemaModel]) -> None:
+        self._entries[(cls, key)] = model
+        self._entries.move_to_end((cls, key))
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lookup_time = 0.0
+
+
+json_schema_model_cache = JSONSchemaModelCache()
+
+
 def update_model(target: T, *, sources: list[T | None | bool], exclude_unset: bool = True) -> None:
     for source in sources:
         if not isinstance(source, BaseModel):
@@ -5,9 +5,8 @@ import traceback
 from pathlib import Path
 from typing import TypeVar
 
-from beeai_framework.cache import UnconstrainedCache
+from beeai_framework.cache import FileCache, UnconstrainedCache
 from beeai_framework.errors import FrameworkError
-from examples.cache.file_cache import JsonFileCache
 
 T = TypeVar("T")
 
@@ -25,18 +24,23 @@ async def main() -> None:
     await memory_cache.set("tasks:closed", 12)
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        path = Path(tmpdir) / "bee_cache.json"
+        path = Path(tmpdir) / "bee_cache.db"
 
-        file_cache = await JsonFileCache.from_mapping(path, await export_cache(memory_cache), size=10, ttl=10)
+        file_cache: FileCache[int] = FileCache(path, size=10, ttl=10)
+        for key, value in (await export_cache(memory_cache)).items():
+            await file_cache.set(key, value)
         print(f"Promoted cache to disk: {file_cache.source}")
 
         print(await file_cache.get("tasks:open"))  # 7
         await file_cache.set("tasks:stale", 1)
         print(await file_cache.size())  # 3
 
-        reloaded: JsonFileCache[int] = JsonFileCache(path, size=10, ttl=10)
+        reloaded: FileCache[int] = FileCache(path, size=10, ttl=10)
         print(await reloaded.get("tasks:closed"))  # 12
 
+        await file_cache.close()
+        await reloaded.close()
+
 
 if __name__ == "__main__":
     try:
@@ -26,7 +26,7 @@ class FilteringMemory(UnconstrainedMemory):
 
     async def add(self, message: AnyMessage, index: int | None = None) -> None:
         """Override add to filter user messages."""
-        index = len(self._messages) if index is None else max(0, min(index, len(self._messages)))
+        index = len(self.messages) if index is None else max(0, min(index, len(self.messages)))
         if isinstance(message, UserMessage) and message.text:
             original_text = message.text
             filtered_text = self._filter_text(original_text)
@@ -0,0 +1,76 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compares the legacy (str + sha512) and the canonical (JSON + BLAKE2b) cache key generation
+on the input that `ChatModel.run` hashes for a conversation with 1k messages.
+
+Usage: python scripts/benchmarks/cache_keys.py [--messages 1000] [--iterations 50]
+"""
+
+import argparse
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from hashlib import sha512
+from typing import Any
+
+from pydantic import BaseModel
+
+from beeai_framework.backend import AnyMessage, AssistantMessage, UserMessage
+from beeai_framework.backend.types import ChatModelInput
+from beeai_framework.cache import BaseCache
+
+
+def legacy_generate_key(*args: dict[str, Any] | BaseModel) -> str:
+    cache_key_dict: dict[str, Any] = {}
+    for arg in args:
+        arg_dict = arg if isinstance(arg, dict) else arg.model_dump(exclude_none=True)
+        cache_key_dict |= arg_dict
+
+    cache_key_dict = OrderedDict(sorted(cache_key_dict.items()))
+    cache_key_str = str(cache_key_dict).encode("utf-8", errors="ignore")
+    return str(int.from_bytes(sha512(cache_key_str).digest()))
+
+
+def legacy_chat_model_key(model_input: ChatModelInput) -> str:
+    return legacy_generate_key(model_input, {"messages": [m.to_plain() for m in model_input.messages]})
+
+
+def chat_model_key(model_input: ChatModelInput) -> str:
+    return BaseCache.generate_key(
+        model_input.model_dump(exclude_none=True, exclude={"messages"}),
+        {"messages": [m.to_plain() for m in model_input.messages]},
+    )
+
+
+def measure(fn: Callable[[ChatModelInput], str], model_input: ChatModelInput, *, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(model_input)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    messages: list[AnyMessage] = [
+        UserMessage(f"Question number {idx}: what is the weather like?")
+        if idx % 2 == 0
+        else AssistantMessage(f"Answer number {idx}: it is sunny, {'lorem ipsum ' * 20}")
+        for idx in range(args.messages)
+    ]
+    model_input = ChatModelInput(messages=messages)
+
+    legacy = measure(legacy_chat_model_key, model_input, iterations=args.iterations)
+    canonical = measure(chat_model_key, model_input, iterations=args.iterations)
+    print(f"{'implementation':>16} {'ms/key':>10}")
+    print(f"{'legacy':>16} {legacy:>10.2f}")
+    print(f"{'canonical':>16} {canonical:>10.2f}")
+    print(f"{'speedup':>16} {legacy / canonical:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
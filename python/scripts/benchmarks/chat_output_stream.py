@@ -0,0 +1,64 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compares folding streamed chunks via `ChatModelOutput.merge` (legacy) with `ChatModelOutput.from_chunks`
+(accumulator) for a text stream and for a tool call whose arguments are streamed token by token.
+
+Usage: python scripts/benchmarks/chat_output_stream.py [--tokens 10000]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from beeai_framework.backend import AssistantMessage, ChatModelOutput, MessageToolCallContent
+
+
+def legacy_from_chunks(chunks: list[ChatModelOutput]) -> ChatModelOutput:
+    final = ChatModelOutput(output=[])
+    for chunk in chunks:
+        final.merge(chunk)
+    return final
+
+
+def text_stream(tokens: int) -> list[ChatModelOutput]:
+    return [ChatModelOutput(output=[AssistantMessage(f"token{idx} ")]) for idx in range(tokens)]
+
+
+def tool_call_stream(tokens: int) -> list[ChatModelOutput]:
+    deltas = ['{"items": [', *(f'"item{idx}", ' for idx in range(tokens - 2)), '"last"]}']
+    return [
+        ChatModelOutput(
+            output=[
+                AssistantMessage(
+                    MessageToolCallContent(
+                        id="call_1" if idx == 0 else "", tool_name="tool" if idx == 0 else "", args=d
+                    )
+                )
+            ]
+        )
+        for idx, d in enumerate(deltas)
+    ]
+
+
+def measure(fn: Callable[[list[ChatModelOutput]], ChatModelOutput], chunks: list[ChatModelOutput]) -> float:
+    start = time.perf_counter()
+    fn(chunks)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'stream':>10} {'legacy ms':>12} {'accumulator ms':>16} {'speedup':>9}")
+    for name, factory in [("text", text_stream), ("tool call", tool_call_stream)]:
+        chunks = factory(args.tokens)
+        legacy = measure(legacy_from_chunks, chunks)
+        accumulator = measure(ChatModelOutput.from_chunks, chunks)
+        print(f"{name:>10} {legacy:>12.1f} {accumulator:>16.1f} {legacy / accumulator:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
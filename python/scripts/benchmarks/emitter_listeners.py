@@ -0,0 +1,51 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measures how many `new_token` events per second an emitter dispatches to synchronous listeners.
+
+Usage: python scripts/benchmarks/emitter_listeners.py [--tokens 2000]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from beeai_framework.emitter import Emitter, EmitterOptions, EventMeta
+
+
+async def measure(*, listeners: int, tokens: int, offload: bool) -> float:
+    root = Emitter(namespace=["agent"])
+    emitter = root.child(namespace=["chat"])
+    counter = 0
+
+    def on_token(_: Any, __: EventMeta) -> None:
+        nonlocal counter
+        counter += 1
+
+    for _ in range(listeners):
+        root.on("*.*", on_token, EmitterOptions(offload=offload))
+
+    start = time.perf_counter()
+    for idx in range(tokens):
+        await emitter.emit("new_token", idx)
+    elapsed = time.perf_counter() - start
+
+    assert counter == listeners * tokens
+    return tokens / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'listeners':>10} {'inline tokens/s':>18} {'offload tokens/s':>18} {'speedup':>8}")
+    for listeners in (1, 10, 100):
+        inline = await measure(listeners=listeners, tokens=args.tokens, offload=False)
+        offload = await measure(listeners=listeners, tokens=args.tokens, offload=True)
+        print(f"{listeners:>10} {inline:>18,.0f} {offload:>18,.0f} {inline / offload:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measures the throughput (tokens/sec) of `LinePrefixParser` fed token by token with a typical ReAct transcript
+(Thought / Function Name / Function Input / Function Output / Final Answer), as done by the ReAct `DefaultRunner`.
+
+Usage: python scripts/benchmarks/line_prefix_parser.py [--iterations 200] [--token-size 4] [--listeners]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from beeai_framework.emitter import EventMeta
+from beeai_framework.parsers.field import ParserField
+from beeai_framework.parsers.line_prefix import (
+    LinePrefixParser,
+    LinePrefixParserNode,
+    LinePrefixParserOptions,
+    LinePrefixParserUpdate,
+)
+from beeai_framework.utils.strings import create_strenum
+
+
+def create_parser() -> LinePrefixParser:
+    tool_names = create_strenum("ToolsEnum", ["OpenMeteo", "DuckDuckGo", "Wikipedia"])
+    return LinePrefixParser(
+        nodes={
+            "thought": LinePrefixParserNode(
+                prefix="Thought: ", field=ParserField.from_type(str), is_start=True, next=["tool_name", "final_answer"]
+            ),
+            "tool_name": LinePrefixParserNode(
+                prefix="Function Name: ", field=ParserField.from_type(tool_names, trim=True), next=["tool_input"]
+            ),
+            "tool_input": LinePrefixParserNode(
+                prefix="Function Input: ",
+                field=ParserField.from_type(dict, trim=True),
+                next=["tool_output"],
+                is_end=True,
+            ),
+            "tool_output": LinePrefixParserNode(
+                prefix="Function Output: ", field=ParserField.from_type(str), is_end=True, next=["final_answer"]
+            ),
+            "final_answer": LinePrefixParserNode(
+                prefix="Final Answer: ", field=ParserField.from_type(str), is_end=True, is_start=True
+            ),
+        },
+        options=LinePrefixParserOptions(wait_for_start_node=True, end_on_repeat=True),
+    )
+
+
+def create_transcript() -> str:
+    thought = " ".join(["The user wants to know the current weather in Prague, so I should call the weather tool."] * 4)
+    tool_input = json.dumps({"location_name": "Prague", "country": "Czechia", "temperature_unit": "celsius"})
+    final_answer = "\n".join(["The current temperature in Prague is 21°C with a light breeze."] * 3)
+    return (
+        f"Thought: {thought}\n"
+        f"Function Name: OpenMeteo\n"
+        f"Function Input: {tool_input}\n"
+        f"Function Output: \n"
+        f"Final Answer: {final_answer}"
+    )
+
+
+async def run(parser: LinePrefixParser, tokens: list[str], *, listeners: bool) -> dict[str, Any]:
+    if listeners:
+
+        def on_update(data: LinePrefixParserUpdate, _: EventMeta) -> None:
+            pass
+
+        parser.emitter.on("update", on_update)
+        parser.emitter.on("partial_update", on_update)
+
+    for token in tokens:
+        await parser.add(token)
+    return await parser.end()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--token-size", type=int, default=4)
+    parser.add_argument("--listeners", action="store_true")
+    args = parser.parse_args()
+
+    transcript = create_transcript()
+    tokens = [transcript[idx : idx + args.token_size] for idx in range(0, len(transcript), args.token_size)]
+
+    state = await run(create_parser(), tokens, listeners=args.listeners)
+    assert state["tool_name"] == "OpenMeteo"
+    assert state["tool_input"]["location_name"] == "Prague"
+
+    # The parsers are created upfront, only feeding the tokens is measured.
+    parsers = [create_parser() for _ in range(args.iterations)]
+    start = time.perf_counter()
+    for line_parser in parsers:
+        await run(line_parser, tokens, listeners=args.listeners)
+    elapsed = time.perf_counter() - start
+
+    total = len(tokens) * args.iterations
+    print(f"transcript: {len(transcript)} chars, {len(tokens)} tokens, {args.iterations} iterations")
+    print(f"elapsed: {elapsed * 1000:.1f} ms, throughput: {total / elapsed:,.0f} tokens/sec")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measures the bulk memory operations performed by the agents on long histories: adding a batch of temporary
+messages and deleting them again (`add_many` + `delete_many`), and deleting messages which are not stored at all.
+The legacy variant is the per-message fallback from `BaseMemory`.
+
+Usage: python scripts/benchmarks/memory_storage.py [--history 10000] [--batch 20] [--iterations 200]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Iterable, Sequence
+
+from beeai_framework.backend import AnyMessage, UserMessage
+from beeai_framework.memory import BaseMemory, UnconstrainedMemory
+
+
+class LegacyUnconstrainedMemory(BaseMemory):
+    def __init__(self) -> None:
+        self._messages: list[AnyMessage] = []
+
+    @property
+    def messages(self) -> list[AnyMessage]:
+        return self._messages
+
+    async def add(self, message: AnyMessage, index: int | None = None) -> None:
+        index = len(self._messages) if index is None else max(0, min(index, len(self._messages)))
+        self._messages.insert(index, message)
+
+    async def delete(self, message: AnyMessage) -> bool:
+        try:
+            self._messages.remove(message)
+            return True
+        except ValueError:
+            return False
+
+    def reset(self) -> None:
+        self._messages.clear()
+
+
+async def measure(memory: BaseMemory, batches: Iterable[Sequence[AnyMessage]], unknown: Sequence[AnyMessage]) -> float:
+    start = time.perf_counter()
+    for batch in batches:
+        await memory.add_many(batch)
+        await memory.delete_many(batch)
+        await memory.delete_many(unknown)
+    return time.perf_counter() - start
+
+
+async def run(args: argparse.Namespace) -> None:
+    history = [UserMessage(f"Message #{idx}") for idx in range(args.history)]
+    batches = [[UserMessage(f"Temporary #{idx}") for idx in range(args.batch)] for _ in range(args.iterations)]
+    unknown = [UserMessage("Unknown")] * args.batch
+
+    results: dict[str, float] = {}
+    for name, memory in [("legacy", LegacyUnconstrainedMemory()), ("indexed", UnconstrainedMemory())]:
+        await memory.add_many(history)
+        results[name] = await measure(memory, batches, unknown)
+        assert memory.messages == history
+
+    print(f"{'implementation':<16} {'total s':>9} {'per iteration us':>17}")
+    for name, total in results.items():
+        print(f"{name:<16} {total:>9.3f} {total / args.iterations * 1e6:>17.1f}")
+    print(f"speedup: {results['legacy'] / results['indexed']:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--history", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
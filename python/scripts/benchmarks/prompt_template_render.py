@@ -0,0 +1,101 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measures the render latency of the built-in agent system prompts: rendering from the raw template string
+(tokenized on every call, legacy) and from the compiled template (tokenized once).
+
+Usage: python scripts/benchmarks/prompt_template_render.py [--iterations 2000] [--tools 10]
+"""
+
+import argparse
+import time
+from typing import Any
+
+import chevron
+from pydantic import BaseModel
+
+from beeai_framework.agents.react.runners.default.prompts import (
+    SystemPromptTemplate,
+    SystemPromptTemplateInput,
+    ToolDefinition,
+)
+from beeai_framework.agents.requirement.prompts import (
+    RequirementAgentSystemPrompt,
+    RequirementAgentSystemPromptInput,
+    RequirementAgentToolTemplateDefinition,
+)
+from beeai_framework.agents.tool_calling.prompts import ToolCallingAgentSystemPrompt, ToolCallingAgentSystemPromptInput
+from beeai_framework.template import PromptTemplate
+
+
+def legacy_render(template: PromptTemplate[Any], template_input: BaseModel) -> str:
+    config = template._config
+    data = template_input.model_dump()
+    for key, value in config.defaults.items():
+        if data.get(key) is None:
+            data[key] = value
+    for key, fn in config.functions.items():
+        data[key] = fn(data)
+    return chevron.render(template=config.template, data=data)
+
+
+def measure(fn: Any, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--tools", type=int, default=10)
+    args = parser.parse_args()
+
+    schema = '{"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]}'
+    prompts: list[tuple[str, PromptTemplate[Any], BaseModel]] = [
+        (
+            "RequirementAgent",
+            RequirementAgentSystemPrompt,
+            RequirementAgentSystemPromptInput(
+                role="a helpful AI assistant",
+                instructions="Answer in English.",
+                final_answer_name="final_answer",
+                final_answer_schema=None,
+                final_answer_instructions=None,
+                tools=[
+                    RequirementAgentToolTemplateDefinition(
+                        name=f"tool_{idx}", description="Searches the web.", input_schema=schema, allowed="True"
+                    )
+                    for idx in range(args.tools)
+                ],
+            ),
+        ),
+        (
+            "ToolCallingAgent",
+            ToolCallingAgentSystemPrompt,
+            ToolCallingAgentSystemPromptInput(role="a helpful AI assistant", instructions="Answer in English."),
+        ),
+        (
+            "ReActAgent",
+            SystemPromptTemplate,
+            SystemPromptTemplateInput(
+                tools=[
+                    ToolDefinition(name=f"tool_{idx}", description="Searches the web.", input_schema=schema)
+                    for idx in range(args.tools)
+                ],
+                instructions="Answer in English.",
+            ),
+        ),
+    ]
+
+    print(f"{'prompt':<18} {'legacy us':>10} {'compiled us':>12} {'speedup':>9}")
+    for name, template, template_input in prompts:
+        assert template.render(template_input) == legacy_render(template, template_input)
+        legacy_us = measure(lambda t=template, i=template_input: legacy_render(t, i), args.iterations)
+        compiled_us = measure(lambda t=template, i=template_input: t.render(i), args.iterations)
+        print(f"{name:<18} {legacy_us:>10.1f} {compiled_us:>12.1f} {legacy_us / compiled_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measures the latency of nested `RunContext.enter` calls (Workflow -> Agent -> Tool -> ChatModel -> ...).
+
+Usage: python scripts/benchmarks/run_context_nesting.py [--iterations 200]
+"""
+
+import argparse
+import asyncio
+import time
+
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import Emitter
+
+
+class Instance:
+    def __init__(self, name: str) -> None:
+        self.emitter = Emitter.root().child(namespace=[name])
+
+
+async def nested(instances: list[Instance], *, lightweight: bool) -> int:
+    async def handler(context: RunContext) -> int:
+        if len(instances) == 1:
+            return 1
+        return 1 + await nested(instances[1:], lightweight=lightweight)
+
+    return await RunContext.enter(instances[0], handler, lightweight=lightweight)
+
+
+async def measure(depth: int, *, iterations: int, lightweight: bool) -> float:
+    instances = [Instance(f"level{idx}") for idx in range(depth)]
+    start = time.perf_counter()
+    for _ in range(iterations):
+        assert await nested(instances, lightweight=lightweight) == depth
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'depth':>6} {'default (µs)':>14} {'lightweight (µs)':>18} {'speedup':>8}")
+    for depth in (1, 2, 4, 8, 16):
+        default = await measure(depth, iterations=args.iterations, lightweight=False)
+        lightweight = await measure(depth, iterations=args.iterations, lightweight=True)
+        print(f"{depth:>6} {default:>14,.1f} {lightweight:>18,.1f} {default / lightweight:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compares the per-token parsing done by `StreamToolCallMiddleware` for streamed tool call arguments:
+re-parsing the whole buffer via `json_repair` (legacy) and feeding only the delta to `IncrementalJSONParser`.
+
+Usage: python scripts/benchmarks/stream_tool_call.py [--sizes 1000 2000 4000] [--token-size 4]
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from beeai_framework.backend.utils import parse_broken_json
+from beeai_framework.parsers.json_stream import IncrementalJSONParser
+
+
+def legacy(deltas: list[str]) -> Any:
+    buffer = ""
+    value = None
+    for delta in deltas:
+        buffer += delta
+        value = parse_broken_json(buffer, fallback={}, stream_stable=True)
+    return value
+
+
+def incremental(deltas: list[str]) -> Any:
+    parser = IncrementalJSONParser()
+    value = None
+    for delta in deltas:
+        parser.feed(delta)
+        value = parser.value
+    return value
+
+
+def measure(fn: Callable[[list[str]], Any], deltas: list[str]) -> tuple[float, Any]:
+    start = time.perf_counter()
+    value = fn(deltas)
+    return (time.perf_counter() - start) * 1000, value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 4000])
+    parser.add_argument("--token-size", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'bytes':>8} {'tokens':>8} {'legacy ms':>12} {'incremental ms':>16} {'speedup':>9}")
+    for size in args.sizes:
+        words = " ".join(f"word{idx}" for idx in range(size // 6))[:size]
+        arguments = json.dumps({"thoughts": words, "steps": [{"id": idx, "done": idx % 2 == 0} for idx in range(10)]})
+        deltas = [arguments[idx : idx + args.token_size] for idx in range(0, len(arguments), args.token_size)]
+
+        legacy_ms, legacy_value = measure(legacy, deltas)
+        incremental_ms, incremental_value = measure(incremental, deltas)
+        assert legacy_value == incremental_value
+        print(
+            f"{len(arguments):>8} {len(deltas):>8} {legacy_ms:>12.1f} {incremental_ms:>16.1f}"
+            f" {legacy_ms / incremental_ms:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
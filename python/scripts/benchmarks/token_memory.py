@@ -0,0 +1,88 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measures the time of adding messages to the TokenMemory (reading `tokens_used` after every add): the legacy
+implementation (token usage recomputed from all messages, sync rescanning the whole memory) and the current
+one (running totals).
+
+Usage: python scripts/benchmarks/token_memory.py [--messages 10000] [--sync-threshold 0.25]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from beeai_framework.backend import AnyMessage, AssistantMessage, UserMessage
+from beeai_framework.memory import TokenMemory
+from beeai_framework.memory.token_memory import simple_tokenize
+
+
+class LegacyTokenMemory(TokenMemory):
+    def __init__(self, *, sync_threshold: float) -> None:
+        super().__init__(sync_threshold=sync_threshold)
+        self._messages: list[AnyMessage] = []
+        self._legacy_tokens: dict[str, dict[str, Any]] = {}
+
+    @property
+    def messages(self) -> list[AnyMessage]:
+        return self._messages
+
+    @staticmethod
+    def _get_message_key(message: AnyMessage) -> str:
+        return f"{message.role}:{message.text}"
+
+    @property
+    def tokens_used(self) -> int:
+        return sum(info.get("tokens_count", 0) for info in self._legacy_tokens.values())
+
+    async def sync(self) -> None:
+        for msg in self._messages:
+            key = self._get_message_key(msg)
+            if self._legacy_tokens.get(key, {}).get("dirty", True):
+                self._legacy_tokens[key] = {"tokens_count": simple_tokenize([msg]), "dirty": False}
+
+    async def add(self, message: AnyMessage, index: int | None = None) -> None:
+        self._messages.insert(len(self._messages) if index is None else index, message)
+        self._legacy_tokens[self._get_message_key(message)] = {
+            "tokens_count": self._default_estimate(message),
+            "dirty": True,
+        }
+        dirty_count = sum(1 for info in self._legacy_tokens.values() if info.get("dirty", True))
+        if dirty_count / len(self._messages) >= self._sync_threshold:
+            await self.sync()
+
+
+async def measure(memory: TokenMemory, messages: list[AnyMessage]) -> tuple[float, int]:
+    start = time.perf_counter()
+    for message in messages:
+        await memory.add(message)
+        _ = memory.tokens_used
+    return time.perf_counter() - start, memory.tokens_used
+
+
+async def run(args: argparse.Namespace) -> None:
+    messages: list[AnyMessage] = [
+        (UserMessage if idx % 2 == 0 else AssistantMessage)(f"Message #{idx}: " + "lorem ipsum dolor sit amet " * 8)
+        for idx in range(args.messages)
+    ]
+
+    legacy_s, legacy_tokens = await measure(LegacyTokenMemory(sync_threshold=args.sync_threshold), messages)
+    current_s, current_tokens = await measure(TokenMemory(sync_threshold=args.sync_threshold), messages)
+
+    print(f"{'implementation':<16} {'total s':>9} {'per add us':>11} {'tokens':>9}")
+    print(f"{'legacy':<16} {legacy_s:>9.3f} {legacy_s / args.messages * 1e6:>11.1f} {legacy_tokens:>9}")
+    print(f"{'current':<16} {current_s:>9.3f} {current_s / args.messages * 1e6:>11.1f} {current_tokens:>9}")
+    print(f"speedup: {legacy_s / current_s:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--sync-threshold", type=float, default=0.25)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
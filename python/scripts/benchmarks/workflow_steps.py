@@ -0,0 +1,90 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measures a workflow with many small steps, where the per-step state validation (`check_model`) matters:
+compiling a new pydantic-core `SchemaValidator` for every step (legacy) and reusing the validator of the model.
+
+Usage: python scripts/benchmarks/workflow_steps.py [--steps 1000] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import functools
+import time
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+from pydantic import BaseModel
+from pydantic_core import SchemaValidator
+
+import beeai_framework.workflows.workflow as workflow_module
+from beeai_framework.utils.models import check_model
+from beeai_framework.workflows import Workflow
+
+
+class Document(BaseModel):
+    title: str
+    tags: list[str] = []
+
+
+class State(BaseModel):
+    counter: int = 0
+    limit: int
+    notes: list[str] = []
+    documents: list[Document] = []
+
+
+def legacy_check_model(model: BaseModel) -> None:
+    schema_validator = SchemaValidator(schema=model.__pydantic_core_schema__)
+    schema_validator.validate_python(model.__dict__)
+
+
+def create_workflow() -> Workflow[State]:
+    async def step(state: State) -> str:
+        state.counter += 1
+        return Workflow.SELF if state.counter < state.limit else Workflow.END
+
+    workflow = Workflow(State)
+    workflow.add_step("step", step)
+    return workflow
+
+
+async def measure(steps: int, check: Any) -> float:
+    workflow_module.check_model = check  # type: ignore[attr-defined]
+    state = State(limit=steps, documents=[Document(title="Intro", tags=["a", "b"])])
+    start = time.perf_counter()
+    response = await create_workflow().run(state)
+    elapsed = time.perf_counter() - start
+    assert response.state.counter == steps
+    return elapsed * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    state = State(limit=1, documents=[Document(title="Intro", tags=["a", "b"])])
+    check_calls = 10_000
+    print(f"pydantic-core {pydantic_core.__version__}")
+    checks: list[tuple[str, Callable[[BaseModel], None]]] = [("legacy", legacy_check_model), ("current", check_model)]
+    for name, check in checks:
+        duration = timeit.timeit(functools.partial(check, state), number=check_calls)
+        print(f"check_model {name}: {duration * 1e6 / check_calls:.2f} us")
+
+    # the variants are interleaved, so that both are equally affected by the warm-up and the interpreter state
+    await measure(args.steps, check_model)
+    legacy_runs, current_runs = [], []
+    for _ in range(args.rounds):
+        legacy_runs.append(await measure(args.steps, legacy_check_model))
+        current_runs.append(await measure(args.steps, check_model))
+    legacy_ms, current_ms = min(legacy_runs), min(current_runs)
+    print(f"{'steps':>6} {'legacy ms':>10} {'current ms':>10} {'speedup':>9}")
+    print(f"{args.steps:>6} {legacy_ms:>10.1f} {current_ms:>10.1f} {legacy_ms / current_ms:>8.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,12 +1,14 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 from functools import cached_property
+from typing import Any
 
 import pytest
 
+from beeai_framework.agents.requirement.prompts import RequirementAgentSystemPrompt
 from beeai_framework.agents.requirement.requirements.requirement import Rule, requirement
 from beeai_framework.agents.requirement.types import RequirementAgentRunState
-from beeai_framework.agents.requirement.utils._llm import RequirementsReasoner
+from beeai_framework.agents.requirement.utils._llm import RequirementsReasoner, _SystemMessageFactory
 from beeai_framework.agents.requirement.utils._tool import FinalAnswerTool
 from beeai_framework.context import RunContext
 from beeai_framework.emitter import Emitter
@@ -38,9 +40,7 @@ def hide_beta_requirement(state: RequirementAgentRunState, ctx: RunContext) -> l
     return [Rule(target="beta_tool", allowed=False, hidden=True)]
 
 
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_hidden_tool_does_not_disable_other_tools() -> None:
+def create_reasoner() -> tuple[RequirementsReasoner, RequirementAgentRunState]:
     state = RequirementAgentRunState(
         answer=None,
         result=None,
@@ -59,7 +59,13 @@ async def test_hidden_tool_does_not_disable_other_tools() -> None:
         final_answer=FinalAnswerTool(expected_output=None, state=state),
         context=RunContext(instance=RunContextInstance(), signal=None),
     )
+    return reasoner, state
 
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_hidden_tool_does_not_disable_other_tools() -> None:
+    reasoner, state = create_reasoner()
     await reasoner.update([allow_alpha_requirement, hide_beta_requirement])
     request = await reasoner.create_request(state, force_tool_call=False)
 
@@ -67,3 +73,44 @@ async def test_hidden_tool_does_not_disable_other_tools() -> None:
     assert beta_tool not in request.allowed_tools
     assert reasoner.final_answer in request.allowed_tools
     assert beta_tool in request.hidden_tools
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_system_message_is_reused_between_iterations(monkeypatch: pytest.MonkeyPatch) -> None:
+    reasoner, state = create_reasoner()
+    template = RequirementAgentSystemPrompt.fork(None)
+    renders: list[str] = []
+
+    def render(*args: Any, **kwargs: Any) -> str:
+        result = RequirementAgentSystemPrompt.render(*args, **kwargs)
+        renders.append(result)
+        return result
+
+    monkeypatch.setattr(template, "render", render)
+    factory = _SystemMessageFactory(template)
+
+    await reasoner.update([])
+    request = await reasoner.create_request(state, force_tool_call=False)
+    first = factory.create(request)
+    second = factory.create(await reasoner.create_request(state, force_tool_call=False))
+    assert first.text == second.text
+    assert len(renders) == 1
+
+    await reasoner.update([hide_beta_requirement])
+    third = factory.create(await reasoner.create_request(state, force_tool_call=False))
+    assert len(renders) == 2
+    assert "beta_tool" in first.text
+    assert "beta_tool" not in third.text
+
+
+@pytest.mark.unit
+def test_final_answer_tool_input_schema_is_stable() -> None:
+    _, state = create_reasoner()
+    tool = FinalAnswerTool(expected_output="A short poem.", state=state)
+    schema = tool.input_schema
+
+    assert tool.input_schema is schema
+    assert FinalAnswerTool(expected_output="A short poem.", state=state).input_schema is schema
+    assert FinalAnswerTool(expected_output="A long poem.", state=state).input_schema is not schema
+    assert schema.model_json_schema()["properties"]["response"]["description"] == "A short poem."
@@ -0,0 +1,76 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from beeai_framework.backend import AssistantMessage, ChatModelOutput, MessageToolCallContent
+from beeai_framework.backend.types import ChatModelUsage
+
+"""
+Utility functions and classes
+"""
+
+
+def fold(chunks: list[ChatModelOutput]) -> ChatModelOutput:
+    final = ChatModelOutput(output=[])
+    for chunk in chunks:
+        final.merge(chunk)
+    return final
+
+
+def tool_call_chunk(id: str, tool_name: str, args: str) -> ChatModelOutput:
+    return ChatModelOutput(output=[AssistantMessage(MessageToolCallContent(id=id, tool_name=tool_name, args=args))])
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+def test_from_chunks_text() -> None:
+    chunks = [ChatModelOutput(output=[AssistantMessage(token)]) for token in ["Hello", " ", "world", "!"]]
+    chunks[-1].finish_reason = "stop"
+    chunks[-1].usage = ChatModelUsage(prompt_tokens=5, completion_tokens=4, total_tokens=9)
+
+    output = ChatModelOutput.from_chunks(chunks)
+    expected = fold(chunks)
+
+    assert output.get_text_content() == "Hello world!"
+    assert [msg.to_plain() for msg in output.output] == [msg.to_plain() for msg in expected.output]
+    assert output.finish_reason == "stop"
+    assert output.usage == expected.usage
+
+
+@pytest.mark.unit
+def test_from_chunks_tool_calls() -> None:
+    chunks = [
+        ChatModelOutput(output=[AssistantMessage("Calling tools.")]),
+        tool_call_chunk("call_1", "weather", '{"city":'),
+        tool_call_chunk("", "", ' "Prague"}'),
+        tool_call_chunk("call_2", "search", '{"query"'),
+        tool_call_chunk("", "", ': "news"'),
+        tool_call_chunk("call_2", "", "}"),
+    ]
+
+    output = ChatModelOutput.from_chunks(chunks)
+    tool_calls = output.get_tool_calls()
+
+    assert [msg.to_plain() for msg in output.output] == [msg.to_plain() for msg in fold(chunks).output]
+    assert [(call.id, call.tool_name, call.args) for call in tool_calls] == [
+        ("call_1", "weather", '{"city": "Prague"}'),
+        ("call_2", "search", '{"query": "news"}'),
+    ]
+    assert all(call.is_valid() for call in tool_calls)
+
+
+@pytest.mark.unit
+def test_accumulator_does_not_mutate_chunks() -> None:
+    chunks = [tool_call_chunk("call_1", "weather", "{"), tool_call_chunk("", "", "}")]
+    accumulator = ChatModelOutput.accumulator()
+    for chunk in chunks:
+        accumulator.add(chunk)
+
+    assert accumulator.build().get_tool_calls()[0].args == "{}"
+    assert [chunk.get_tool_calls()[0].args for chunk in chunks] == ["{", "}"]
+    assert ChatModelOutput.from_chunks([]).output == []
@@ -49,3 +49,33 @@ def test_generate_tool_union_wrapped_schema(snapshot: SnapshotAssertion) -> None
         tools, strict=False, allow_parallel_tool_calls=True, allow_top_level_union=False
     )
     assert result["json_schema"] == snapshot()
+
+
+@pytest.mark.unit
+def test_generate_tool_union_schema_is_cached() -> None:
+    tools: list[AnyTool] = [tool_sum, tool_greet]
+    first, first_schema = generate_tool_union_schema(
+        tools, strict=True, allow_parallel_tool_calls=False, allow_top_level_union=True
+    )
+    second, second_schema = generate_tool_union_schema(
+        tools, strict=True, allow_parallel_tool_calls=False, allow_top_level_union=True
+    )
+    assert first_schema is second_schema
+    assert first == second
+    assert first is not second
+
+    _, non_strict_schema = generate_tool_union_schema(
+        tools, strict=False, allow_parallel_tool_calls=False, allow_top_level_union=True
+    )
+    assert non_strict_schema is not first_schema
+
+    @tool(name="tool_sum")
+    def changed_tool_sum(a: float, b: float = 0) -> float:
+        """Sum tool"""
+
+        return a + b
+
+    _, changed_schema = generate_tool_union_schema(
+        [changed_tool_sum, tool_greet], strict=True, allow_parallel_tool_calls=False, allow_top_level_union=True
+    )
+    assert changed_schema is not first_schema
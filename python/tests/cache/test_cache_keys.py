@@ -0,0 +1,54 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import BaseModel
+
+from beeai_framework.cache import BaseCache
+from beeai_framework.cache.utils import canonical_json
+
+
+class Payload(BaseModel):
+    query: str
+    limit: int | None = None
+
+
+@pytest.mark.unit
+def test_key_does_not_depend_on_order() -> None:
+    a = BaseCache.generate_key({"a": 1, "b": {"x": [1, 2], "y": {"q": "v", "p": None}}})
+    b = BaseCache.generate_key({"b": {"y": {"p": None, "q": "v"}, "x": [1, 2]}, "a": 1})
+    assert a == b
+
+
+@pytest.mark.unit
+def test_key_distinguishes_values() -> None:
+    assert BaseCache.generate_key({"a": [1, 2]}) != BaseCache.generate_key({"a": [2, 1]})
+    assert BaseCache.generate_key({"a": "1"}) != BaseCache.generate_key({"a": 1})
+    assert BaseCache.generate_key({"a": 1}, {"a": 2}) == BaseCache.generate_key({"a": 2})
+
+
+@pytest.mark.unit
+def test_key_for_models() -> None:
+    assert BaseCache.generate_key(Payload(query="hello")) == BaseCache.generate_key({"query": "hello"})
+    assert BaseCache.generate_key({"nested": Payload(query="hello")}) == BaseCache.generate_key(
+        {"nested": {"query": "hello"}}
+    )
+
+
+@pytest.mark.unit
+def test_canonical_json() -> None:
+    created_at = datetime(2025, 1, 1, tzinfo=UTC)
+    assert (
+        canonical_json({"b": {"c", "a", "b"}, "a": created_at}) == '{"a":"2025-01-01T00:00:00+00:00","b":["a","b","c"]}'
+    )
+
+
+@pytest.mark.unit
+def test_key_for_non_string_dict_keys() -> None:
+    assert BaseCache.generate_key({"a": {(1, 2): "x"}}) == BaseCache.generate_key({"a": {(1, 2): "x"}})
+    assert BaseCache.generate_key({"a": {(1, 2): "x"}}) != BaseCache.generate_key({"a": {(2, 1): "x"}})
+    assert BaseCache.generate_key({"a": {1: "x", "b": 2}}) == BaseCache.generate_key({"a": {"b": 2, 1: "x"}})
+    assert BaseCache.generate_key({"a": {1: "x", "b": 2}}) != BaseCache.generate_key({"a": {"1": "x", "b": 2}})
+    assert canonical_json({"a": [{(1, 2): Payload(query="q")}]}) == '{"a":[[["[1,2]",{"query":"q"}]]]}'
@@ -0,0 +1,137 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from beeai_framework.backend import AssistantMessage, ChatModel, ChatModelCacheEvent, ChatModelOutput, UserMessage
+from beeai_framework.backend.types import ChatModelInput
+from beeai_framework.cache import FileCache, SlidingCache, UnconstrainedCache
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import Emitter, EventMeta
+from beeai_framework.tools import StringToolOutput, Tool, ToolCacheEvent, ToolRunOptions
+
+
+class EchoChatModel(ChatModel):
+    model_id = "echo_model"
+    provider_id = "ollama"
+
+    async def _create(self, input: ChatModelInput, _: RunContext) -> ChatModelOutput:
+        return ChatModelOutput(output=[AssistantMessage(input.messages[-1].text)])
+
+    async def _create_stream(self, input: ChatModelInput, context: RunContext) -> Any:
+        yield await self._create(input, context)
+
+
+class EchoToolInput(BaseModel):
+    text: str
+
+
+class EchoTool(Tool[EchoToolInput, ToolRunOptions, StringToolOutput]):
+    name = "Echo"
+    description = "Returns the input."
+    input_schema = EchoToolInput
+
+    def _create_emitter(self) -> Emitter:
+        return Emitter.root().child(namespace=["tool", "echo"], creator=self)
+
+    async def _run(self, input: EchoToolInput, options: ToolRunOptions | None, context: RunContext) -> StringToolOutput:
+        return StringToolOutput(input.text)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_stats_lookups() -> None:
+    cache: UnconstrainedCache[str] = UnconstrainedCache()
+    await cache.set("key", "value")
+    await cache.get("key")
+    await cache.get("key")
+    await cache.get("missing")
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions) == (2, 1, 0)
+    assert stats.hit_rate == pytest.approx(2 / 3)
+    assert stats.average_lookup_latency > 0
+    assert stats.bytes is None
+
+    cache.reset_stats()
+    assert cache.stats.lookups == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_stats_evictions() -> None:
+    cache: SlidingCache[int] = SlidingCache(size=2)
+    for idx in range(5):
+        await cache.set(f"key{idx}", idx)
+    await cache.set("key4", 4)
+
+    assert cache.stats.evictions == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_stats_coalesced() -> None:
+    cache: UnconstrainedCache[str] = UnconstrainedCache()
+
+    async def compute() -> str:
+        await asyncio.sleep(0.01)
+        return "value"
+
+    await asyncio.gather(*(cache.single_flight("key", compute) for _ in range(4)))
+    assert (cache.stats.misses, cache.stats.coalesced) == (1, 3)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_file_cache_stats(tmp_path: Path) -> None:
+    cache: FileCache[bytes] = FileCache(tmp_path / "cache.db", size=2, serialize=bytes, deserialize=bytes)
+    for idx in range(3):
+        await cache.set(f"key{idx}", bytes(10))
+    await cache.get("key2")
+    await cache.get("key0")
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.bytes) == (1, 1, 1, 20)
+
+    await cache.clear()
+    assert cache.stats.bytes == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_cache_events() -> None:
+    model = EchoChatModel(cache=UnconstrainedCache())
+    events: list[ChatModelCacheEvent] = []
+
+    def on_cache(data: ChatModelCacheEvent, _: EventMeta) -> None:
+        events.append(data)
+
+    model.emitter.on("cache", on_cache)
+    await model.run([UserMessage("Hello")])
+    await model.run([UserMessage("Hello")])
+
+    assert [event.hit for event in events] == [False, True]
+    assert events[0].key == events[1].key
+    assert (events[-1].stats.hits, events[-1].stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tool_cache_events() -> None:
+    tool = EchoTool({"cache": UnconstrainedCache()})
+    events: list[ToolCacheEvent] = []
+
+    def on_cache(data: ToolCacheEvent, _: EventMeta) -> None:
+        events.append(data)
+
+    tool.emitter.on("cache", on_cache)
+    for text in ["a", "b", "a"]:
+        await tool.run({"text": text})
+
+    assert [event.hit for event in events] == [False, False, True]
+    assert tool.cache.stats.hit_rate == pytest.approx(1 / 3)
@@ -0,0 +1,82 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from beeai_framework.cache import CacheFn, SlidingCache, UnconstrainedCache, cached
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cached_with_bounded_cache() -> None:
+    calls: list[int] = []
+    cache: SlidingCache[int] = SlidingCache(size=2)
+
+    @cached(cache)
+    async def square(value: int) -> int:
+        calls.append(value)
+        return value * value
+
+    for value in [1, 2, 1, 3, 1, 2]:
+        await square(value)
+
+    assert calls == [1, 2, 3, 2]
+    assert await cache.size() == 2
+    assert cache.stats.evictions == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_fn_ttl() -> None:
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    fn = CacheFn.create(fetch, default_ttl=0.05)
+    assert isinstance(fn.cache, UnconstrainedCache)
+    assert await fn() == await fn() == 1
+
+    await asyncio.sleep(0.1)
+    assert await fn() == 2
+    assert await fn.size() == 1
+
+    fn.clear()
+    assert await fn() == 3
+    assert await fn.size() == 1
+
+    await fn.aclear()
+    assert await fn.size() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_fn_with_bounded_cache() -> None:
+    calls: list[str] = []
+
+    async def fetch(name: str) -> str:
+        calls.append(name)
+        return name.upper()
+
+    fn = CacheFn.create(fetch, cache=SlidingCache(size=2))
+    results = [await fn(name) for name in ["a", "b", "c", "a", "c"]]
+
+    assert results == ["A", "B", "C", "A", "C"]
+    assert calls == ["a", "b", "c", "a"]
+    assert await fn.size() == 2
+    assert (fn.stats.hits, fn.stats.misses, fn.stats.evictions) == (1, 4, 2)
+
+
+@pytest.mark.unit
+def test_cache_fn_clear_without_event_loop() -> None:
+    async def fetch() -> int:
+        return 1
+
+    fn = CacheFn.create(fetch)
+    asyncio.run(fn())
+    fn.clear()
+    assert asyncio.run(fn.size()) == 0
@@ -0,0 +1,158 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+
+from beeai_framework.backend import AssistantMessage, ChatModel, ChatModelOutput, UserMessage
+from beeai_framework.backend.types import ChatModelInput
+from beeai_framework.cache import FileCache
+from beeai_framework.context import RunContext
+
+
+class CountingChatModel(ChatModel):
+    model_id = "counting_model"
+    provider_id = "ollama"
+    calls = 0
+
+    async def _create(self, input: ChatModelInput, _: RunContext) -> ChatModelOutput:
+        self.calls += 1
+        return ChatModelOutput(output=[AssistantMessage(f"Answer #{self.calls}")])
+
+    async def _create_stream(self, input: ChatModelInput, context: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        yield await self._create(input, context)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_operations(tmp_path: Path) -> None:
+    cache: FileCache[str] = FileCache(tmp_path / "cache.db")
+    assert cache.enabled
+    assert await cache.size() == 0
+
+    await cache.set("key1", "value1")
+    await cache.set("key2", "value2")
+    await cache.set("key2", "value2b")
+
+    assert await cache.size() == 2
+    assert await cache.get("key2") == "value2b"
+    assert await cache.get("key3") is None
+    assert await cache.has("key1")
+    assert await cache.has("key3") is False
+
+    assert await cache.delete("key1") is True
+    assert await cache.delete("key1") is False
+    assert await cache.size() == 1
+
+    await cache.clear()
+    assert await cache.size() == 0
+    await cache.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_persistence(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "cache.db"
+    cache: FileCache[dict[str, int]] = FileCache(path)
+    await cache.set("key", {"value": 1})
+    await cache.close()
+
+    reopened: FileCache[dict[str, int]] = FileCache(path)
+    assert await reopened.get("key") == {"value": 1}
+
+    other_namespace: FileCache[dict[str, int]] = FileCache(path, namespace="other")
+    assert await other_namespace.get("key") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_size_eviction(tmp_path: Path) -> None:
+    cache: FileCache[str] = FileCache(tmp_path / "cache.db", size=2)
+    await cache.set("key1", "value1")
+    await cache.set("key2", "value2")
+    await asyncio.sleep(0.01)
+    assert await cache.get("key1") == "value1"  # refreshes key1
+
+    await cache.set("key3", "value3")
+    assert await cache.size() == 2
+    assert await cache.has("key2") is False
+    assert await cache.has("key1")
+    assert await cache.has("key3")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_bytes_eviction(tmp_path: Path) -> None:
+    cache: FileCache[bytes] = FileCache(tmp_path / "cache.db", max_bytes=250, serialize=bytes, deserialize=bytes)
+    for idx in range(5):
+        await cache.set(f"key{idx}", bytes(100))
+
+    assert await cache.size() == 2
+    assert await cache.has("key4")
+    assert await cache.has("key3")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize(("size", "max_bytes"), [(None, None), (3, None), (None, 250)])
+async def test_cache_tracks_bytes(tmp_path: Path, size: int | None, max_bytes: int | None) -> None:
+    cache: FileCache[bytes] = FileCache(
+        tmp_path / "cache.db", size=size, max_bytes=max_bytes, ttl=0.2, serialize=bytes, deserialize=bytes
+    )
+
+    async def assert_bytes() -> None:
+        expected = await asyncio.to_thread(cache._execute, cache._bytes_sync)
+        assert cache.stats.bytes == expected
+
+    await cache.set("expiring", bytes(30))
+    await asyncio.sleep(0.3)
+    for idx in range(5):
+        await cache.set(f"key{idx}", bytes(40 + idx * 10))
+        await assert_bytes()
+
+    await cache.set("key4", bytes(5))
+    await assert_bytes()
+    await cache.delete("key4")
+    await cache.delete("missing")
+    await assert_bytes()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_ttl(tmp_path: Path) -> None:
+    cache: FileCache[str] = FileCache(tmp_path / "cache.db", ttl=0.2)
+    await cache.set("key1", "value1")
+    assert await cache.get("key1") == "value1"
+
+    await asyncio.sleep(0.3)
+    assert await cache.get("key1") is None
+    assert await cache.size() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_shared_between_instances(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    writers: list[FileCache[int]] = [FileCache(path) for _ in range(4)]
+    await asyncio.gather(*(writer.set(f"key{idx}-{n}", n) for idx, writer in enumerate(writers) for n in range(25)))
+
+    assert await FileCache(path).size() == 100
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_with_chat_model(tmp_path: Path) -> None:
+    model = CountingChatModel(cache=FileCache(tmp_path / "cache.db"))
+    first = await model.run([UserMessage("Hello")])
+    second = await model.run([UserMessage("Hello")])
+
+    assert model.calls == 1
+    assert first.get_text_content() == second.get_text_content() == "Answer #1"
+
+    restarted = CountingChatModel(cache=FileCache(tmp_path / "cache.db"))
+    third = await restarted.run([UserMessage("Hello")])
+    assert restarted.calls == 0
+    assert third.get_text_content() == "Answer #1"
@@ -0,0 +1,172 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+
+import pytest
+
+from beeai_framework.backend import AssistantMessage, ChatModel, ChatModelNewTokenEvent, ChatModelOutput, UserMessage
+from beeai_framework.backend.types import ChatModelInput
+from beeai_framework.cache import NullCache, UnconstrainedCache
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import EventMeta
+
+
+class SlowChatModel(ChatModel):
+    model_id = "slow_model"
+    provider_id = "ollama"
+    calls = 0
+
+    async def _create(self, input: ChatModelInput, _: RunContext) -> ChatModelOutput:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return ChatModelOutput(output=[AssistantMessage(f"Answer #{self.calls}")])
+
+    async def _create_stream(self, input: ChatModelInput, context: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        self.calls += 1
+        for token in ["Hello", " ", "world"]:
+            await asyncio.sleep(0.01)
+            yield ChatModelOutput(output=[AssistantMessage(token)])
+
+
+class Counter:
+    def __init__(self, *, delay: float = 0.05, error: Exception | None = None) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.error = error
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return f"value #{self.calls}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_shares_result() -> None:
+    cache: UnconstrainedCache[str] = UnconstrainedCache()
+    fn = Counter()
+
+    results = await asyncio.gather(*(cache.single_flight("key", fn) for _ in range(10)))
+    assert results == ["value #1"] * 10
+    assert fn.calls == 1
+    assert await cache.get("key") == "value #1"
+
+    assert await cache.single_flight("key", fn) == "value #1"
+    assert fn.calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_propagates_errors() -> None:
+    cache: UnconstrainedCache[str] = UnconstrainedCache()
+    fn = Counter(error=ValueError("boom"))
+
+    results = await asyncio.gather(*(cache.single_flight("key", fn) for _ in range(5)), return_exceptions=True)
+    assert fn.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert await cache.has("key") is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_retries_when_leader_is_cancelled() -> None:
+    cache: UnconstrainedCache[str] = UnconstrainedCache()
+    fn = Counter()
+
+    leader = asyncio.create_task(cache.single_flight("key", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.single_flight("key", fn))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == "value #2"
+    assert fn.calls == 2
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_follower_cancellation_does_not_affect_leader() -> None:
+    cache: UnconstrainedCache[str] = UnconstrainedCache()
+    fn = Counter()
+
+    leader = asyncio.create_task(cache.single_flight("key", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.single_flight("key", fn))
+    await asyncio.sleep(0.01)
+    follower.cancel()
+
+    assert await leader == "value #1"
+    assert follower.cancelled()
+    assert fn.calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_single_flight_disabled_cache() -> None:
+    cache: NullCache[str] = NullCache()
+    fn = Counter()
+
+    await asyncio.gather(*(cache.single_flight("key", fn) for _ in range(3)))
+    assert fn.calls == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_deduplicates_concurrent_calls() -> None:
+    model = SlowChatModel(cache=UnconstrainedCache())
+    outputs = await asyncio.gather(*(model.run([UserMessage("Hello")]) for _ in range(5)))
+
+    assert model.calls == 1
+    assert {output.get_text_content() for output in outputs} == {"Answer #1"}
+    assert len({id(output) for output in outputs}) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_deduplicates_concurrent_streams() -> None:
+    model = SlowChatModel(cache=UnconstrainedCache())
+    tokens: list[list[str]] = [[], []]
+
+    def collect(target: list[str]) -> Callable[[ChatModelNewTokenEvent, EventMeta], None]:
+        def handler(data: ChatModelNewTokenEvent, _: EventMeta) -> None:
+            target.append(data.value.get_text_content())
+
+        return handler
+
+    outputs = await asyncio.gather(
+        *(model.run([UserMessage("Hello")], stream=True).on("new_token", collect(target)) for target in tokens)
+    )
+
+    assert model.calls == 1
+    assert tokens == [["Hello", " ", "world"]] * 2
+    assert [output.get_text_content() for output in outputs] == ["Hello world"] * 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_does_not_share_aborted_streams() -> None:
+    model = SlowChatModel(cache=UnconstrainedCache())
+
+    def abort_on_first_token(data: ChatModelNewTokenEvent, _: EventMeta) -> None:
+        data.abort()
+
+    async def run_aborted() -> ChatModelOutput:
+        return await model.run([UserMessage("Hello")], stream=True).on("new_token", abort_on_first_token)
+
+    leader = asyncio.create_task(run_aborted())
+    await asyncio.sleep(0.005)
+    completed = await model.run([UserMessage("Hello")], stream=True)
+    aborted = await leader
+
+    assert aborted.get_text_content() == "Hello"
+    assert completed.get_text_content() == "Hello world"
+    assert model.calls == 2
+
+    cached = await model.run([UserMessage("Hello")], stream=True)
+    assert cached.get_text_content() == "Hello world"
+    assert model.calls == 2
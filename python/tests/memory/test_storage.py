@@ -0,0 +1,113 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from beeai_framework.backend import AnyMessage, AssistantMessage, UserMessage
+from beeai_framework.memory import (
+    ResourceError,
+    SlidingMemory,
+    SlidingMemoryConfig,
+    TokenMemory,
+    UnconstrainedMemory,
+)
+from beeai_framework.memory._storage import MessageStorage
+
+
+def texts(messages: list[AnyMessage]) -> list[str]:
+    return [msg.text for msg in messages]
+
+
+@pytest.mark.unit
+def test_storage_bulk_operations() -> None:
+    a, b, c, d = (UserMessage(text) for text in "abcd")
+    storage = MessageStorage([a, b])
+    messages = storage.messages
+
+    storage.insert_many(1, [c, d])
+    assert texts(messages) == ["a", "c", "d", "b"]
+
+    assert storage.remove_many([d, a, UserMessage("x")]) == [a, d]
+    assert texts(messages) == ["c", "b"]
+    assert a not in storage
+    assert storage.remove(a) is False
+
+
+@pytest.mark.unit
+def test_storage_duplicates() -> None:
+    a, b = UserMessage("a"), UserMessage("b")
+    storage = MessageStorage([a, b, a])
+
+    assert storage.remove_many([a, a, a]) == [a, a]
+    assert texts(storage.messages) == ["b"]
+
+    storage.insert(0, b)
+    assert storage.remove_first(1) == [b]
+    assert b in storage
+    assert len(storage) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_delete_removes_first_occurrence() -> None:
+    a, b, c = UserMessage("a"), AssistantMessage("b"), UserMessage("c")
+    single, bulk = UnconstrainedMemory(), UnconstrainedMemory()
+    await single.add_many([a, b, a, c])
+    await bulk.add_many([a, b, a, c])
+
+    await single.delete(a)
+    await bulk.delete_many([c, a])
+    assert texts(single.messages) == ["b", "a", "c"]
+    assert texts(bulk.messages) == ["b", "a"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_unconstrained_memory_splice() -> None:
+    memory = UnconstrainedMemory()
+    await memory.add_many([UserMessage(text) for text in "abcde"])
+
+    deleted = await memory.splice(1, 2, UserMessage("x"), UserMessage("y"))
+    assert texts(deleted) == ["b", "c"]
+    assert texts(memory.messages) == ["a", "x", "y", "d", "e"]
+
+    await memory.delete_many(memory.messages[-2:])
+    assert texts(memory.messages) == ["a", "x", "y"]
+
+    cloned = await memory.clone()
+    await cloned.delete(cloned.messages[0])
+    assert (len(memory.messages), len(cloned.messages)) == (3, 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sliding_memory_eviction() -> None:
+    memory = SlidingMemory(SlidingMemoryConfig(size=3))
+    for text in "abcde":
+        await memory.add(UserMessage(text))
+    assert texts(memory.messages) == ["c", "d", "e"]
+
+    memory = SlidingMemory(
+        SlidingMemoryConfig(size=2, handlers={"removal_selector": lambda messages: [messages[0], messages[1]]})
+    )
+    for text in "abc":
+        await memory.add(AssistantMessage(text))
+    assert texts(memory.messages) == ["c"]
+
+    memory = SlidingMemory(SlidingMemoryConfig(size=1, handlers={"removal_selector": lambda _: UserMessage("x")}))
+    await memory.add(UserMessage("a"))
+    with pytest.raises(ResourceError):
+        await memory.add(UserMessage("b"))
+    assert texts(memory.messages) == ["a"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_token_memory_delete_many() -> None:
+    memory = TokenMemory(sync_threshold=0)
+    await memory.add_many([UserMessage("a" * 40), UserMessage("b" * 40), UserMessage("c" * 40)])
+    assert memory.tokens_used == 30
+
+    await memory.delete_many([memory.messages[0], memory.messages[2], UserMessage("x")])
+    assert texts(memory.messages) == ["b" * 40]
+    assert memory.tokens_used == 10
@@ -0,0 +1,137 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from beeai_framework.backend import AssistantMessage, ChatModel, ChatModelOutput, UserMessage
+from beeai_framework.backend.types import ChatModelInput
+from beeai_framework.context import RunContext
+from beeai_framework.memory import SummarizeMemory
+
+
+class CountingChatModel(ChatModel):
+    model_id = "counting_model"
+    provider_id = "ollama"
+
+    def __init__(self, *, delay: float = 0, fail: bool = False) -> None:
+        super().__init__()
+        self.delay = delay
+        self.fail = fail
+        self.prompts: list[str] = []
+
+    @property
+    def calls(self) -> int:
+        return len(self.prompts)
+
+    async def _create(self, input: ChatModelInput, _: RunContext) -> ChatModelOutput:
+        self.prompts.append(input.messages[-1].text)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ValueError("Summarization has failed.")
+        return ChatModelOutput(output=[AssistantMessage(f"summary #{self.calls}")])
+
+    async def _create_stream(self, input: ChatModelInput, context: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        yield await self._create(input, context)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_summarizes_every_message_by_default() -> None:
+    model = CountingChatModel()
+    memory = SummarizeMemory(model)
+
+    await memory.add(UserMessage("What is the capital of France?"))
+    await memory.add(AssistantMessage("Paris"))
+
+    assert model.calls == 2
+    assert [msg.text for msg in memory.messages] == ["summary #2"]
+    assert "summary #1" in model.prompts[1]
+    assert "What is the capital of France?" not in model.prompts[1]
+    assert "assistant: Paris" in model.prompts[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_summarizes_every_n_messages() -> None:
+    model = CountingChatModel()
+    memory = SummarizeMemory(model, summarize_every=3)
+
+    await memory.add_many([UserMessage("Hello"), AssistantMessage("Hi")])
+    assert model.calls == 0
+    assert [msg.text for msg in memory.messages] == ["Hello", "Hi"]
+
+    await memory.add(UserMessage("How are you?"))
+    assert model.calls == 1
+    assert [msg.text for msg in memory.messages] == ["summary #1"]
+
+    await memory.add(AssistantMessage("Fine"))
+    assert [msg.text for msg in memory.messages] == ["summary #1", "Fine"]
+    assert [msg.text for msg in memory.pending_messages] == ["Fine"]
+
+    await memory.sync()
+    assert model.calls == 2
+    assert memory.summary == "summary #2"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_summarizes_after_token_threshold() -> None:
+    model = CountingChatModel()
+    memory = SummarizeMemory(model, summarize_every=100, max_pending_tokens=10)
+
+    await memory.add(UserMessage("short"))
+    assert model.calls == 0
+
+    await memory.add(UserMessage("a considerably longer message"))
+    assert model.calls == 1
+    assert memory.pending_messages == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_summarizes_in_background() -> None:
+    model = CountingChatModel(delay=0.05)
+    memory = SummarizeMemory(model, summarize_every=2, background=True)
+
+    await memory.add_many([UserMessage("Hello"), AssistantMessage("Hi")])
+    assert [msg.text for msg in memory.messages] == ["Hello", "Hi"]
+
+    await asyncio.sleep(0.01)
+    await memory.add(UserMessage("How are you?"))
+    assert model.calls == 1
+
+    await memory.sync()
+    assert model.calls == 2
+    assert [msg.text for msg in memory.messages] == ["summary #2"]
+    assert "user: How are you?" in model.prompts[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_background_failure_keeps_messages() -> None:
+    model = CountingChatModel(fail=True)
+    memory = SummarizeMemory(model, background=True)
+
+    await memory.add(UserMessage("Hello"))
+    await asyncio.sleep(0.01)
+
+    assert model.calls == 1
+    assert [msg.text for msg in memory.messages] == ["Hello"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_reset_discards_running_summarization() -> None:
+    model = CountingChatModel(delay=0.05)
+    memory = SummarizeMemory(model, background=True)
+
+    await memory.add(UserMessage("Hello"))
+    await asyncio.sleep(0.01)
+    memory.reset()
+    await asyncio.sleep(0.1)
+
+    assert memory.is_empty()
+    assert memory.summary is None
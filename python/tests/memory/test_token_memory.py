@@ -0,0 +1,140 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from beeai_framework.backend import AnyMessage, AssistantMessage, SystemMessage, UserMessage
+from beeai_framework.memory import ResourceError, ResourceFatalError, TokenMemory
+
+
+def count_words_in_message(msg: AnyMessage) -> int:
+    return len(msg.text.split())
+
+
+def count_words(msgs: list[AnyMessage]) -> int:
+    return sum(map(count_words_in_message, msgs))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tracks_tokens_incrementally() -> None:
+    memory = TokenMemory(sync_threshold=0, handlers={"tokenize": count_words, "estimate": lambda _: 10})
+
+    await memory.add(UserMessage("one two three"))
+    assert memory.tokens_used == 3
+    assert not memory.is_dirty
+
+    await memory.add(AssistantMessage("four five"))
+    assert memory.tokens_used == 5
+
+    first = memory.messages[0]
+    assert await memory.delete(first)
+    assert memory.tokens_used == 2
+    assert await memory.delete(first) is False
+
+    memory.reset()
+    assert memory.tokens_used == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_estimates_until_sync() -> None:
+    memory = TokenMemory(sync_threshold=0.5, handlers={"tokenize": count_words, "estimate": lambda _: 10})
+
+    await memory.add(UserMessage("a b"))
+    assert (memory.tokens_used, memory.is_dirty) == (2, False)
+
+    await memory.add(UserMessage("c d e"))
+    assert (memory.tokens_used, memory.is_dirty) == (5, False)
+
+    await memory.add(UserMessage("f"))
+    assert (memory.tokens_used, memory.is_dirty) == (15, True)
+
+    await memory.add(UserMessage("g"))
+    assert (memory.tokens_used, memory.is_dirty) == (7, False)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_evicts_oldest_non_system_messages() -> None:
+    memory = TokenMemory(
+        max_tokens=6, sync_threshold=0, handlers={"tokenize": count_words, "estimate": count_words_in_message}
+    )
+    system = SystemMessage("be nice")
+    await memory.add(system)
+    for text in ["a b", "c d", "e f"]:
+        await memory.add(UserMessage(text))
+
+    assert [msg.text for msg in memory.messages] == ["be nice", "c d", "e f"]
+    assert memory.tokens_used == 6
+
+    await memory.add(UserMessage("g h i j"))
+    assert [msg.text for msg in memory.messages] == ["be nice", "g h i j"]
+    assert memory.messages[0] is system
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_evicts_after_sync() -> None:
+    memory = TokenMemory(max_tokens=4, sync_threshold=0, handlers={"tokenize": count_words, "estimate": lambda _: 1})
+    for text in ["a b", "c d", "e f"]:
+        await memory.add(UserMessage(text))
+
+    assert [msg.text for msg in memory.messages] == ["c d", "e f"]
+    assert memory.tokens_used == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rejects_oversized_message() -> None:
+    memory = TokenMemory(max_tokens=2, handlers={"tokenize": count_words, "estimate": count_words_in_message})
+    await memory.add(UserMessage("a"))
+
+    with pytest.raises(ResourceFatalError):
+        await memory.add(UserMessage("a b c"))
+    assert [msg.text for msg in memory.messages] == ["a"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_invalid_removal_selector() -> None:
+    memory = TokenMemory(
+        max_tokens=2,
+        handlers={
+            "tokenize": count_words,
+            "estimate": count_words_in_message,
+            "removal_selector": lambda _: UserMessage("x"),
+        },
+    )
+    await memory.add(UserMessage("a b"))
+
+    with pytest.raises(ResourceError):
+        await memory.add(UserMessage("c"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_same_message_added_twice() -> None:
+    memory = TokenMemory(sync_threshold=0, handlers={"tokenize": count_words})
+    message = UserMessage("a b")
+    await memory.add(message)
+    await memory.add(message)
+    assert memory.tokens_used == 4
+
+    await memory.delete(message)
+    assert memory.tokens_used == 2
+    await memory.delete(message)
+    assert (memory.tokens_used, memory.messages) == (0, [])
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_clone() -> None:
+    memory = TokenMemory(max_tokens=10, sync_threshold=0, handlers={"tokenize": count_words})
+    await memory.add(UserMessage("a b c"))
+
+    cloned = await memory.clone()
+    await cloned.add(UserMessage("d e"))
+
+    assert (memory.tokens_used, cloned.tokens_used) == (3, 5)
+    assert len(memory.messages) == 1
@@ -0,0 +1,79 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from pydantic import BaseModel
+
+from beeai_framework.backend import AssistantMessage, ChatModel, ChatModelOutput, MessageToolCallContent, UserMessage
+from beeai_framework.backend.types import ChatModelInput
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import EventMeta
+from beeai_framework.middleware.stream_tool_call import StreamToolCallMiddleware, StreamToolCallMiddlewareUpdateEvent
+from beeai_framework.tools import tool
+
+"""
+Utility functions and classes
+"""
+
+
+DELTAS = ['{"thou', 'ghts": "I ', "will check ", 'the \\"weather', '\\""}']
+
+
+class ThinkInput(BaseModel):
+    thoughts: str
+
+
+@tool(input_schema=ThinkInput)
+def think(thoughts: str) -> str:
+    """Records the thoughts."""
+    return thoughts
+
+
+class ToolCallStreamingModel(ChatModel):
+    model_id = "tool_call_streaming_model"
+    provider_id = "ollama"
+
+    async def _create(self, input: ChatModelInput, context: RunContext) -> ChatModelOutput:
+        return ChatModelOutput.from_chunks([chunk async for chunk in self._create_stream(input, context)])
+
+    async def _create_stream(self, input: ChatModelInput, context: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        for idx, delta in enumerate(DELTAS):
+            yield ChatModelOutput(
+                output=[
+                    AssistantMessage(
+                        MessageToolCallContent(
+                            id="call_1" if idx == 0 else "", tool_name=think.name if idx == 0 else "", args=delta
+                        )
+                    )
+                ]
+            )
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize("stream", [True, False])
+async def test_stream_tool_call_updates(stream: bool) -> None:
+    middleware = StreamToolCallMiddleware(think, key="thoughts")
+    updates: list[StreamToolCallMiddlewareUpdateEvent] = []
+
+    def on_update(data: StreamToolCallMiddlewareUpdateEvent, _: EventMeta) -> None:
+        updates.append(data)
+
+    middleware.emitter.on("update", on_update)
+    output = (
+        await ToolCallStreamingModel().run([UserMessage("Hello")], tools=[think], stream=stream).middleware(middleware)
+    )
+
+    expected = 'I will check the "weather"'
+    assert output.get_tool_calls()[0].args == '{"thoughts": "I will check the \\"weather\\""}'
+    assert "".join(update.delta for update in updates) == expected
+    assert updates[-1].output == expected
+    assert updates[-1].output_structured == ThinkInput(thoughts=expected)
+    assert len(updates) == (4 if stream else 1)
@@ -0,0 +1,57 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from beeai_framework.parsers.field import ParserField
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("incremental", [True, False])
+def test_json_field(incremental: bool) -> None:
+    field = ParserField.from_type(dict, trim=True)
+    field = ParserField(field.schema, as_json=True, incremental=incremental)
+    assert field.empty
+
+    for chunk in ['{"query": "wea', "ther in", ' Prague", "limit"', ": 5}"]:
+        field.write(chunk)
+
+    assert not field.empty
+    assert field.raw == '{"query": "weather in Prague", "limit": 5}'
+    assert field.get().model_dump() == {"query": "weather in Prague", "limit": 5}
+
+
+@pytest.mark.unit
+def test_json_field_partial() -> None:
+    field = ParserField.from_type(dict)
+    field.write('{"query": "wea')
+    assert field.get_partial() == '{"query": "wea'
+
+    field.write('ther", "limit": 5')
+    assert field.get_partial() == '{"query": "weather", "limit": 5'
+    assert field.get().model_dump() == {"query": "weather", "limit": 5}
+
+
+@pytest.mark.unit
+def test_json_field_falls_back_to_lenient_parsing() -> None:
+    field = ParserField.from_type(dict)
+    field.write("{'query': 'weather'}")
+    assert field.get().model_dump() == {"query": "weather"}
+
+    field.raw = '{"query": "news"}'
+    assert field.get().model_dump() == {"query": "news"}
+
+
+@pytest.mark.unit
+def test_text_field() -> None:
+    field = ParserField.from_type(str, default="default", trim=True)
+    assert field.get().model_dump() == "default"
+
+    field.write(" Hello")
+    field.write(" world ")
+    assert field.get_partial() == " Hello world "
+    assert field.get().model_dump() == "Hello world"
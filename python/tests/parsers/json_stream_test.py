@@ -0,0 +1,61 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+
+from beeai_framework.parsers.json_stream import IncrementalJSONParser
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [1, 3, 7])
+def test_parses_chunked_document(chunk_size: int) -> None:
+    document = {
+        "text": 'He said "hi"\né \U0001f600',
+        "numbers": [1, -2.5, 3e2],
+        "flags": [True, False, None],
+        "nested": {"empty": {}, "list": [[]]},
+    }
+    for text in [json.dumps(document), json.dumps(document, ensure_ascii=False, indent=2)]:
+        parser = IncrementalJSONParser()
+        for idx in range(0, len(text), chunk_size):
+            parser.feed(text[idx : idx + chunk_size])
+            assert isinstance(parser.value, dict)
+
+        assert parser.done
+        assert parser.value == document
+
+
+@pytest.mark.unit
+def test_partial_values() -> None:
+    parser = IncrementalJSONParser()
+    assert parser.value is None
+
+    parser.feed('```json\n{"thought": "I wi')
+    assert parser.value == {"thought": "I wi"}
+
+    parser.feed('ll check", "count": 1')
+    assert parser.value == {"thought": "I will check", "count": 1}
+
+    parser.feed('2, "pending')
+    assert parser.value == {"thought": "I will check", "count": 12}
+
+
+@pytest.mark.unit
+def test_reports_completed_values() -> None:
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"a": "x", "b": [1, ') == [(("a",), "x"), (("b", 0), 1)]
+    assert parser.feed("2]}") == [(("b", 1), 2), (("b",), [1, 2]), ((), {"a": "x", "b": [1, 2]})]
+    assert parser.done
+
+
+@pytest.mark.unit
+def test_invalid_json() -> None:
+    parser = IncrementalJSONParser()
+    parser.feed("{'a': 1}")
+    assert parser.failed
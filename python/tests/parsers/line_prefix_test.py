@@ -353,6 +353,37 @@ async def test_premature_ends_when_existing_node_visited() -> None:
     assert parser.final_state == expected
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_resolves_overlapping_prefixes() -> None:
+    config = {
+        "tool_input_schema": LinePrefixParserNode(
+            prefix="Tool Input Schema:", field=ParserField.from_type(str), is_start=True, next=["tool_input"]
+        ),
+        "tool_input": LinePrefixParserNode(
+            prefix="Tool Input:", field=ParserField.from_type(str), is_start=True, is_end=True, next=["tool"]
+        ),
+        "tool": LinePrefixParserNode(prefix="Tool:", field=ParserField.from_type(str), is_end=True),
+    }
+    parser = LinePrefixParser(config)
+    partial_keys: list[str] = []
+
+    def on_partial_update(data: LinePrefixParserUpdate, event: EventMeta) -> None:
+        partial_keys.append(data.key)
+
+    parser.emitter.on("partial_update", on_partial_update)
+    await parser.add("  tool input")
+    assert partial_keys == []
+    await parser.add(" schema: text\nTOOL INPUT: value\n")
+    await parser.add("Tool")
+    assert partial_keys == ["tool_input_schema", "tool_input"]
+    await parser.add(": done")
+    await parser.end()
+
+    assert parser.final_state == {"tool_input_schema": "text", "tool_input": "value", "tool": "done"}
+    assert partial_keys == ["tool_input_schema", "tool_input", "tool"]
+
+
 @pytest.mark.unit
 def test_throws_when_no_node_provided() -> None:
     with pytest.raises(ValueError):
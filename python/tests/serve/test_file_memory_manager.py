@@ -0,0 +1,136 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import pickle
+from pathlib import Path
+
+import pytest
+
+from beeai_framework.backend import AnyMessage, AssistantMessage, UserMessage
+from beeai_framework.memory import SlidingMemory, SlidingMemoryConfig, UnconstrainedMemory
+from beeai_framework.serve import FileMemoryManager
+
+
+def texts(messages: list[AnyMessage]) -> list[str]:
+    return [msg.text for msg in messages]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_persists_changes_across_instances(tmp_path: Path) -> None:
+    manager = FileMemoryManager(tmp_path / "sessions.db")
+    assert await manager.contains("session") is False
+    with pytest.raises(KeyError):
+        await manager.get("session")
+
+    initial = UnconstrainedMemory()
+    await initial.add(UserMessage("Hello"))
+    await manager.set("session", initial)
+
+    memory = await manager.get("session")
+    await memory.add(AssistantMessage("Hi"))
+    await memory.add_many([UserMessage("How are you?"), AssistantMessage("Fine")])
+    await memory.delete(memory.messages[1])
+    await manager.close()
+
+    restarted = FileMemoryManager(tmp_path / "sessions.db")
+    assert await restarted.contains("session")
+    assert texts((await restarted.get("session")).messages) == ["Hello", "How are you?", "Fine"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_persists_reset(tmp_path: Path) -> None:
+    manager = FileMemoryManager(tmp_path / "sessions.db")
+    await manager.set("session", UnconstrainedMemory())
+    memory = await manager.get("session")
+    await memory.add(UserMessage("Hello"))
+
+    memory.reset()
+    await asyncio.sleep(0.05)
+
+    restarted = FileMemoryManager(tmp_path / "sessions.db")
+    assert (await restarted.get("session")).messages == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_reset_and_add_many_appends_new_messages(tmp_path: Path) -> None:
+    serialized: list[str] = []
+
+    def serialize(message: AnyMessage) -> bytes:
+        serialized.append(message.text)
+        return pickle.dumps(message)
+
+    manager = FileMemoryManager(tmp_path / "sessions.db", serialize=serialize)
+    await manager.set("session", UnconstrainedMemory())
+    memory = await manager.get("session")
+    await memory.add_many([UserMessage("a"), AssistantMessage("b")])
+    history = memory.messages.copy()
+    serialized.clear()
+
+    # the way agents update their memory at the end of a run
+    memory.reset()
+    await memory.add_many([*history, UserMessage("c"), AssistantMessage("d")])
+    await asyncio.sleep(0.05)
+    assert serialized == ["c", "d"]
+    assert texts((await FileMemoryManager(tmp_path / "sessions.db").get("session")).messages) == ["a", "b", "c", "d"]
+
+    memory.reset()
+    await memory.add_many([history[1], UserMessage("e")])
+    await asyncio.sleep(0.05)
+    assert texts((await FileMemoryManager(tmp_path / "sessions.db").get("session")).messages) == ["b", "e"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_shares_sessions_between_managers(tmp_path: Path) -> None:
+    first = FileMemoryManager(tmp_path / "sessions.db")
+    second = FileMemoryManager(tmp_path / "sessions.db")
+    await first.set("session", UnconstrainedMemory())
+
+    await (await second.get("session")).add(UserMessage("from second"))
+    memory = await first.get("session")
+    assert texts(memory.messages) == ["from second"]
+
+    await memory.add(UserMessage("from first"))
+    assert texts((await second.get("session")).messages) == ["from second", "from first"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_session_limits(tmp_path: Path) -> None:
+    manager = FileMemoryManager(tmp_path / "sessions.db", ttl=0.1, max_messages=2)
+    await manager.set("session", UnconstrainedMemory())
+    memory = await manager.get("session")
+    for text in ["a", "b", "c"]:
+        await memory.add(UserMessage(text))
+    assert texts(memory.messages) == ["b", "c"]
+
+    await asyncio.sleep(0.15)
+    assert await manager.contains("session") is False
+    with pytest.raises(KeyError):
+        await manager.get("session")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_restores_sessions_with_memory_factory(tmp_path: Path) -> None:
+    manager = FileMemoryManager(tmp_path / "sessions.db")
+    memory = UnconstrainedMemory()
+    await memory.add_many([UserMessage(text) for text in "abc"])
+    await manager.set("session", memory)
+
+    restarted = FileMemoryManager(
+        tmp_path / "sessions.db", memory_factory=lambda: SlidingMemory(SlidingMemoryConfig(size=2))
+    )
+    restored = await restarted.get("session")
+    assert texts(restored.messages) == ["b", "c"]
+
+    await restored.add(UserMessage("d"))
+    assert texts((await FileMemoryManager(tmp_path / "sessions.db").get("session")).messages) == ["c", "d"]
+
+    cloned = await restored.clone()
+    await cloned.add(UserMessage("e"))
+    assert texts((await FileMemoryManager(tmp_path / "sessions.db").get("session")).messages) == ["c", "d"]
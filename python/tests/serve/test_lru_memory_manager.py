@@ -0,0 +1,120 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from beeai_framework.backend import AnyMessage, UserMessage
+from beeai_framework.memory import UnconstrainedMemory
+from beeai_framework.serve.utils import LRUMemoryManager, estimate_message_size
+
+
+def text_size(message: AnyMessage) -> int:
+    return len(message.text)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_evicts_least_recently_used_sessions() -> None:
+    manager = LRUMemoryManager(2)
+    for key in ["a", "b", "c"]:
+        await manager.set(key, UnconstrainedMemory())
+        if key == "b":
+            await manager.get("a")
+
+    assert [await manager.contains(key) for key in ["a", "b", "c"]] == [True, False, True]
+    with pytest.raises(KeyError):
+        await manager.get("b")
+    assert (manager.stats.hits, manager.stats.misses, manager.stats.evictions) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tracks_message_sizes() -> None:
+    manager = LRUMemoryManager(10, max_bytes=10, sizeof=text_size)
+    await manager.set("a", UnconstrainedMemory())
+    await manager.set("b", UnconstrainedMemory())
+
+    first = await manager.get("a")
+    await first.add(UserMessage("x" * 4))
+    second = await manager.get("b")
+    await second.add_many([UserMessage("y" * 3), UserMessage("z" * 2)])
+    assert manager.bytes == 9
+
+    await second.delete(second.messages[0])
+    assert manager.bytes == 6
+
+    await second.add(UserMessage("w" * 5))
+    assert (manager.size, manager.bytes) == (1, 7)
+    assert await manager.contains("a") is False
+    assert manager.stats.evictions == 1
+
+    second.reset()
+    assert manager.stats.bytes == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_session_size_limit() -> None:
+    manager = LRUMemoryManager(10, max_session_bytes=5, sizeof=text_size)
+    memory = UnconstrainedMemory()
+    await memory.add_many([UserMessage("aa"), UserMessage("bb"), UserMessage("cc")])
+    await manager.set("session", memory)
+
+    session = await manager.get("session")
+    assert [msg.text for msg in session.messages] == ["bb", "cc"]
+
+    await session.add(UserMessage("dddddd"))
+    assert [msg.text for msg in session.messages] == ["dddddd"]
+    assert manager.bytes == 6
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_idle_sessions_expire() -> None:
+    manager = LRUMemoryManager(10, ttl=0.05)
+    await manager.set("a", UnconstrainedMemory())
+    await manager.set("b", UnconstrainedMemory())
+
+    await asyncio.sleep(0.03)
+    await manager.get("b")
+    await asyncio.sleep(0.03)
+
+    assert await manager.contains("a") is False
+    assert await manager.contains("b") is True
+    assert manager.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_detaches_evicted_and_cloned_sessions() -> None:
+    manager = LRUMemoryManager(1, sizeof=text_size)
+    await manager.set("a", UnconstrainedMemory())
+    evicted = await manager.get("a")
+    cloned = await evicted.clone()
+    await manager.set("b", UnconstrainedMemory())
+
+    await evicted.add(UserMessage("abc"))
+    await cloned.add(UserMessage("abc"))
+    assert manager.bytes == 0
+    assert await manager.contains("b")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rejected_set_keeps_existing_session() -> None:
+    manager = LRUMemoryManager(2, getsizeof=lambda memory: len(memory.messages) + 1)
+    await manager.set("session", UnconstrainedMemory())
+
+    memory = UnconstrainedMemory()
+    await memory.add_many([UserMessage("a"), UserMessage("b")])
+    with pytest.raises(ValueError):
+        await manager.set("session", memory)
+    assert await manager.contains("session")
+
+
+@pytest.mark.unit
+def test_estimates_message_size_in_bytes() -> None:
+    assert estimate_message_size(UserMessage("čau")) == len(str(UserMessage("čau")).encode())
+    assert estimate_message_size(UserMessage("čau")) > estimate_message_size(UserMessage("cau"))
@@ -5,12 +5,19 @@ from datetime import datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
+import chevron
 import pytest
 from pydantic import BaseModel, ValidationError
 
+from beeai_framework.agents.requirement.prompts import (
+    RequirementAgentSystemPrompt,
+    RequirementAgentSystemPromptInput,
+    RequirementAgentToolTemplateDefinition,
+)
 from beeai_framework.template import (
     PromptTemplate,
     PromptTemplateError,
+    compile_template,
 )
 
 """
@@ -83,3 +90,43 @@ def test_render_function_clash(template: PromptTemplate[Any]) -> None:
 
     with pytest.raises(PromptTemplateError):
         template.render(TestPromptInputSchema(task="Here is a task!"))
+
+
+@pytest.mark.unit
+def test_compiled_template_is_shared() -> None:
+    class TestPromptInputSchema(BaseModel):
+        items: list[str]
+
+    text = "{{#items}}- {{.}}\n{{/items}}{{^items}}No items{{/items}}"
+    first = PromptTemplate(schema=TestPromptInputSchema, template=text)
+    second = PromptTemplate(schema=TestPromptInputSchema, template=text)
+
+    assert first.compiled is second.compiled is compile_template(text)
+    assert first.render(items=["a", "b"]) == "- a\n- b\n"
+    assert second.render(items=[]) == "No items"
+
+    first.update(template="{{#items}}{{.}};{{/items}}")
+    assert first.render(items=["a", "b"]) == "a;b;"
+    assert second.render(items=["a"]) == "- a\n"
+
+
+@pytest.mark.unit
+def test_compiled_template_matches_chevron() -> None:
+    template_input = RequirementAgentSystemPromptInput(
+        role="a helpful assistant",
+        instructions="Be <concise> & polite.",
+        final_answer_name="final_answer",
+        final_answer_schema=None,
+        final_answer_instructions=None,
+        tools=[
+            RequirementAgentToolTemplateDefinition(
+                name=name, description=f"Use {name}.", input_schema="{}", allowed=str(idx % 2 == 0)
+            )
+            for idx, name in enumerate(["search", "weather", "final_answer"])
+        ],
+    )
+    config = RequirementAgentSystemPrompt._config
+    data = template_input.model_dump()
+    data.update({key: fn(data) for key, fn in config.functions.items()})
+    expected = chevron.render(config.template, data)
+    assert RequirementAgentSystemPrompt.render(template_input) == expected
@@ -0,0 +1,140 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from beeai_framework.context import RunContext, RunQueueOverflow
+from beeai_framework.emitter import Emitter
+from beeai_framework.errors import AbortError
+from beeai_framework.utils import AbortController, AbortSignal
+
+
+class Instance:
+    def __init__(self) -> None:
+        self.emitter = Emitter(namespace=["instance"])
+
+
+async def emit_tokens(context: RunContext, count: int = 10) -> int:
+    for idx in range(count):
+        await context.emitter.emit("new_token", idx)
+    return count
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_without_iteration_does_not_buffer_events() -> None:
+    run = RunContext.enter(Instance(), emit_tokens)
+    assert await run == 10
+    assert run._events is None
+    assert run.queue_stats.high_water_mark == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_iteration_yields_all_events() -> None:
+    items = [data async for data, event in RunContext.enter(Instance(), emit_tokens) if event.name == "new_token"]
+    assert items == list(range(10))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_bounded_queue_blocks_producer() -> None:
+    run = RunContext.enter(Instance(), emit_tokens).buffer(2)
+
+    items = []
+    async for data, event in run:
+        for _ in range(10):
+            await asyncio.sleep(0)
+        if event.name == "new_token":
+            items.append(data)
+
+    assert items == list(range(10))
+    assert run.queue_stats.high_water_mark == 2
+    assert run.queue_stats.dropped == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("overflow", "expected"), [("drop_oldest", [0, 8, 9]), ("drop_newest", [0, 1, 2])])
+async def test_run_bounded_queue_drops_events(overflow: RunQueueOverflow, expected: list[int]) -> None:
+    finished = asyncio.Event()
+
+    async def handler(context: RunContext) -> int:
+        try:
+            return await emit_tokens(context)
+        finally:
+            finished.set()
+
+    run = RunContext.enter(Instance(), handler).buffer(2, overflow=overflow)
+
+    items = []
+    async for data, event in run:
+        await finished.wait()
+        if event.name == "new_token":
+            items.append(data)
+
+    assert items == expected
+    assert run.queue_stats.high_water_mark == 2
+    assert run.queue_stats.dropped == 7
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lightweight_run_shares_parent_controller() -> None:
+    async def child(context: RunContext) -> AbortSignal:
+        return context.signal
+
+    async def parent(context: RunContext) -> tuple[AbortSignal, AbortSignal]:
+        signal = await RunContext.enter(Instance(), child, lightweight=True)
+        return context.signal, signal
+
+    parent_signal, child_signal = await RunContext.enter(Instance(), parent)
+    assert parent_signal is child_signal
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lightweight_run_skips_lifecycle_events_without_listeners() -> None:
+    contexts: list[RunContext] = []
+
+    async def handler(context: RunContext) -> None:
+        contexts.append(context)
+
+    await RunContext.enter(Instance(), handler, lightweight=True)
+    [context] = contexts
+    assert context._emitter is None
+
+    instance, events = Instance(), []
+    instance.emitter.on("*.*", lambda _, event: events.append(event.name))
+    await RunContext.enter(instance, handler, lightweight=True)
+    assert events == ["start", "success", "finish"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lightweight_run_abort() -> None:
+    async def child(context: RunContext) -> None:
+        context.abort("stop")
+        await asyncio.sleep(10)
+
+    async def parent(context: RunContext) -> bool:
+        with pytest.raises(AbortError, match="stop"):
+            await RunContext.enter(Instance(), child, lightweight=True)
+        return context.signal.aborted
+
+    assert await RunContext.enter(Instance(), parent) is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_is_aborted_by_signal() -> None:
+    controller = AbortController()
+
+    async def handler(context: RunContext) -> None:
+        controller.abort("cancelled by user")
+        await asyncio.sleep(10)
+
+    with pytest.raises(AbortError, match="cancelled by user"):
+        await RunContext.enter(Instance(), handler, signal=controller.signal)
@@ -1,11 +1,12 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import threading
 from typing import Any
 
 import pytest
 
-from beeai_framework.emitter import EmitterOptions
+from beeai_framework.emitter import EmitterOptions, EventTrace
 from beeai_framework.emitter.emitter import Emitter, EventMeta
 from beeai_framework.emitter.errors import EmitterError
 
@@ -227,3 +228,98 @@ async def test_emitter_listener_priority() -> None:
     emitter.on("*.*", lambda _, __: arr.append(0))
     await emitter.emit("event", None)
     assert arr == [5, 4, 3, 2, 1, 0, -1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_emitter_priority_across_matchers() -> None:
+    emitter = Emitter(namespace=["app"])
+    arr = []
+    emitter.on("*.*", lambda _, __: arr.append("all"), EmitterOptions(priority=1))
+    emitter.on("app.event", lambda _, __: arr.append("path"), EmitterOptions(priority=3))
+    emitter.on("event", lambda _, __: arr.append("name"))
+    emitter.on("*", lambda _, __: arr.append("own"), EmitterOptions(priority=2))
+    emitter.on(lambda event: event.name == "event", lambda _, __: arr.append("fn"), EmitterOptions(priority=2))
+    emitter.on("other", lambda _, __: arr.append("other"), EmitterOptions(priority=5))
+    await emitter.emit("event", None)
+    assert arr == ["path", "own", "fn", "all", "name"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_emitter_once_and_cleanup() -> None:
+    emitter, calls = Emitter(), []
+    emitter.on("a", lambda data, __: calls.append(("once", data)), EmitterOptions(once=True))
+    cleanup = emitter.on("a", lambda data, __: calls.append(("always", data)))
+
+    await emitter.emit("a", 1)
+    await emitter.emit("a", 2)
+    cleanup()
+    await emitter.emit("a", 3)
+
+    assert calls == [("once", 1), ("always", 1), ("always", 2)]
+    assert emitter._listeners == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_emitter_namespace_extended_after_registration() -> None:
+    emitter, calls = Emitter(namespace=["agent"]), []
+    emitter.on("init", lambda data, __: calls.append(data))
+    emitter.namespace.append("requirement")
+
+    await emitter.emit("init", 1)
+    assert calls == [1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_emitter_listener_error_is_propagated() -> None:
+    emitter = Emitter()
+
+    def fail(_: Any, __: EventMeta) -> None:
+        raise ValueError("boom")
+
+    emitter.on("a", fail)
+    with pytest.raises(EmitterError) as excinfo:
+        await emitter.emit("a", None)
+    assert isinstance(excinfo.value.get_cause(), ValueError)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_emitter_sync_listener_execution_mode() -> None:
+    emitter = Emitter()
+    threads: dict[str, int] = {}
+    emitter.on("a", lambda _, __: threads.update(inline=threading.get_ident()))
+    emitter.on("a", lambda _, __: threads.update(offload=threading.get_ident()), EmitterOptions(offload=True))
+
+    await emitter.emit("a", None)
+    assert threads["inline"] == threading.get_ident()
+    assert threads["offload"] != threading.get_ident()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_event_meta_is_materialized_lazily() -> None:
+    emitter = Emitter(namespace=["app"], context={"key": "value"}, trace=EventTrace(id="1", run_id="2"))
+    events: list[EventMeta] = []
+    emitter.on("a", lambda _, event: events.append(event))
+
+    await emitter.emit("a", None)
+    trace = emitter.trace
+    emitter.context["key"] = "changed"
+    emitter.trace = EventTrace(id="3", run_id="4")
+    [event] = events
+
+    assert event._id is None
+    assert event.id == event.id
+    assert event.created_at.tzinfo is not None
+    assert event.context == {"key": "value"}
+    assert event.trace == trace
+    assert event.trace is not trace
+
+    dump = event.model_dump()
+    assert dump["id"] == event.id
+    assert dump["path"] == "app.a"
+    assert dump["context"] == {"key": "value"}
@@ -6,6 +6,7 @@ from typing import Any
 import pytest
 from pydantic import BaseModel
 
+from beeai_framework.context import RunContext
 from beeai_framework.emitter import Emitter, EventMeta
 from beeai_framework.tools import StringToolOutput, tool
 
@@ -45,3 +46,23 @@ async def test_tool_emitter() -> None:
     query = "Hello!"
     result: StringToolOutput = await test_tool.run({"query": query}).observe(observer)
     assert result.get_text_content() == query
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_nested_tool_run_is_lightweight() -> None:
+    @tool
+    def signal_id() -> str:
+        """Returns the identifier of the abort signal of the current run."""
+        return str(id(RunContext.get().signal))
+
+    async def parent(context: RunContext) -> tuple[str, str]:
+        output = await signal_id.run({})
+        return str(id(context.signal)), output.get_text_content()
+
+    parent_signal, tool_signal = await RunContext.enter(signal_id, parent)
+    assert parent_signal == tool_signal
+
+    events: list[str] = []
+    await signal_id.run({}).on("*.*", lambda _, event: events.append(event.path))
+    assert "run.tool.custom.signal_id.start" in events
@@ -1,6 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
 from types import NoneType
 from typing import Any, Literal, get_args
 
@@ -9,6 +10,7 @@ from pydantic import ValidationError
 from pydantic._internal._model_construction import ModelMetaclass
 
 from beeai_framework.utils import JSONSchemaModel
+from beeai_framework.utils.models import JSONSchemaModelCache, json_schema_model_cache
 from beeai_framework.utils.schema import simplify_json_schema
 
 """
@@ -408,3 +410,45 @@ def test_simplify_schema() -> None:
         "title": "list_application_needs",
         "type": "object",
     }
+
+
+@pytest.mark.unit
+def test_json_schema_model_cache(basic: dict[str, list[str] | str | Any]) -> None:
+    json_schema_model_cache.reset_stats()
+
+    model = JSONSchemaModel.create("basic", basic)
+    assert JSONSchemaModel.create("basic", copy.deepcopy(basic)) is model
+    assert JSONSchemaModel.create("other", basic) is not model
+    assert JSONSchemaModel.create("basic", {**basic, "required": []}) is not model
+
+    stats = json_schema_model_cache.stats
+    assert stats.hits >= 1
+    assert json_schema_model_cache.hit_rate == stats.hit_rate
+    assert json_schema_model_cache.size >= 3
+
+
+@pytest.mark.unit
+def test_json_schema_model_cache_preserves_property_order() -> None:
+    schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {"first": {"type": "string"}, "second": {"type": "integer"}},
+    }
+    reordered = {**schema, "properties": dict(reversed(schema["properties"].items()))}
+
+    model = JSONSchemaModel.create("ordered", schema)
+    reordered_model = JSONSchemaModel.create("ordered", reordered)
+    assert reordered_model is not model
+    assert list(model.model_fields) == ["first", "second"]
+    assert list(reordered_model.model_fields) == ["second", "first"]
+
+
+@pytest.mark.unit
+def test_json_schema_model_cache_eviction() -> None:
+    cache = JSONSchemaModelCache(size=2)
+    for idx in range(3):
+        cache.set(JSONSchemaModel, f"key{idx}", JSONSchemaModel)
+
+    assert cache.size == 2
+    assert cache.get(JSONSchemaModel, "key0") is None
+    assert cache.get(JSONSchemaModel, "key2") is JSONSchemaModel
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 1, 1)
@@ -0,0 +1,47 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import gc
+import weakref
+
+import pytest
+from pydantic import BaseModel, ValidationError, create_model
+
+from beeai_framework.utils.models import check_model
+
+
+class Item(BaseModel):
+    name: str
+    count: int = 0
+
+
+class DerivedItem(Item):
+    label: str = ""
+
+
+@pytest.mark.unit
+def test_check_model() -> None:
+    item = Item(name="a")
+    check_model(item)
+
+    item.count = "many"  # type: ignore[assignment]
+    with pytest.raises(ValidationError):
+        check_model(item)
+
+    derived = DerivedItem(name="b")
+    check_model(derived)
+    derived.label = 1  # type: ignore[assignment]
+    with pytest.raises(ValidationError):
+        check_model(derived)
+
+
+@pytest.mark.unit
+def test_check_model_does_not_retain_dynamic_models() -> None:
+    def create() -> weakref.ref[type[BaseModel]]:
+        model = create_model("DynamicItem", name=(str, ...))
+        check_model(model(name="a"))
+        return weakref.ref(model)
+
+    ref = create()
+    gc.collect()
+    assert ref() is None